@@ -8,7 +8,7 @@ import os
 import logging
 import json
 import requests
-from typing import List, Dict, Any, Union, Optional, Tuple
+from typing import List, Dict, Any, Union, Optional, Tuple, Iterator
 from datetime import datetime
 from abc import ABC, abstractmethod
 
@@ -19,6 +19,56 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+def _analysis_messages(market_data: Dict[str, Any]) -> List[Dict[str, str]]:
+    """
+    채팅 API용 시장 분석 요청 메시지를 생성합니다.
+    
+    Args:
+        market_data: 분석할 시장 데이터
+        
+    Returns:
+        시스템 메시지 및 사용자 메시지 목록
+    """
+    # 시장 데이터에서 요약 텍스트 추출
+    summary_text = market_data.get("summary_text", "")
+    
+    return [
+        {
+            "role": "system",
+            "content": "당신은 주식 시장 분석 전문가입니다. 제공된 시장 데이터를 분석하여 현재 시장 상황, 주요 지수 동향, 주목할 만한 섹터 및 주식에 대한 통찰력 있는 분석을 제공해주세요."
+        },
+        {
+            "role": "user",
+            "content": f"다음 시장 데이터를 분석해주세요:\n\n{summary_text}\n\n현재 시장 상황에 대한 종합적인 분석과 향후 전망을 제공해주세요."
+        }
+    ]
+
+
+def _iter_sse_deltas(response: requests.Response) -> Iterator[str]:
+    """
+    채팅 API 스트리밍 응답에서 텍스트 조각을 추출합니다.
+    
+    Args:
+        response: stream=True로 받은 HTTP 응답
+        
+    Returns:
+        응답 텍스트 조각 이터레이터
+    """
+    # 서버 전송 이벤트(SSE) 형식의 "data: ..." 줄에서 텍스트 조각 추출
+    for line in response.iter_lines(decode_unicode=True):
+        if not line or not line.startswith("data: "):
+            continue
+        
+        data = line[len("data: "):]
+        if data == "[DONE]":
+            break
+        
+        delta = json.loads(data)["choices"][0].get("delta", {}).get("content")
+        if delta:
+            yield delta
+
+
 class BaseAIProvider(ABC):
     """
     AI 제공자의 기본 추상 클래스
@@ -37,6 +87,20 @@ class BaseAIProvider(ABC):
         """
         pass
     
+    def analyze_market_stream(self, market_data: Dict[str, Any]) -> Iterator[str]:
+        """
+        시장 데이터를 분석하고 분석 텍스트를 생성되는 대로 조각 단위로 반환합니다.
+        
+        스트리밍을 지원하지 않는 제공자는 전체 분석 결과를 한 번에 반환합니다.
+        
+        Args:
+            market_data: 분석할 시장 데이터
+            
+        Returns:
+            분석 텍스트 조각 이터레이터
+        """
+        yield self.analyze_market(market_data)["analysis"]
+    
     @abstractmethod
     def recommend_stocks(self, market_data: Dict[str, Any], count: int = 5) -> Dict[str, Any]:
         """
@@ -120,6 +184,40 @@ class OpenAIProvider(BaseAIProvider):
             logger.error(f"OpenAI API 호출 중 오류 발생: {str(e)}")
             raise
     
+    def _stream_api(self, messages: List[Dict[str, str]], temperature: float = 0.3, max_tokens: int = 1000) -> Iterator[str]:
+        """
+        OpenAI API를 스트리밍 모드로 호출합니다.
+        
+        Args:
+            messages: 메시지 목록
+            temperature: 온도 (창의성 조절)
+            max_tokens: 최대 토큰 수
+            
+        Returns:
+            API 응답 텍스트 조각 이터레이터
+        """
+        try:
+            headers = {
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {self.api_key}"
+            }
+            
+            payload = {
+                "model": self.model_name,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "stream": True
+            }
+            
+            with requests.post(self.api_url, headers=headers, json=payload, stream=True) as response:
+                response.raise_for_status()
+                yield from _iter_sse_deltas(response)
+        
+        except Exception as e:
+            logger.error(f"OpenAI API 스트리밍 호출 중 오류 발생: {str(e)}")
+            raise
+    
     def analyze_market(self, market_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         시장 데이터를 분석합니다.
@@ -131,23 +229,8 @@ class OpenAIProvider(BaseAIProvider):
             분석 결과
         """
         try:
-            # 시장 데이터에서 요약 텍스트 추출
-            summary_text = market_data.get("summary_text", "")
-            
-            # 시스템 메시지 및 사용자 메시지 생성
-            messages = [
-                {
-                    "role": "system",
-                    "content": "당신은 주식 시장 분석 전문가입니다. 제공된 시장 데이터를 분석하여 현재 시장 상황, 주요 지수 동향, 주목할 만한 섹터 및 주식에 대한 통찰력 있는 분석을 제공해주세요."
-                },
-                {
-                    "role": "user",
-                    "content": f"다음 시장 데이터를 분석해주세요:\n\n{summary_text}\n\n현재 시장 상황에 대한 종합적인 분석과 향후 전망을 제공해주세요."
-                }
-            ]
-            
             # API 호출
-            analysis = self._call_api(messages)
+            analysis = self._call_api(_analysis_messages(market_data))
             
             return {
                 "analysis": analysis,
@@ -160,6 +243,19 @@ class OpenAIProvider(BaseAIProvider):
             logger.error(f"시장 분석 중 오류 발생: {str(e)}")
             raise
     
+    def analyze_market_stream(self, market_data: Dict[str, Any]) -> Iterator[str]:
+        """
+        시장 데이터를 분석하고 분석 텍스트를 생성되는 대로 조각 단위로 반환합니다.
+        
+        Args:
+            market_data: 분석할 시장 데이터
+            
+        Returns:
+            분석 텍스트 조각 이터레이터
+        """
+        # API 스트리밍 호출
+        yield from self._stream_api(_analysis_messages(market_data))
+    
     def recommend_stocks(self, market_data: Dict[str, Any], count: int = 5) -> Dict[str, Any]:
         """
         투자할 주식을 추천합니다.
@@ -325,6 +421,40 @@ class MistralProvider(BaseAIProvider):
             logger.error(f"Mistral API 호출 중 오류 발생: {str(e)}")
             raise
     
+    def _stream_api(self, messages: List[Dict[str, str]], temperature: float = 0.3, max_tokens: int = 1000) -> Iterator[str]:
+        """
+        Mistral API를 스트리밍 모드로 호출합니다.
+        
+        Args:
+            messages: 메시지 목록
+            temperature: 온도 (창의성 조절)
+            max_tokens: 최대 토큰 수
+            
+        Returns:
+            API 응답 텍스트 조각 이터레이터
+        """
+        try:
+            headers = {
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {self.api_key}"
+            }
+            
+            payload = {
+                "model": self.model_name,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "stream": True
+            }
+            
+            with requests.post(self.api_url, headers=headers, json=payload, stream=True) as response:
+                response.raise_for_status()
+                yield from _iter_sse_deltas(response)
+        
+        except Exception as e:
+            logger.error(f"Mistral API 스트리밍 호출 중 오류 발생: {str(e)}")
+            raise
+    
     def analyze_market(self, market_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         시장 데이터를 분석합니다.
@@ -336,23 +466,8 @@ class MistralProvider(BaseAIProvider):
             분석 결과
         """
         try:
-            # 시장 데이터에서 요약 텍스트 추출
-            summary_text = market_data.get("summary_text", "")
-            
-            # 시스템 메시지 및 사용자 메시지 생성
-            messages = [
-                {
-                    "role": "system",
-                    "content": "당신은 주식 시장 분석 전문가입니다. 제공된 시장 데이터를 분석하여 현재 시장 상황, 주요 지수 동향, 주목할 만한 섹터 및 주식에 대한 통찰력 있는 분석을 제공해주세요."
-                },
-                {
-                    "role": "user",
-                    "content": f"다음 시장 데이터를 분석해주세요:\n\n{summary_text}\n\n현재 시장 상황에 대한 종합적인 분석과 향후 전망을 제공해주세요."
-                }
-            ]
-            
             # API 호출
-            analysis = self._call_api(messages)
+            analysis = self._call_api(_analysis_messages(market_data))
             
             return {
                 "analysis": analysis,
@@ -365,6 +480,19 @@ class MistralProvider(BaseAIProvider):
             logger.error(f"시장 분석 중 오류 발생: {str(e)}")
             raise
     
+    def analyze_market_stream(self, market_data: Dict[str, Any]) -> Iterator[str]:
+        """
+        시장 데이터를 분석하고 분석 텍스트를 생성되는 대로 조각 단위로 반환합니다.
+        
+        Args:
+            market_data: 분석할 시장 데이터
+            
+        Returns:
+            분석 텍스트 조각 이터레이터
+        """
+        # API 스트리밍 호출
+        yield from self._stream_api(_analysis_messages(market_data))
+    
     def recommend_stocks(self, market_data: Dict[str, Any], count: int = 5) -> Dict[str, Any]:
         """
         투자할 주식을 추천합니다.
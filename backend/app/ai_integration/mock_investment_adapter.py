@@ -6,7 +6,7 @@
 import os
 import logging
 import json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from datetime import datetime, timedelta
 import uuid
 
@@ -38,32 +38,38 @@ class MockInvestmentManager:
         
         logger.info("모의 투자 관리자 어댑터가 초기화되었습니다.")
     
-    def record_investment_decision(self, decision: Dict[str, Any]) -> bool:
+    def record_investment_decision(self, decision: Union[Dict[str, Any], List[Dict[str, Any]]]) -> bool:
         """
         투자 결정을 기록합니다.
         
+        여러 투자 결정을 목록으로 전달하면 Neo4j에 한 번의 쿼리로 저장합니다.
+        
         Args:
-            decision: 투자 결정
+            decision: 투자 결정 또는 투자 결정 목록
             
         Returns:
             기록 성공 여부
         """
         try:
-            # 투자 결정 ID 생성
-            decision_id = str(uuid.uuid4())
+            decisions = decision if isinstance(decision, list) else [decision]
             
-            # 타임스탬프 확인
-            if "timestamp" not in decision:
-                decision["timestamp"] = datetime.now().isoformat()
+            for item in decisions:
+                # 투자 결정 ID 생성
+                item.setdefault("id", str(uuid.uuid4()))
+                
+                # 타임스탬프 확인
+                if "timestamp" not in item:
+                    item["timestamp"] = datetime.now().isoformat()
             
-            # Neo4j에 투자 결정 저장
-            self.neo4j_repo.save_investment_decision(decision_id, decision)
+            # Neo4j에 투자 결정 일괄 저장
+            saved = self.neo4j_repo.save_investment_decisions(decisions)
             
             # 로컬 파일에도 저장
-            self._save_to_file(decision)
+            for item in decisions:
+                self._save_to_file(item)
             
-            logger.info(f"투자 결정이 기록되었습니다: {decision_id}")
-            return True
+            logger.info(f"투자 결정이 기록되었습니다: {saved}/{len(decisions)}개")
+            return saved == len(decisions)
         
         except Exception as e:
             logger.error(f"투자 결정 기록 중 오류 발생: {str(e)}")
@@ -89,7 +95,7 @@ class MockInvestmentManager:
                 start_date = (datetime.strptime(end_date, "%Y-%m-%d") - timedelta(days=30)).strftime("%Y-%m-%d")
             
             # Neo4j에서 투자 결정 조회
-            decisions = self.neo4j_repo.get_investment_decisions(start_date, end_date)
+            decisions = self.neo4j_repo.get_investment_decisions(limit=None, start_date=start_date, end_date=end_date)
             
             return decisions
         
@@ -124,7 +130,7 @@ class MockInvestmentManager:
         try:
             # 파일 경로 생성
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            file_path = os.path.join(self.data_dir, f"decision_{timestamp}.json")
+            file_path = os.path.join(self.data_dir, f"decision_{timestamp}_{decision['id'][:8]}.json")
             
             # 투자 결정 저장
             with open(file_path, "w") as f:
@@ -179,8 +185,8 @@ class PerformanceTracker:
                 else:
                     start_date = (datetime.strptime(end_date, "%Y-%m-%d") - timedelta(days=30)).strftime("%Y-%m-%d")
             
-            # Neo4j에서 투자 결정 조회
-            decisions = self.neo4j_repo.get_investment_decisions(start_date, end_date)
+            # Neo4j에서 기간 내 투자 결정과 종목별 투자 금액을 한 번에 조회
+            decisions = self.neo4j_repo.get_investment_decisions(limit=None, start_date=start_date, end_date=end_date)
             
             # 투자 성과 계산
             performance = self._calculate_performance(decisions, start_date, end_date)
@@ -240,7 +246,8 @@ class PerformanceTracker:
                 # 투자 금액 합계
                 investments = decision.get("investments", [])
                 for investment in investments:
-                    total_investments += investment.get("amount", 0)
+                    # 금액이 없는 관계는 null로 조회되므로 0으로 처리
+                    total_investments += investment.get("amount") or 0
                 
                 # 현금 보유액
                 total_cash_reserve += decision.get("cash_reserve", 0)
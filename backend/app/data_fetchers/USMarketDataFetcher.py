@@ -4,7 +4,7 @@
 이 모듈은 기존 USStockMarketFetcher 클래스를 main.py에서 사용하는 인터페이스로 변환합니다.
 """
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 
 from .us_market import USStockMarketFetcher
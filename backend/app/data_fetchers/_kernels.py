@@ -0,0 +1,120 @@
+"""
+기술적 지표 계산 커널 모듈
+
+이 모듈은 종가 배열에 대한 이동평균, 이동 표준편차, 지수이동평균, RSI 계산 함수를 제공합니다.
+numba가 설치되어 있으면 1차원 float64 배열에 대한 컴파일된 루프로 계산하고,
+없으면 pandas의 rolling/ewm으로 같은 결과를 계산합니다.
+"""
+import logging
+import numpy as np
+import pandas as pd
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+
+    # NaN 구간을 pandas와 동일하게 처리해야 하므로 fastmath는 사용하지 않음
+    @njit(cache=True, error_model='numpy')
+    def _sma(x, window):
+        n = x.shape[0]
+        out = np.full(n, np.nan)
+        total = 0.0
+        count = 0
+        for i in range(n):
+            v = x[i]
+            if v == v:
+                total += v
+                count += 1
+            if i >= window:
+                old = x[i - window]
+                if old == old:
+                    total -= old
+                    count -= 1
+            if count >= window:
+                out[i] = total / window
+        return out
+
+    @njit(cache=True, error_model='numpy')
+    def _rolling_std(x, window):
+        n = x.shape[0]
+        out = np.full(n, np.nan)
+        for i in range(window - 1, n):
+            total = 0.0
+            valid = True
+            for j in range(i - window + 1, i + 1):
+                v = x[j]
+                if v != v:
+                    valid = False
+                    break
+                total += v
+            if not valid:
+                continue
+            mean = total / window
+            ss = 0.0
+            for j in range(i - window + 1, i + 1):
+                d = x[j] - mean
+                ss += d * d
+            out[i] = np.sqrt(ss / (window - 1))
+        return out
+
+    @njit(cache=True, error_model='numpy')
+    def _ema(x, alpha):
+        # pandas ewm(adjust=False, ignore_na=False).mean()과 같은 재귀식
+        n = x.shape[0]
+        out = np.full(n, np.nan)
+        if n == 0:
+            return out
+        weighted = x[0]
+        out[0] = weighted
+        old_wt = 1.0
+        for i in range(1, n):
+            cur = x[i]
+            if weighted == weighted:
+                old_wt *= 1.0 - alpha
+                if cur == cur:
+                    if weighted != cur:
+                        weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                    old_wt = 1.0
+            elif cur == cur:
+                weighted = cur
+            out[i] = weighted
+        return out
+
+    @njit(cache=True, error_model='numpy')
+    def _rsi(close, window):
+        n = close.shape[0]
+        gain = np.zeros(n)
+        loss = np.zeros(n)
+        for i in range(1, n):
+            delta = close[i] - close[i - 1]
+            if delta > 0:
+                gain[i] = delta
+            elif delta < 0:
+                loss[i] = -delta
+        avg_gain = _sma(gain, window)
+        avg_loss = _sma(loss, window)
+        return 100 - (100 / (1 + avg_gain / avg_loss))
+
+except ImportError:
+    logger.info("numba 패키지가 없어 pandas로 기술적 지표를 계산합니다.")
+
+    def _sma(x, window):
+        return pd.Series(x).rolling(window=window).mean().to_numpy()
+
+    def _rolling_std(x, window):
+        return pd.Series(x).rolling(window=window).std().to_numpy()
+
+    def _ema(x, alpha):
+        return pd.Series(x).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+
+    def _rsi(close, window):
+        delta = pd.Series(close).diff()
+        avg_gain = delta.where(delta > 0, 0).rolling(window=window).mean()
+        avg_loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
+        return (100 - (100 / (1 + avg_gain / avg_loss))).to_numpy()
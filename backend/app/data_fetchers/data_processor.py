@@ -10,6 +10,8 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Union
 
+from ._kernels import _sma, _ema, _rsi, _rolling_std
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -110,40 +112,40 @@ class StockDataProcessor:
             # 데이터 복사본 생성
             result_df = df.copy()
             
+            # 종가 열을 연속된 float64 배열로 한 번만 변환하여 지표 커널에 전달
+            close = np.ascontiguousarray(result_df['close'].to_numpy(dtype=np.float64))
+            
             # 이동평균선 (Moving Average)
-            result_df['MA5'] = result_df['close'].rolling(window=5).mean()
-            result_df['MA20'] = result_df['close'].rolling(window=20).mean()
-            result_df['MA60'] = result_df['close'].rolling(window=60).mean()
+            result_df['MA5'] = _sma(close, 5)
+            result_df['MA20'] = _sma(close, 20)
+            result_df['MA60'] = _sma(close, 60)
             
             # 상대강도지수 (Relative Strength Index, RSI)
-            delta = result_df['close'].diff()
-            gain = delta.where(delta > 0, 0)
-            loss = -delta.where(delta < 0, 0)
-            
-            avg_gain = gain.rolling(window=14).mean()
-            avg_loss = loss.rolling(window=14).mean()
-            
-            rs = avg_gain / avg_loss
-            result_df['RSI'] = 100 - (100 / (1 + rs))
+            result_df['RSI'] = _rsi(close, 14)
             
             # 볼린저 밴드 (Bollinger Bands)
-            result_df['BB_middle'] = result_df['close'].rolling(window=20).mean()
-            result_df['BB_std'] = result_df['close'].rolling(window=20).std()
+            result_df['BB_middle'] = result_df['MA20']
+            result_df['BB_std'] = _rolling_std(close, 20)
             result_df['BB_upper'] = result_df['BB_middle'] + (result_df['BB_std'] * 2)
             result_df['BB_lower'] = result_df['BB_middle'] - (result_df['BB_std'] * 2)
             
             # MACD (Moving Average Convergence Divergence)
-            result_df['EMA12'] = result_df['close'].ewm(span=12, adjust=False).mean()
-            result_df['EMA26'] = result_df['close'].ewm(span=26, adjust=False).mean()
-            result_df['MACD'] = result_df['EMA12'] - result_df['EMA26']
-            result_df['MACD_signal'] = result_df['MACD'].ewm(span=9, adjust=False).mean()
-            result_df['MACD_hist'] = result_df['MACD'] - result_df['MACD_signal']
+            ema12 = _ema(close, 2 / (12 + 1))
+            ema26 = _ema(close, 2 / (26 + 1))
+            macd = ema12 - ema26
+            macd_signal = _ema(macd, 2 / (9 + 1))
+            result_df['EMA12'] = ema12
+            result_df['EMA26'] = ema26
+            result_df['MACD'] = macd
+            result_df['MACD_signal'] = macd_signal
+            result_df['MACD_hist'] = macd - macd_signal
             
             # 일일 수익률 (Daily Returns)
             result_df['daily_return'] = result_df['close'].pct_change() * 100
             
             # 변동성 (Volatility) - 20일 표준편차
-            result_df['volatility_20d'] = result_df['daily_return'].rolling(window=20).std()
+            daily_return = np.ascontiguousarray(result_df['daily_return'].to_numpy(dtype=np.float64))
+            result_df['volatility_20d'] = _rolling_std(daily_return, 20)
             
             logger.info("기술적 지표 계산 완료")
             return result_df
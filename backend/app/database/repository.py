@@ -46,11 +46,18 @@ class Neo4jRepository:
         """
         Neo4j 데이터베이스에 연결합니다.
         
+        드라이버는 한 번만 생성하여 연결 풀을 재사용하며, 이미 연결된 경우 연결 상태만 확인합니다.
+        
         Returns:
             연결 성공 여부
         """
         try:
-            self.driver = GraphDatabase.driver(self.uri, auth=(self.user, self.password))
+            if self.driver is None:
+                self.driver = GraphDatabase.driver(
+                    self.uri,
+                    auth=(self.user, self.password),
+                    max_connection_pool_size=int(os.getenv("NEO4J_MAX_POOL_SIZE", "50"))
+                )
             
             # 연결 테스트
             with self.driver.session() as session:
@@ -68,12 +75,33 @@ class Neo4jRepository:
             logger.error(f"Neo4j 데이터베이스 연결 중 오류 발생: {str(e)}")
             return False
     
+    def ping(self) -> bool:
+        """
+        Neo4j 데이터베이스 연결 상태를 확인합니다.
+        
+        세션을 열어 쿼리를 실행하지 않고 기존 드라이버의 연결 확인 기능을 사용합니다.
+        
+        Returns:
+            연결 가능 여부
+        """
+        if self.driver is None:
+            return self.connect()
+        
+        try:
+            self.driver.verify_connectivity()
+            return True
+        
+        except Exception as e:
+            logger.error(f"Neo4j 데이터베이스 연결 확인 중 오류 발생: {str(e)}")
+            return False
+    
     def close(self):
         """
         Neo4j 데이터베이스 연결을 종료합니다.
         """
         if self.driver:
             self.driver.close()
+            self.driver = None
             logger.info("Neo4j 데이터베이스 연결 종료")
     
     # 주식 관련 메서드
@@ -511,68 +539,86 @@ class Neo4jRepository:
         Returns:
             저장 성공 여부
         """
+        return self.save_investment_decisions([decision_data]) == 1
+    
+    def save_investment_decisions(self, decisions: List[Dict[str, Any]]) -> int:
+        """
+        여러 투자 결정을 하나의 UNWIND 쿼리로 저장합니다.
+        
+        Args:
+            decisions: 투자 결정 목록
+            
+        Returns:
+            저장된 투자 결정 수
+        """
         try:
+            if not decisions:
+                return 0
+            
             if not self.driver:
                 if not self.connect():
-                    return False
+                    return 0
             
-            with self.driver.session() as session:
-                # 투자 결정 저장 쿼리
-                query = """
-                CREATE (d:InvestmentDecision {
-                    id: $id,
-                    timestamp: datetime($timestamp),
-                    provider: $provider,
-                    model: $model,
-                    available_funds: $available_funds,
-                    strategy: $strategy,
-                    created_at: datetime()
-                })
-                
-                WITH d
-                
-                MATCH (a:AIAnalysis {id: $analysis_id})
+            # 투자 결정 저장 쿼리
+            query = """
+            UNWIND $rows AS row
+            CREATE (d:InvestmentDecision {
+                id: row.id,
+                timestamp: datetime(row.timestamp),
+                provider: row.provider,
+                model: row.model,
+                available_funds: row.available_funds,
+                strategy: row.strategy,
+                created_at: datetime()
+            })
+            
+            WITH d, row
+            
+            OPTIONAL MATCH (a:AIAnalysis {id: row.analysis_id})
+            FOREACH (_ IN CASE WHEN a IS NULL THEN [] ELSE [1] END |
                 CREATE (d)-[:DECIDES]->(a)
-                
-                WITH d
-                
-                UNWIND $investments AS investment
-                MATCH (s:Stock {symbol: investment.symbol})
+            )
+            
+            FOREACH (investment IN row.investments |
+                MERGE (s:Stock {symbol: investment.symbol})
                 CREATE (d)-[:CONTAINS {
                     amount: investment.amount,
                     reason: investment.reason
                 }]->(s)
-                
-                RETURN d.id AS id
-                """
-                
-                # ID 생성
-                decision_id = decision_data.get("id", str(uuid.uuid4()))
-                
-                result = session.run(
-                    query,
-                    id=decision_id,
-                    timestamp=decision_data.get("timestamp"),
-                    provider=decision_data.get("provider"),
-                    model=decision_data.get("model"),
-                    available_funds=decision_data.get("available_funds"),
-                    strategy=decision_data.get("strategy"),
-                    analysis_id=decision_data.get("analysis_id"),
-                    investments=decision_data.get("investments", [])
-                )
-                
-                record = result.single()
-                
-                if record and record["id"] == decision_id:
-                    logger.info(f"투자 결정 저장 성공: {decision_id}")
-                    return True
-                else:
-                    logger.warning(f"투자 결정 저장 실패: {decision_id}")
-                    return False
+            )
+            
+            RETURN count(d) AS count
+            """
+            
+            rows = [
+                {
+                    # ID 생성
+                    "id": decision_data.get("id", str(uuid.uuid4())),
+                    "timestamp": decision_data.get("timestamp"),
+                    "provider": decision_data.get("provider"),
+                    "model": decision_data.get("model"),
+                    "available_funds": decision_data.get("available_funds"),
+                    "strategy": decision_data.get("strategy"),
+                    "analysis_id": decision_data.get("analysis_id"),
+                    "investments": decision_data.get("investments", [])
+                }
+                for decision_data in decisions
+            ]
+            
+            with self.driver.session() as session:
+                record = session.run(query, rows=rows).single()
+                count = record["count"] if record else 0
+            
+            if count == len(rows):
+                logger.info(f"투자 결정 저장 성공: {count}개")
+            else:
+                logger.warning(f"투자 결정 일부 저장 실패: {count}/{len(rows)}")
+            
+            return count
         
         except Exception as e:
             logger.error(f"투자 결정 저장 중 오류 발생: {str(e)}")
-            return False
+            return 0
     
     # 포트폴리오 관련 메서드
     
@@ -1007,12 +1053,14 @@ class Neo4jRepository:
             logger.error(f"AI 분석 결과 조회 중 오류 발생: {str(e)}")
             return []
     
-    def get_investment_decisions(self, limit: int = 10) -> List[Dict[str, Any]]:
+    def get_investment_decisions(self, limit: Optional[int] = 10, start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         투자 결정을 조회합니다.
         
         Args:
-            limit: 결과 제한 수
+            limit: 결과 제한 수 (None이면 제한 없음)
+            start_date: 시작 날짜 (YYYY-MM-DD, 선택 사항)
+            end_date: 종료 날짜 (YYYY-MM-DD, 선택 사항, 해당 날짜 포함)
             
         Returns:
             투자 결정 목록
@@ -1023,30 +1071,37 @@ class Neo4jRepository:
                     return []
             
             with self.driver.session() as session:
-                # 투자 결정 조회 쿼리
+                # 투자 결정 조회 쿼리 (종목별 투자 금액까지 한 번에 수집)
                 query = """
                 MATCH (d:InvestmentDecision)
-                OPTIONAL MATCH (d)-[:CONTAINS]->(s:Stock)
-                WITH d, collect({symbol: s.symbol, name: s.name}) AS stocks
+                WHERE ($start_date IS NULL OR d.timestamp >= datetime($start_date))
+                  AND ($end_date IS NULL OR d.timestamp < datetime($end_date) + duration('P1D'))
+                OPTIONAL MATCH (d)-[c:CONTAINS]->(s:Stock)
+                WITH d, collect(CASE WHEN s IS NULL THEN NULL ELSE {symbol: s.symbol, name: s.name, amount: c.amount, reason: c.reason} END) AS investments
                 RETURN d.id AS id, d.timestamp AS timestamp, d.provider AS provider,
                        d.model AS model, d.available_funds AS available_funds,
-                       d.strategy AS strategy, stocks
+                       d.strategy AS strategy, investments
                 ORDER BY d.timestamp DESC
-                LIMIT $limit
                 """
+                if limit is not None:
+                    query += "LIMIT $limit"
                 
-                result = session.run(query, limit=limit)
+                result = session.run(query, limit=limit, start_date=start_date, end_date=end_date)
                 
                 decisions = []
                 for record in result:
+                    investments = record["investments"]
+                    # neo4j DateTime은 JSON 직렬화가 안 되므로 ISO 문자열로 변환
+                    timestamp = record["timestamp"]
                     decision = {
                         "id": record["id"],
-                        "timestamp": record["timestamp"],
+                        "timestamp": timestamp.iso_format() if hasattr(timestamp, "iso_format") else timestamp,
                         "provider": record["provider"],
                         "model": record["model"],
                         "available_funds": record["available_funds"],
                         "strategy": record["strategy"],
-                        "stocks": record["stocks"]
+                        "stocks": [{"symbol": i["symbol"], "name": i["name"]} for i in investments],
+                        "investments": investments
                     }
                     decisions.append(decision)
                 
@@ -0,0 +1,160 @@
+"""
+임베딩 디스크 캐시 모듈
+
+이 모듈은 API 기반 임베딩 결과를 SQLite 파일에 저장하여
+프로세스가 재시작되어도 동일한 텍스트를 다시 임베딩하지 않도록 합니다.
+"""
+import os
+import logging
+import sqlite3
+import hashlib
+import threading
+import numpy as np
+from typing import List, Optional, Callable
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# SQLite 바인딩 변수 제한을 넘지 않도록 한 번에 조회할 최대 키 수
+_MAX_KEYS_PER_QUERY = 500
+
+class DiskEmbeddingCache:
+    """
+    (모델 이름, 텍스트 해시) -> float32 벡터 바이트를 저장하는 영구 캐시
+    """
+    
+    def __init__(self, model_name: str, cache_dir: Optional[str] = None):
+        """
+        임베딩 디스크 캐시 초기화
+        
+        Args:
+            model_name: 임베딩 모델 이름 (캐시 키에 포함)
+            cache_dir: 캐시 디렉토리 경로 (기본값: EMBED_CACHE_DIR 환경 변수 또는 /tmp/embedding_cache)
+        """
+        self.model_name = model_name
+        self.cache_dir = cache_dir or os.environ.get("EMBED_CACHE_DIR", "/tmp/embedding_cache")
+        self._key_prefix = model_name.encode("utf-8") + b"|"
+        
+        # 캐시 디렉토리 생성
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.db_path = os.path.join(self.cache_dir, "embeddings.sqlite3")
+        
+        # 여러 스레드에서 공유하므로 연결 접근은 잠금으로 보호
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB NOT NULL)")
+        self._conn.commit()
+        
+        logger.info(f"임베딩 디스크 캐시가 초기화되었습니다: {self.db_path}")
+    
+    def _key(self, text: str) -> bytes:
+        """
+        텍스트에 대한 캐시 키를 생성합니다.
+        
+        Args:
+            text: 임베딩할 텍스트
+            
+        Returns:
+            캐시 키
+        """
+        return self._key_prefix + hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+    
+    def get_many(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """
+        여러 텍스트의 캐시된 임베딩을 조회합니다.
+        
+        Args:
+            texts: 조회할 텍스트 목록
+            
+        Returns:
+            입력 순서대로 정렬된 임베딩 목록 (캐시 미스는 None)
+        """
+        keys = [self._key(text) for text in texts]
+        found = {}
+        
+        with self._lock:
+            for i in range(0, len(keys), _MAX_KEYS_PER_QUERY):
+                chunk = keys[i:i+_MAX_KEYS_PER_QUERY]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                found.update(rows)
+        
+        return [
+            np.frombuffer(found[key], dtype=np.float32).copy() if key in found else None
+            for key in keys
+        ]
+    
+    def put_many(self, texts: List[str], vectors: List[np.ndarray]):
+        """
+        여러 텍스트의 임베딩을 캐시에 저장합니다.
+        
+        Args:
+            texts: 텍스트 목록
+            vectors: 각 텍스트의 임베딩 벡터 목록
+        """
+        rows = [
+            (self._key(text), np.ascontiguousarray(vector, dtype=np.float32).tobytes())
+            for text, vector in zip(texts, vectors)
+        ]
+        
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows)
+            self._conn.commit()
+    
+    def get_or_compute(self, text: str, compute: Callable[[str], np.ndarray]) -> np.ndarray:
+        """
+        캐시에서 임베딩을 가져오고, 없으면 계산하여 저장합니다.
+        
+        Args:
+            text: 임베딩할 텍스트
+            compute: 캐시 미스 시 호출할 임베딩 함수
+            
+        Returns:
+            임베딩 벡터
+        """
+        cached = self.get_many([text])[0]
+        if cached is not None:
+            return cached
+        
+        vector = compute(text)
+        self.put_many([text], [vector])
+        return vector
+    
+    def get_or_compute_batch(self, texts: List[str], compute_batch: Callable[[List[str]], List[np.ndarray]]) -> List[np.ndarray]:
+        """
+        캐시에서 임베딩 배치를 가져오고, 캐시 미스만 한 번에 계산하여 저장합니다.
+        
+        Args:
+            texts: 임베딩할 텍스트 목록
+            compute_batch: 캐시 미스 텍스트 목록에 대해 호출할 배치 임베딩 함수
+            
+        Returns:
+            입력 순서대로 정렬된 임베딩 벡터 목록
+        """
+        results = self.get_many(texts)
+        missing = [i for i, vector in enumerate(results) if vector is None]
+        
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            computed = compute_batch(missing_texts)
+            self.put_many(missing_texts, computed)
+            
+            for i, vector in zip(missing, computed):
+                results[i] = vector
+        
+        logger.debug(f"임베딩 캐시: {len(texts) - len(missing)}/{len(texts)} 히트")
+        return results
+    
+    def close(self):
+        """
+        캐시 데이터베이스 연결을 닫습니다.
+        """
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,199 @@
+"""
+검색 쿼리 결과 캐시 모듈
+
+이 모듈은 검색 쿼리와 그 결과를 메모리에 저장하여
+같은 쿼리나 의미가 거의 같은 쿼리에 대해 벡터 검색을 반복하지 않도록 합니다.
+"""
+import copy
+import time
+import logging
+import threading
+import numpy as np
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
+
+from .similarity import topk_cosine
+from .text_embedding import QuantizedEmbedding
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+class QueryResultCache:
+    """
+    정규화된 쿼리 문자열 -> (쿼리 임베딩, top_k, 검색 결과, 만료 시각)을 저장하는 TTL LRU 캐시
+    
+    정확히 같은 쿼리는 문자열로 찾고, 다른 쿼리는 임베딩의 코사인 유사도가
+    임계값 이상인 캐시 항목이 있으면 그 결과를 재사용합니다.
+    캐시는 프로세스별로 유지되므로, 다른 워커가 인덱싱한 데이터는 TTL이 지난 뒤 반영됩니다.
+    """
+    
+    def __init__(self, maxsize: int = 1024, threshold: float = 0.97, ttl: float = 300.0):
+        """
+        검색 쿼리 결과 캐시 초기화
+        
+        Args:
+            maxsize: 최대 캐시 항목 수
+            threshold: 의미 캐시 적중으로 판단할 최소 코사인 유사도
+            ttl: 캐시 항목 유효 시간 (초)
+        """
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self.ttl = ttl
+        
+        self._entries: OrderedDict[str, Tuple[np.ndarray, int, List[Dict[str, Any]], float]] = OrderedDict()
+        self._keys: List[str] = []
+        self._matrix: Optional[np.ndarray] = None
+        
+        # 검색은 여러 작업 스레드에서 실행되므로 캐시 접근은 잠금으로 보호
+        self._lock = threading.Lock()
+        
+        logger.info(f"검색 쿼리 결과 캐시가 초기화되었습니다. 최대 크기: {maxsize}, 임계값: {threshold}, TTL: {ttl}초")
+    
+    @staticmethod
+    def _normalize(query: str) -> str:
+        """
+        쿼리 문자열을 캐시 키로 정규화합니다.
+        
+        Args:
+            query: 검색 쿼리
+        
+        Returns:
+            정규화된 쿼리
+        """
+        return query.strip().lower()
+    
+    @staticmethod
+    def _prepare_embedding(embedding: np.ndarray) -> np.ndarray:
+        """
+        쿼리 임베딩을 L2 정규화된 float32 벡터로 변환합니다.
+        
+        내적을 코사인 유사도로 사용하므로, 정규화되지 않았거나 int8로 양자화된 임베딩도
+        같은 기준으로 비교되도록 저장과 조회 모두 이 함수를 거칩니다.
+        
+        Args:
+            embedding: 쿼리 임베딩
+        
+        Returns:
+            L2 정규화된 float32 벡터
+        """
+        if isinstance(embedding, QuantizedEmbedding):
+            embedding = embedding.dequantize()
+        vector = np.array(embedding, dtype=np.float32).reshape(-1)
+        
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+    
+    def _get_entry(self, key: str, top_k: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        캐시 항목의 검색 결과 사본을 가져옵니다. 잠금을 잡은 상태에서 호출해야 합니다.
+        
+        Args:
+            key: 정규화된 쿼리
+            top_k: 요청한 결과 수
+        
+        Returns:
+            검색 결과 사본 또는 None (없거나 만료되었거나 결과 수가 부족한 경우)
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        if entry[3] < time.monotonic():
+            del self._entries[key]
+            self._matrix = None
+            return None
+        
+        if entry[1] < top_k:
+            return None
+        
+        self._entries.move_to_end(key)
+        
+        # 호출자가 결과를 수정해도 캐시된 결과가 바뀌지 않도록 사본 반환
+        return copy.deepcopy(entry[2][:top_k])
+    
+    def get_exact(self, query: str, top_k: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        같은 쿼리에 대한 캐시된 검색 결과를 가져옵니다.
+        
+        Args:
+            query: 검색 쿼리
+            top_k: 요청한 결과 수
+        
+        Returns:
+            캐시된 검색 결과 또는 None
+        """
+        key = self._normalize(query)
+        
+        with self._lock:
+            return self._get_entry(key, top_k)
+    
+    def get_similar(self, embedding: np.ndarray, top_k: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        쿼리 임베딩과 가장 유사한 캐시 항목의 검색 결과를 가져옵니다.
+        
+        Args:
+            embedding: 쿼리 임베딩
+            top_k: 요청한 결과 수
+        
+        Returns:
+            유사도가 임계값 이상인 캐시 항목의 검색 결과 또는 None
+        """
+        vector = self._prepare_embedding(embedding)
+        
+        with self._lock:
+            if not self._entries:
+                return None
+            
+            # 캐시된 임베딩 행렬은 항목이 바뀔 때만 다시 쌓음
+            if self._matrix is None:
+                self._keys = list(self._entries)
+                self._matrix = np.vstack([self._entries[key][0] for key in self._keys])
+            
+            indices, scores = topk_cosine(self._matrix, vector, 1)
+            if len(indices) == 0 or scores[0] < self.threshold:
+                return None
+            
+            key = self._keys[indices[0]]
+            results = self._get_entry(key, top_k)
+            if results is not None:
+                logger.debug(f"의미 캐시 적중: '{key}' (유사도 {scores[0]:.4f})")
+            return results
+    
+    def put(self, query: str, embedding: np.ndarray, top_k: int, results: List[Dict[str, Any]]):
+        """
+        검색 결과를 캐시에 저장합니다.
+        
+        Args:
+            query: 검색 쿼리
+            embedding: 쿼리 임베딩
+            top_k: 요청한 결과 수
+            results: 검색 결과
+        """
+        key = self._normalize(query)
+        vector = self._prepare_embedding(embedding)
+        results = copy.deepcopy(results)
+        
+        with self._lock:
+            self._entries[key] = (vector, top_k, results, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            
+            # 가장 오래 사용되지 않은 항목부터 제거
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            
+            self._matrix = None
+    
+    def clear(self):
+        """
+        캐시를 비웁니다.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._keys = []
+            self._matrix = None
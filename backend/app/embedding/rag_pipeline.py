@@ -14,6 +14,7 @@ import uuid
 
 from .text_embedding import BaseEmbeddingModel, EmbeddingFactory
 from .vector_store import BaseVectorStore, VectorStoreFactory
+from .query_cache import QueryResultCache
 
 # 로깅 설정
 logging.basicConfig(
@@ -32,7 +33,10 @@ class StockMarketRAG:
         embedding_model: BaseEmbeddingModel, 
         vector_store: BaseVectorStore,
         chunk_size: int = 1000,
-        chunk_overlap: int = 200
+        chunk_overlap: int = 200,
+        query_cache_size: int = 1024,
+        query_cache_threshold: float = 0.97,
+        query_cache_ttl: float = 300.0
     ):
         """
         주식 시장 RAG 시스템 초기화
@@ -42,12 +46,18 @@ class StockMarketRAG:
             vector_store: 벡터 저장소
             chunk_size: 텍스트 청크 크기
             chunk_overlap: 텍스트 청크 간 중복 크기
+            query_cache_size: 검색 결과 캐시 크기 (0이면 캐시 사용 안 함)
+            query_cache_threshold: 의미 캐시 적중으로 판단할 최소 코사인 유사도
+            query_cache_ttl: 검색 결과 캐시 항목 유효 시간 (초)
         """
         self.embedding_model = embedding_model
         self.vector_store = vector_store
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         
+        # 검색 결과 캐시
+        self.query_cache = QueryResultCache(query_cache_size, query_cache_threshold, query_cache_ttl) if query_cache_size > 0 else None
+        
         logger.info("주식 시장 RAG 시스템이 초기화되었습니다.")
     
     def _chunk_text(self, text: str) -> List[str]:
@@ -95,7 +105,9 @@ class StockMarketRAG:
         try:
             logger.info(f"{market_type} 시장 데이터 인덱싱 시작...")
             
-            all_vector_ids = []
+            # 인덱싱할 텍스트와 메타데이터를 모은 뒤 한 번에 임베딩하고 저장
+            texts = []
+            metadatas = []
             
             # 시장 요약 텍스트 인덱싱
             if 'summary_text' in market_data:
@@ -103,9 +115,6 @@ class StockMarketRAG:
                 summary_chunks = self._chunk_text(summary_text)
                 
                 for i, chunk in enumerate(summary_chunks):
-                    # 임베딩 생성
-                    embedding = self.embedding_model.embed_text(chunk)
-                    
                     # 메타데이터 생성
                     metadata = {
                         "content_type": "summary",
@@ -116,9 +125,9 @@ class StockMarketRAG:
                         "text": chunk
                     }
                     
-                    # 벡터 저장소에 추가
-                    vector_ids = self.vector_store.add_vectors([embedding], [metadata])
-                    all_vector_ids.extend(vector_ids)
+                    # 일괄 임베딩 대상에 추가
+                    texts.append(chunk)
+                    metadatas.append(metadata)
             
             # 지수 데이터 인덱싱
             if 'indices' in market_data:
@@ -140,9 +149,6 @@ class StockMarketRAG:
                         if 'volatility_20d' in last_row:
                             index_text += f"20일 변동성: {last_row.get('volatility_20d', 'N/A')}, "
                         
-                        # 임베딩 생성
-                        embedding = self.embedding_model.embed_text(index_text)
-                        
                         # 메타데이터 생성
                         metadata = {
                             "content_type": "index",
@@ -152,9 +158,9 @@ class StockMarketRAG:
                             "text": index_text
                         }
                         
-                        # 벡터 저장소에 추가
-                        vector_ids = self.vector_store.add_vectors([embedding], [metadata])
-                        all_vector_ids.extend(vector_ids)
+                        # 일괄 임베딩 대상에 추가
+                        texts.append(index_text)
+                        metadatas.append(metadata)
             
             # 주식 데이터 인덱싱
             if 'stocks' in market_data:
@@ -179,9 +185,6 @@ class StockMarketRAG:
                         if 'volatility_20d' in last_row:
                             stock_text += f"20일 변동성: {last_row.get('volatility_20d', 'N/A')}, "
                         
-                        # 임베딩 생성
-                        embedding = self.embedding_model.embed_text(stock_text)
-                        
                         # 메타데이터 생성
                         metadata = {
                             "content_type": "stock",
@@ -191,9 +194,9 @@ class StockMarketRAG:
                             "text": stock_text
                         }
                         
-                        # 벡터 저장소에 추가
-                        vector_ids = self.vector_store.add_vectors([embedding], [metadata])
-                        all_vector_ids.extend(vector_ids)
+                        # 일괄 임베딩 대상에 추가
+                        texts.append(stock_text)
+                        metadatas.append(metadata)
             
             # 인사이트 데이터 인덱싱
             if 'insights' in market_data:
@@ -224,9 +227,6 @@ class StockMarketRAG:
                                 valuation = result['instrumentInfo']['valuation']
                                 insight_text += f"밸류에이션: {valuation.get('description', 'N/A')}, "
                     
-                    # 임베딩 생성
-                    embedding = self.embedding_model.embed_text(insight_text)
-                    
                     # 메타데이터 생성
                     metadata = {
                         "content_type": "insight",
@@ -236,9 +236,18 @@ class StockMarketRAG:
                         "text": insight_text
                     }
                     
-                    # 벡터 저장소에 추가
-                    vector_ids = self.vector_store.add_vectors([embedding], [metadata])
-                    all_vector_ids.extend(vector_ids)
+                    # 일괄 임베딩 대상에 추가
+                    texts.append(insight_text)
+                    metadatas.append(metadata)
+            
+            all_vector_ids = []
+            if texts:
+                embeddings = self.embedding_model.embed_batch(texts)
+                all_vector_ids = self.vector_store.add_vectors(embeddings, metadatas)
+                
+                # 새 데이터가 추가되었으므로 이전 검색 결과는 무효화
+                if self.query_cache is not None:
+                    self.query_cache.clear()
             
             logger.info(f"{market_type} 시장 데이터 인덱싱 완료: {len(all_vector_ids)} 개의 벡터가 생성되었습니다.")
             return all_vector_ids
@@ -261,12 +270,29 @@ class StockMarketRAG:
         try:
             logger.info(f"쿼리 '{query}'에 대한 검색 시작...")
             
+            # 같은 쿼리의 캐시된 결과 확인
+            if self.query_cache is not None:
+                cached = self.query_cache.get_exact(query, top_k)
+                if cached is not None:
+                    logger.info(f"캐시된 검색 결과 사용: {len(cached)} 개의 결과")
+                    return cached
+            
             # 쿼리 임베딩 생성
             query_embedding = self.embedding_model.embed_text(query)
             
+            # 의미가 유사한 쿼리의 캐시된 결과 확인
+            if self.query_cache is not None:
+                cached = self.query_cache.get_similar(query_embedding, top_k)
+                if cached is not None:
+                    logger.info(f"유사 쿼리의 캐시된 검색 결과 사용: {len(cached)} 개의 결과")
+                    return cached
+            
             # 벡터 저장소에서 유사한 벡터 검색
             search_results = self.vector_store.search(query_embedding, top_k=top_k)
             
+            if self.query_cache is not None:
+                self.query_cache.put(query, query_embedding, top_k, search_results)
+            
             logger.info(f"검색 완료: {len(search_results)} 개의 결과를 찾았습니다.")
             return search_results
         
@@ -338,7 +364,10 @@ class RAGFactory:
         embedding_model_params: Dict[str, Any] = None,
         vector_store_params: Dict[str, Any] = None,
         chunk_size: int = 1000,
-        chunk_overlap: int = 200
+        chunk_overlap: int = 200,
+        query_cache_size: int = 1024,
+        query_cache_threshold: float = 0.97,
+        query_cache_ttl: float = 300.0
     ) -> StockMarketRAG:
         """
         주식 시장 RAG 시스템을 생성합니다.
@@ -350,6 +379,9 @@ class RAGFactory:
             vector_store_params: 벡터 저장소 매개변수
             chunk_size: 텍스트 청크 크기
             chunk_overlap: 텍스트 청크 간 중복 크기
+            query_cache_size: 검색 결과 캐시 크기 (0이면 캐시 사용 안 함)
+            query_cache_threshold: 의미 캐시 적중으로 판단할 최소 코사인 유사도
+            query_cache_ttl: 검색 결과 캐시 항목 유효 시간 (초)
             
         Returns:
             주식 시장 RAG 시스템 인스턴스
@@ -380,5 +412,8 @@ class RAGFactory:
             embedding_model=embedding_model,
             vector_store=vector_store,
             chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap
+            chunk_overlap=chunk_overlap,
+            query_cache_size=query_cache_size,
+            query_cache_threshold=query_cache_threshold,
+            query_cache_ttl=query_cache_ttl
         )
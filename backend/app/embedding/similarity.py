@@ -0,0 +1,72 @@
+"""
+임베딩 유사도 계산 모듈
+
+이 모듈은 임베딩 행렬에서 쿼리 벡터와 가장 유사한 벡터를 찾는 기능을 제공합니다.
+numba가 설치되어 있으면 점수 계산을 병렬 컴파일된 루프로 수행합니다.
+"""
+import logging
+import numpy as np
+from typing import List, Tuple, Union
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+    
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _dot_scores(X, q):
+        n = X.shape[0]
+        scores = np.empty(n, dtype=np.float32)
+        for i in prange(n):
+            s = 0.0
+            for j in range(X.shape[1]):
+                s += X[i, j] * q[j]
+            scores[i] = s
+        return scores
+
+except ImportError:
+    logger.info("numba 패키지가 없어 numpy로 유사도를 계산합니다.")
+    
+    def _dot_scores(X, q):
+        return X @ q
+
+def topk_cosine(X: Union[np.ndarray, List[np.ndarray]], q: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    쿼리 벡터와 코사인 유사도가 가장 높은 k개의 벡터를 찾습니다.
+    
+    X와 q는 L2 정규화되어 있어야 합니다 (embed_text/embed_batch의 기본 normalize=True).
+    정규화된 벡터에서는 코사인 유사도가 내적과 같으므로 나눗셈 없이 계산합니다.
+    
+    Args:
+        X: (N, dim) 임베딩 행렬 또는 임베딩 벡터 목록
+        q: (dim,) 쿼리 벡터
+        k: 반환할 결과 수
+        
+    Returns:
+        (인덱스, 유사도 점수) 튜플, 유사도 내림차순 정렬
+    """
+    if isinstance(X, list):
+        X = np.vstack(X) if X else np.empty((0, q.shape[-1]), dtype=np.float32)
+    X = np.ascontiguousarray(X, dtype=np.float32)
+    q = np.ascontiguousarray(q, dtype=np.float32).reshape(-1)
+    
+    n = X.shape[0]
+    k = min(k, n)
+    if k <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+    
+    scores = _dot_scores(X, q)
+    
+    # 상위 k개만 부분 정렬한 뒤 그 안에서 정렬
+    if k < n:
+        top = np.argpartition(-scores, k - 1)[:k]
+    else:
+        top = np.arange(n)
+    top = top[np.argsort(-scores[top])]
+    
+    return top, scores[top]
@@ -7,10 +7,15 @@
 import os
 import logging
 import numpy as np
-from typing import List, Dict, Any, Union, Optional
+from typing import List, Dict, Any, Union, Optional, Literal
 import json
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
+from .embedding_cache import DiskEmbeddingCache
 
 # 로깅 설정
 logging.basicConfig(
@@ -19,6 +24,230 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# torch 스레드 설정은 프로세스당 한 번만 적용
+_torch_threads_configured = False
+
+def _configure_torch_threads(num_threads: Optional[int] = None):
+    """
+    CPU 추론을 위한 torch 스레드 풀을 설정합니다.
+    
+    Args:
+        num_threads: 연산 스레드 수 (기본값: EMBED_NUM_THREADS 환경 변수 또는 CPU 코어 수)
+    """
+    global _torch_threads_configured
+    if _torch_threads_configured:
+        return
+    
+    import torch
+    
+    if num_threads is None:
+        num_threads = int(os.environ.get("EMBED_NUM_THREADS", os.cpu_count() or 1))
+    
+    torch.set_num_threads(num_threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # 병렬 작업이 이미 시작된 후에는 변경할 수 없음
+        logger.warning("torch interop 스레드 수를 변경할 수 없습니다.")
+    torch.backends.mkldnn.enabled = True
+    
+    _torch_threads_configured = True
+    logger.info(f"torch 스레드 수가 {num_threads}(으)로 설정되었습니다.")
+
+def _l2_normalize(embeddings: np.ndarray) -> np.ndarray:
+    """
+    임베딩 벡터(1차원) 또는 행렬(2차원, 행 단위)을 제자리에서 L2 정규화합니다.
+    
+    Args:
+        embeddings: 정규화할 float 배열
+        
+    Returns:
+        정규화된 배열 (입력과 동일한 객체)
+    """
+    embeddings /= np.linalg.norm(embeddings, axis=-1, keepdims=True) + 1e-12
+    return embeddings
+
+# 지원되는 임베딩 출력 자료형
+OutputDType = Literal["float32", "float16", "int8"]
+OUTPUT_DTYPES = ("float32", "float16", "int8")
+
+def _estimate_tokens(text: str) -> int:
+    """
+    토크나이저 없이 텍스트의 토큰 수를 추정합니다 (약 4자당 1토큰).
+    
+    Args:
+        text: 대상 텍스트
+        
+    Returns:
+        추정 토큰 수
+    """
+    return len(text) // 4 + 1
+
+def _pack_batches(token_counts: List[int], max_tokens: int, max_inputs: int) -> List[slice]:
+    """
+    입력 순서를 유지하면서 토큰 한도와 입력 수 한도 안에서 최대한 큰 배치로 묶습니다.
+    
+    Args:
+        token_counts: 각 텍스트의 토큰 수
+        max_tokens: 요청당 최대 토큰 수
+        max_inputs: 요청당 최대 텍스트 수
+        
+    Returns:
+        각 배치에 해당하는 슬라이스 목록
+    """
+    batches = []
+    start = 0
+    batch_tokens = 0
+    
+    for i, count in enumerate(token_counts):
+        if i > start and (batch_tokens + count > max_tokens or i - start >= max_inputs):
+            batches.append(slice(start, i))
+            start = i
+            batch_tokens = 0
+        batch_tokens += count
+    
+    if start < len(token_counts):
+        batches.append(slice(start, len(token_counts)))
+    
+    return batches
+
+class _HttpBackend:
+    """
+    임베딩 API 호출용 HTTP 백엔드
+    
+    세션과 공통 헤더를 한 번만 구성하여 연결(keep-alive)을 재사용하고,
+    orjson으로 요청/응답 본문을 직렬화합니다.
+    """
+    
+    def __init__(self, base_headers: Dict[str, str], pool_maxsize: int = 10):
+        """
+        HTTP 백엔드 초기화
+        
+        Args:
+            base_headers: 모든 요청에 포함할 헤더
+            pool_maxsize: 호스트당 유지할 최대 연결 수
+        """
+        self.session = requests.Session()
+        self.session.headers.update({"Content-Type": "application/json", **base_headers})
+        
+        adapter = HTTPAdapter(pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # ijson이 설치되어 있으면 배치 응답을 스트리밍으로 파싱
+        try:
+            import ijson
+            self._ijson = ijson
+        except ImportError:
+            self._ijson = None
+    
+    def post_json(self, url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        JSON 본문으로 POST 요청을 보내고 응답을 파싱합니다.
+        
+        Args:
+            url: 요청 URL
+            payload: 요청 본문
+            
+        Returns:
+            파싱된 응답
+        """
+        response = self.session.post(url, data=orjson.dumps(payload))
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    
+    def post_embedding_rows(self, url: str, payload: Dict[str, Any], n_rows: int,
+                            dimension: Optional[int]) -> np.ndarray:
+        """
+        OpenAI 호환 임베딩 응답({"data": [{"embedding": [...]}, ...]})을 받아 행렬로 변환합니다.
+        
+        ijson이 있으면 응답을 수신하는 동안 값을 미리 할당한 행렬에 바로 채워 넣어,
+        원본 바이트와 파싱된 리스트를 동시에 메모리에 올리지 않습니다.
+        
+        Args:
+            url: 요청 URL
+            payload: 요청 본문
+            n_rows: 응답에 포함될 임베딩 수
+            dimension: 임베딩 차원 (None이면 스트리밍 없이 전체 응답을 파싱)
+            
+        Returns:
+            (n_rows, dimension) float32 임베딩 행렬
+        """
+        if self._ijson is None or dimension is None:
+            result = self.post_json(url, payload)
+            return np.array([item["embedding"] for item in result["data"]], dtype=np.float32)
+        
+        out = np.empty((n_rows, dimension), dtype=np.float32)
+        row = -1
+        col = 0
+        
+        with self.session.post(url, data=orjson.dumps(payload), stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            
+            for prefix, event, value in self._ijson.parse(response.raw, use_float=True):
+                if prefix == "data.item.embedding.item":
+                    out[row, col] = value
+                    col += 1
+                elif prefix == "data.item.embedding" and event == "start_array":
+                    row += 1
+                    col = 0
+        
+        if row + 1 != n_rows:
+            raise ValueError(f"임베딩 응답 행 수가 일치하지 않습니다: {row + 1} != {n_rows}")
+        
+        return out
+
+class QuantizedEmbedding(np.ndarray):
+    """
+    int8로 양자화된 임베딩 벡터
+    
+    벡터별 scale 값을 함께 보관하며, 유사도 계산 전에 dequantize()로 복원해야 합니다.
+    정규화된 벡터의 코사인 유사도는 scale과 무관하므로 방향만 필요한 경우 그대로 사용할 수 있습니다.
+    """
+    
+    def __array_finalize__(self, obj):
+        self.scale = getattr(obj, "scale", 1.0)
+    
+    def dequantize(self) -> np.ndarray:
+        """
+        float32 벡터로 복원합니다.
+        
+        Returns:
+            복원된 임베딩 벡터
+        """
+        return np.asarray(self, dtype=np.float32) * self.scale
+
+def _validate_output_dtype(output_dtype: str):
+    if output_dtype not in OUTPUT_DTYPES:
+        raise ValueError(f"지원되지 않는 출력 자료형: {output_dtype}")
+
+def _convert_output_dtype(embeddings: List[np.ndarray], output_dtype: str) -> List[np.ndarray]:
+    """
+    float32 임베딩 목록을 요청된 출력 자료형으로 변환합니다.
+    
+    Args:
+        embeddings: float32 임베딩 벡터 목록
+        output_dtype: 출력 자료형 ('float32', 'float16', 'int8')
+        
+    Returns:
+        변환된 임베딩 벡터 목록
+    """
+    if output_dtype == "float16":
+        return [embedding.astype(np.float16, copy=False) for embedding in embeddings]
+    
+    if output_dtype == "int8":
+        quantized = []
+        for embedding in embeddings:
+            # 벡터별 scale로 [-127, 127] 범위에 매핑
+            scale = float(np.max(np.abs(embedding))) / 127 or 1.0
+            q = np.round(embedding / scale).astype(np.int8).view(QuantizedEmbedding)
+            q.scale = scale
+            quantized.append(q)
+        return quantized
+    
+    return embeddings
+
 class BaseEmbeddingModel(ABC):
     """
     임베딩 모델의 기본 추상 클래스
@@ -65,27 +294,159 @@ class BaseEmbeddingModel(ABC):
 class SentenceTransformerModel(BaseEmbeddingModel):
     """
     Sentence Transformers 기반 임베딩 모델
+    
+    backend='onnx'를 지정하면 모델을 ONNX로 한 번 내보낸 뒤 ONNX Runtime으로 추론합니다.
+    토큰화는 HuggingFace tokenizers(Rust), 풀링과 정규화는 numpy로 처리합니다.
     """
     
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", precision: str = "fp16",
+                 num_threads: Optional[int] = None, normalize: bool = True,
+                 output_dtype: OutputDType = "float32", backend: str = "torch", warmup: bool = True):
         """
         Sentence Transformers 모델 초기화
         
         Args:
             model_name: 사용할 모델 이름
+            precision: GPU 추론 정밀도 ('fp32', 'fp16', 'bf16'). CPU에서는 항상 fp32를 사용합니다.
+            num_threads: CPU 연산 스레드 수 (기본값: EMBED_NUM_THREADS 환경 변수 또는 CPU 코어 수)
+            normalize: 임베딩을 L2 정규화하여 반환할지 여부
+            output_dtype: 반환할 임베딩 자료형 ('float32', 'float16', 'int8')
+            backend: 추론 백엔드 ('torch', 'onnx')
+            warmup: 초기화 시 더미 입력으로 한 번 추론하여 첫 요청의 지연(CUDA 초기화, 커널 튜닝)을 미리 처리할지 여부
         """
+        _validate_output_dtype(output_dtype)
+        self.normalize = normalize
+        self.output_dtype = output_dtype
+        self.backend = backend
+        self._embed_fp16 = False
+        self._session = None
+        
         try:
-            from sentence_transformers import SentenceTransformer
-            self.model = SentenceTransformer(model_name)
-            self._dimension = self.model.get_sentence_embedding_dimension()
-            logger.info(f"Sentence Transformers 모델 '{model_name}'이(가) 로드되었습니다.")
+            if backend == "onnx":
+                self._init_onnx(model_name, num_threads)
+                logger.info(f"Sentence Transformers 모델 '{model_name}'이(가) ONNX Runtime으로 로드되었습니다.")
+            else:
+                from sentence_transformers import SentenceTransformer
+                import torch
+                self._torch = torch
+                _configure_torch_threads(num_threads)
+                self.model = SentenceTransformer(model_name)
+                self._dimension = self.model.get_sentence_embedding_dimension()
+                
+                # GPU 사용 가능 시 반정밀도로 변환 (텐서 코어 활용)
+                if torch.cuda.is_available() and precision in ("fp16", "bf16"):
+                    self.model = self.model.to(torch.float16 if precision == "fp16" else torch.bfloat16)
+                    self._embed_fp16 = True
+                
+                logger.info(f"Sentence Transformers 모델 '{model_name}'이(가) 로드되었습니다. 정밀도: {precision if self._embed_fp16 else 'fp32'}")
+            
+            # 첫 사용자 요청 전에 일회성 초기화 비용을 치름
+            if warmup:
+                self._encode(["warmup"])
         except ImportError:
-            logger.error("sentence-transformers 패키지가 설치되어 있지 않습니다. 'pip install sentence-transformers'를 실행하세요.")
+            if backend == "onnx":
+                logger.error("ONNX 백엔드에는 onnxruntime, optimum, tokenizers 패키지가 필요합니다. 'pip install optimum[onnxruntime]'를 실행하세요.")
+            else:
+                logger.error("sentence-transformers 패키지가 설치되어 있지 않습니다. 'pip install sentence-transformers'를 실행하세요.")
             raise
         except Exception as e:
             logger.error(f"Sentence Transformers 모델 로드 중 오류 발생: {str(e)}")
             raise
     
+    def _init_onnx(self, model_name: str, num_threads: Optional[int] = None, max_length: int = 256):
+        """
+        ONNX Runtime 추론 세션을 초기화합니다. 내보낸 모델이 없으면 한 번 내보내어 디스크에 저장합니다.
+        
+        Args:
+            model_name: 사용할 모델 이름
+            num_threads: 연산 스레드 수 (기본값: EMBED_NUM_THREADS 환경 변수 또는 CPU 코어 수)
+            max_length: 최대 토큰 길이
+        """
+        from onnxruntime import InferenceSession, SessionOptions, GraphOptimizationLevel
+        from tokenizers import Tokenizer
+        
+        hub_name = model_name if "/" in model_name else f"sentence-transformers/{model_name}"
+        export_dir = os.path.join(os.environ.get("ONNX_MODEL_DIR", "/tmp/onnx_models"), hub_name.replace("/", "__"))
+        model_path = os.path.join(export_dir, "model.onnx")
+        
+        if not os.path.exists(model_path):
+            from optimum.onnxruntime import ORTModelForFeatureExtraction
+            from transformers import AutoTokenizer
+            
+            logger.info(f"'{hub_name}' 모델을 ONNX로 내보내는 중: {export_dir}")
+            ORTModelForFeatureExtraction.from_pretrained(hub_name, export=True).save_pretrained(export_dir)
+            AutoTokenizer.from_pretrained(hub_name).save_pretrained(export_dir)
+        
+        self._tokenizer = Tokenizer.from_file(os.path.join(export_dir, "tokenizer.json"))
+        self._tokenizer.enable_padding()
+        self._tokenizer.enable_truncation(max_length=max_length)
+        
+        options = SessionOptions()
+        options.graph_optimization_level = GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = num_threads or int(os.environ.get("EMBED_NUM_THREADS", os.cpu_count() or 1))
+        
+        self._session = InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+        self._input_names = {node.name for node in self._session.get_inputs()}
+        self._output_name = self._session.get_outputs()[0].name
+        self._dimension = self._session.get_outputs()[0].shape[-1]
+    
+    def _encode_onnx(self, texts: List[str]) -> np.ndarray:
+        """
+        ONNX Runtime으로 텍스트를 임베딩합니다 (토큰화 -> 모델 -> 평균 풀링 -> 정규화).
+        
+        Args:
+            texts: 임베딩할 텍스트 목록
+            
+        Returns:
+            (len(texts), dimension) float32 임베딩 행렬
+        """
+        encodings = self._tokenizer.encode_batch(texts)
+        input_ids = np.array([encoding.ids for encoding in encodings], dtype=np.int64)
+        attention_mask = np.array([encoding.attention_mask for encoding in encodings], dtype=np.int64)
+        
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self._input_names:
+            feeds["token_type_ids"] = np.zeros_like(input_ids)
+        
+        # 입력/출력을 미리 바인딩하여 세션 내부 복사를 줄임
+        io_binding = self._session.io_binding()
+        for name, array in feeds.items():
+            io_binding.bind_cpu_input(name, array)
+        io_binding.bind_output(self._output_name)
+        self._session.run_with_iobinding(io_binding)
+        token_embeddings = io_binding.copy_outputs_to_cpu()[0]
+        
+        # 패딩을 제외한 평균 풀링
+        mask = attention_mask[..., None].astype(np.float32)
+        embeddings = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        embeddings = embeddings.astype(np.float32, copy=False)
+        
+        if self.normalize:
+            _l2_normalize(embeddings)
+        return embeddings
+    
+    def _encode(self, texts: Union[str, List[str]]) -> np.ndarray:
+        """
+        선택된 백엔드로 텍스트를 float32 임베딩으로 변환합니다.
+        
+        Args:
+            texts: 임베딩할 텍스트 또는 텍스트 목록
+            
+        Returns:
+            임베딩 벡터 또는 임베딩 행렬
+        """
+        if self._session is not None:
+            if isinstance(texts, str):
+                return self._encode_onnx([texts])[0]
+            return self._encode_onnx(texts)
+        
+        with self._torch.inference_mode():
+            embeddings = self.model.encode(texts, convert_to_numpy=True, normalize_embeddings=self.normalize)
+        # 벡터 저장소는 float32를 기대하므로 반정밀도 결과만 변환
+        if self._embed_fp16:
+            embeddings = embeddings.astype(np.float32, copy=False)
+        return embeddings
+    
     def embed_text(self, text: str) -> np.ndarray:
         """
         텍스트를 임베딩 벡터로 변환합니다.
@@ -97,7 +458,8 @@ class SentenceTransformerModel(BaseEmbeddingModel):
             임베딩 벡터
         """
         try:
-            return self.model.encode(text, convert_to_numpy=True)
+            embedding = self._encode(text)
+            return _convert_output_dtype([embedding], self.output_dtype)[0]
         except Exception as e:
             logger.error(f"텍스트 임베딩 중 오류 발생: {str(e)}")
             raise
@@ -112,9 +474,15 @@ class SentenceTransformerModel(BaseEmbeddingModel):
         Returns:
             임베딩 벡터 목록
         """
+        # 빈 입력과 단일 텍스트는 배치 처리 없이 바로 처리
+        if not texts:
+            return []
+        if len(texts) == 1:
+            return [self.embed_text(texts[0])]
+        
         try:
-            embeddings = self.model.encode(texts, convert_to_numpy=True)
-            return [embedding for embedding in embeddings]
+            embeddings = self._encode(texts)
+            return _convert_output_dtype(list(embeddings), self.output_dtype)
         except Exception as e:
             logger.error(f"텍스트 배치 임베딩 중 오류 발생: {str(e)}")
             raise
@@ -130,37 +498,63 @@ class SentenceTransformerModel(BaseEmbeddingModel):
         return self._dimension
 
 
-class OpenAIEmbeddingModel(BaseEmbeddingModel):
+class APIEmbeddingModel(BaseEmbeddingModel):
     """
-    OpenAI API 기반 임베딩 모델
+    API 기반 임베딩 모델의 공통 기본 클래스
+    
+    하위 클래스는 _compute_one/_compute_batch에서 원본 float32 임베딩만 반환하고,
+    디스크 캐시 조회, L2 정규화, 출력 자료형 변환은 이 클래스에서 처리합니다.
     """
     
-    def __init__(self, api_key: str, model_name: str = "text-embedding-3-small"):
+    # 로그 메시지에 사용할 제공자 이름
+    provider_name = "API"
+    
+    def _init_common(self, api_key: str, model_name: str, normalize: bool, output_dtype: str,
+                     use_cache: bool, cache_dir: Optional[str]):
         """
-        OpenAI 임베딩 모델 초기화
+        API 임베딩 모델의 공통 속성을 초기화합니다.
         
         Args:
-            api_key: OpenAI API 키
+            api_key: API 키
             model_name: 사용할 모델 이름
+            normalize: 임베딩을 L2 정규화하여 반환할지 여부
+            output_dtype: 반환할 임베딩 자료형 ('float32', 'float16', 'int8')
+            use_cache: 임베딩 디스크 캐시 사용 여부
+            cache_dir: 캐시 디렉토리 경로 (기본값: EMBED_CACHE_DIR 환경 변수)
         """
+        _validate_output_dtype(output_dtype)
         self.api_key = api_key
         self.model_name = model_name
-        self.api_url = "https://api.openai.com/v1/embeddings"
-        
-        # 모델별 차원 매핑
-        self.model_dimensions = {
-            "text-embedding-3-small": 1536,
-            "text-embedding-3-large": 3072,
-            "text-embedding-ada-002": 1536
-        }
+        self.normalize = normalize
+        self.output_dtype = output_dtype
+        self._cache = DiskEmbeddingCache(model_name, cache_dir) if use_cache else None
+    
+    @abstractmethod
+    def _compute_one(self, text: str) -> np.ndarray:
+        """
+        API를 호출하여 단일 텍스트의 원본 float32 임베딩을 가져옵니다.
         
-        if model_name not in self.model_dimensions:
-            logger.warning(f"알 수 없는 모델 '{model_name}'. 기본 차원 1536을 사용합니다.")
-            self._dimension = 1536
-        else:
-            self._dimension = self.model_dimensions[model_name]
+        Args:
+            text: 임베딩할 텍스트
+            
+        Returns:
+            임베딩 벡터
+        """
+        pass
+    
+    @abstractmethod
+    def _compute_batch(self, texts: List[str], **kwargs) -> List[np.ndarray]:
+        """
+        API를 호출하여 텍스트 배치의 원본 float32 임베딩을 가져옵니다.
         
-        logger.info(f"OpenAI 임베딩 모델 '{model_name}'이(가) 초기화되었습니다.")
+        Args:
+            texts: 임베딩할 텍스트 목록
+            **kwargs: 제공자별 배치 매개변수
+            
+        Returns:
+            임베딩 벡터 목록
+        """
+        pass
     
     def embed_text(self, text: str) -> np.ndarray:
         """
@@ -173,65 +567,50 @@ class OpenAIEmbeddingModel(BaseEmbeddingModel):
             임베딩 벡터
         """
         try:
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}"
-            }
-            
-            payload = {
-                "input": text,
-                "model": self.model_name
-            }
-            
-            response = requests.post(self.api_url, headers=headers, json=payload)
-            response.raise_for_status()
+            if self._cache is not None:
+                embedding = self._cache.get_or_compute(text, self._compute_one)
+            else:
+                embedding = self._compute_one(text)
             
-            result = response.json()
-            embedding = result["data"][0]["embedding"]
-            
-            return np.array(embedding, dtype=np.float32)
+            if self.normalize:
+                _l2_normalize(embedding)
+            return _convert_output_dtype([embedding], self.output_dtype)[0]
         except Exception as e:
-            logger.error(f"OpenAI 텍스트 임베딩 중 오류 발생: {str(e)}")
+            logger.error(f"{self.provider_name} 텍스트 임베딩 중 오류 발생: {str(e)}")
             raise
     
-    def embed_batch(self, texts: List[str], batch_size: int = 10) -> List[np.ndarray]:
+    def embed_batch(self, texts: List[str], **kwargs) -> List[np.ndarray]:
         """
         텍스트 배치를 임베딩 벡터로 변환합니다.
         
         Args:
             texts: 임베딩할 텍스트 목록
-            batch_size: API 호출당 처리할 텍스트 수
+            **kwargs: 제공자별 배치 매개변수 (예: batch_size)
             
         Returns:
             임베딩 벡터 목록
         """
+        # 빈 입력과 단일 텍스트는 배치 처리 없이 바로 처리
+        if not texts:
+            return []
+        if len(texts) == 1:
+            return [self.embed_text(texts[0])]
+        
         try:
-            all_embeddings = []
+            compute_batch = lambda batch: self._compute_batch(batch, **kwargs)
             
-            # 배치 단위로 처리
-            for i in range(0, len(texts), batch_size):
-                batch = texts[i:i+batch_size]
-                
-                headers = {
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {self.api_key}"
-                }
-                
-                payload = {
-                    "input": batch,
-                    "model": self.model_name
-                }
-                
-                response = requests.post(self.api_url, headers=headers, json=payload)
-                response.raise_for_status()
-                
-                result = response.json()
-                batch_embeddings = [np.array(item["embedding"], dtype=np.float32) for item in result["data"]]
-                all_embeddings.extend(batch_embeddings)
+            if self._cache is not None:
+                all_embeddings = self._cache.get_or_compute_batch(texts, compute_batch)
+            else:
+                all_embeddings = compute_batch(texts)
             
-            return all_embeddings
+            # 배치 전체를 한 번에 정규화
+            if self.normalize and all_embeddings:
+                all_embeddings = list(_l2_normalize(np.vstack(all_embeddings)))
+            
+            return _convert_output_dtype(all_embeddings, self.output_dtype)
         except Exception as e:
-            logger.error(f"OpenAI 텍스트 배치 임베딩 중 오류 발생: {str(e)}")
+            logger.error(f"{self.provider_name} 텍스트 배치 임베딩 중 오류 발생: {str(e)}")
             raise
     
     @property
@@ -245,22 +624,153 @@ class OpenAIEmbeddingModel(BaseEmbeddingModel):
         return self._dimension
 
 
-class MistralEmbeddingModel(BaseEmbeddingModel):
+class OpenAIEmbeddingModel(APIEmbeddingModel):
+    """
+    OpenAI API 기반 임베딩 모델
+    """
+    
+    provider_name = "OpenAI"
+    
+    # 요청당 입력 한도 (최대 2048개 텍스트, 전체 토큰 수 제한)
+    MAX_BATCH_INPUTS = 2048
+    MAX_BATCH_TOKENS = 300_000
+    
+    def __init__(self, api_key: str, model_name: str = "text-embedding-3-small", normalize: bool = True,
+                 output_dtype: OutputDType = "float32", use_cache: bool = True, cache_dir: Optional[str] = None):
+        """
+        OpenAI 임베딩 모델 초기화
+        
+        Args:
+            api_key: OpenAI API 키
+            model_name: 사용할 모델 이름
+            normalize: 임베딩을 L2 정규화하여 반환할지 여부
+            output_dtype: 반환할 임베딩 자료형 ('float32', 'float16', 'int8')
+            use_cache: 임베딩 디스크 캐시 사용 여부
+            cache_dir: 캐시 디렉토리 경로 (기본값: EMBED_CACHE_DIR 환경 변수)
+        """
+        self._init_common(api_key, model_name, normalize, output_dtype, use_cache, cache_dir)
+        self.api_url = "https://api.openai.com/v1/embeddings"
+        self._http = _HttpBackend({"Authorization": f"Bearer {api_key}"})
+        
+        # tiktoken 인코더 (첫 배치 요청 시 로드)
+        self._encoder = None
+        
+        # 모델별 차원 매핑
+        self.model_dimensions = {
+            "text-embedding-3-small": 1536,
+            "text-embedding-3-large": 3072,
+            "text-embedding-ada-002": 1536
+        }
+        
+        if model_name not in self.model_dimensions:
+            logger.warning(f"알 수 없는 모델 '{model_name}'. 기본 차원 1536을 사용합니다.")
+            self._dimension = 1536
+        else:
+            self._dimension = self.model_dimensions[model_name]
+        
+        logger.info(f"OpenAI 임베딩 모델 '{model_name}'이(가) 초기화되었습니다.")
+    
+    def _compute_one(self, text: str) -> np.ndarray:
+        """
+        API를 호출하여 단일 텍스트의 원본 float32 임베딩을 가져옵니다.
+        
+        Args:
+            text: 임베딩할 텍스트
+            
+        Returns:
+            임베딩 벡터
+        """
+        payload = {
+            "input": text,
+            "model": self.model_name
+        }
+        
+        result = self._http.post_json(self.api_url, payload)
+        embedding = result["data"][0]["embedding"]
+        
+        return np.array(embedding, dtype=np.float32)
+    
+    def _count_tokens(self, texts: List[str]) -> List[int]:
+        """
+        텍스트별 토큰 수를 계산합니다. tiktoken이 없으면 문자 수로 추정합니다.
+        
+        Args:
+            texts: 대상 텍스트 목록
+            
+        Returns:
+            토큰 수 목록
+        """
+        if self._encoder is None:
+            try:
+                import tiktoken
+                self._encoder = tiktoken.encoding_for_model(self.model_name)
+            except (ImportError, KeyError):
+                logger.info("tiktoken을 사용할 수 없어 문자 수로 토큰 수를 추정합니다.")
+                self._encoder = False
+        
+        if self._encoder:
+            return [len(tokens) for tokens in self._encoder.encode_batch(texts)]
+        return [_estimate_tokens(text) for text in texts]
+    
+    def _compute_batch(self, texts: List[str], batch_size: Optional[int] = None) -> List[np.ndarray]:
+        """
+        API를 호출하여 텍스트 배치의 원본 float32 임베딩을 가져옵니다.
+        
+        Args:
+            texts: 임베딩할 텍스트 목록
+            batch_size: API 호출당 최대 텍스트 수 (기본값: 토큰 한도 내에서 최대한 묶음)
+            
+        Returns:
+            임베딩 벡터 목록
+        """
+        all_embeddings = []
+        max_inputs = min(batch_size or self.MAX_BATCH_INPUTS, self.MAX_BATCH_INPUTS)
+        
+        # 알려진 모델만 차원을 확신할 수 있으므로 스트리밍 파싱 사용
+        stream_dimension = self._dimension if self.model_name in self.model_dimensions else None
+        
+        # 토큰 한도에 맞춰 묶은 배치 단위로 처리
+        for batch_slice in _pack_batches(self._count_tokens(texts), self.MAX_BATCH_TOKENS, max_inputs):
+            batch = texts[batch_slice]
+            
+            payload = {
+                "input": batch,
+                "model": self.model_name
+            }
+            
+            batch_embeddings = self._http.post_embedding_rows(self.api_url, payload, len(batch), stream_dimension)
+            all_embeddings.extend(batch_embeddings)
+        
+        return all_embeddings
+
+
+class MistralEmbeddingModel(APIEmbeddingModel):
     """
     Mistral AI API 기반 임베딩 모델
     """
     
-    def __init__(self, api_key: str, model_name: str = "mistral-embed"):
+    provider_name = "Mistral"
+    
+    # 요청당 입력 한도 (전체 토큰 수 16k 제한)
+    MAX_BATCH_INPUTS = 2048
+    MAX_BATCH_TOKENS = 16_384
+    
+    def __init__(self, api_key: str, model_name: str = "mistral-embed", normalize: bool = True,
+                 output_dtype: OutputDType = "float32", use_cache: bool = True, cache_dir: Optional[str] = None):
         """
         Mistral 임베딩 모델 초기화
         
         Args:
             api_key: Mistral AI API 키
             model_name: 사용할 모델 이름
+            normalize: 임베딩을 L2 정규화하여 반환할지 여부
+            output_dtype: 반환할 임베딩 자료형 ('float32', 'float16', 'int8')
+            use_cache: 임베딩 디스크 캐시 사용 여부
+            cache_dir: 캐시 디렉토리 경로 (기본값: EMBED_CACHE_DIR 환경 변수)
         """
-        self.api_key = api_key
-        self.model_name = model_name
+        self._init_common(api_key, model_name, normalize, output_dtype, use_cache, cache_dir)
         self.api_url = "https://api.mistral.ai/v1/embeddings"
+        self._http = _HttpBackend({"Authorization": f"Bearer {api_key}"})
         
         # 모델별 차원 매핑
         self.model_dimensions = {
@@ -276,9 +786,9 @@ class MistralEmbeddingModel(BaseEmbeddingModel):
         
         logger.info(f"Mistral 임베딩 모델 '{model_name}'이(가) 초기화되었습니다.")
     
-    def embed_text(self, text: str) -> np.ndarray:
+    def _compute_one(self, text: str) -> np.ndarray:
         """
-        텍스트를 임베딩 벡터로 변환합니다.
+        API를 호출하여 단일 텍스트의 원본 float32 임베딩을 가져옵니다.
         
         Args:
             text: 임베딩할 텍스트
@@ -286,112 +796,112 @@ class MistralEmbeddingModel(BaseEmbeddingModel):
         Returns:
             임베딩 벡터
         """
-        try:
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}"
-            }
-            
-            payload = {
-                "input": text,
-                "model": self.model_name
-            }
-            
-            response = requests.post(self.api_url, headers=headers, json=payload)
-            response.raise_for_status()
-            
-            result = response.json()
-            embedding = result["data"][0]["embedding"]
-            
-            return np.array(embedding, dtype=np.float32)
-        except Exception as e:
-            logger.error(f"Mistral 텍스트 임베딩 중 오류 발생: {str(e)}")
-            raise
+        payload = {
+            "input": text,
+            "model": self.model_name
+        }
+        
+        result = self._http.post_json(self.api_url, payload)
+        embedding = result["data"][0]["embedding"]
+        
+        return np.array(embedding, dtype=np.float32)
     
-    def embed_batch(self, texts: List[str], batch_size: int = 10) -> List[np.ndarray]:
+    def _compute_batch(self, texts: List[str], batch_size: Optional[int] = None) -> List[np.ndarray]:
         """
-        텍스트 배치를 임베딩 벡터로 변환합니다.
+        API를 호출하여 텍스트 배치의 원본 float32 임베딩을 가져옵니다.
         
         Args:
             texts: 임베딩할 텍스트 목록
-            batch_size: API 호출당 처리할 텍스트 수
+            batch_size: API 호출당 최대 텍스트 수 (기본값: 토큰 한도 내에서 최대한 묶음)
             
         Returns:
             임베딩 벡터 목록
         """
-        try:
-            all_embeddings = []
+        all_embeddings = []
+        max_inputs = min(batch_size or self.MAX_BATCH_INPUTS, self.MAX_BATCH_INPUTS)
+        token_counts = [_estimate_tokens(text) for text in texts]
+        
+        # 알려진 모델만 차원을 확신할 수 있으므로 스트리밍 파싱 사용
+        stream_dimension = self._dimension if self.model_name in self.model_dimensions else None
+        
+        # 토큰 한도에 맞춰 묶은 배치 단위로 처리
+        for batch_slice in _pack_batches(token_counts, self.MAX_BATCH_TOKENS, max_inputs):
+            batch = texts[batch_slice]
             
-            # 배치 단위로 처리
-            for i in range(0, len(texts), batch_size):
-                batch = texts[i:i+batch_size]
-                
-                headers = {
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {self.api_key}"
-                }
-                
-                payload = {
-                    "input": batch,
-                    "model": self.model_name
-                }
-                
-                response = requests.post(self.api_url, headers=headers, json=payload)
-                response.raise_for_status()
-                
-                result = response.json()
-                batch_embeddings = [np.array(item["embedding"], dtype=np.float32) for item in result["data"]]
-                all_embeddings.extend(batch_embeddings)
+            payload = {
+                "input": batch,
+                "model": self.model_name
+            }
             
-            return all_embeddings
-        except Exception as e:
-            logger.error(f"Mistral 텍스트 배치 임베딩 중 오류 발생: {str(e)}")
-            raise
-    
-    @property
-    def dimension(self) -> int:
-        """
-        임베딩 벡터의 차원을 반환합니다.
+            batch_embeddings = self._http.post_embedding_rows(self.api_url, payload, len(batch), stream_dimension)
+            all_embeddings.extend(batch_embeddings)
         
-        Returns:
-            임베딩 차원
-        """
-        return self._dimension
+        return all_embeddings
 
 
-class GeminiEmbeddingModel(BaseEmbeddingModel):
+class GeminiEmbeddingModel(APIEmbeddingModel):
     """
     Google Gemini API 기반 임베딩 모델
     """
     
-    def __init__(self, api_key: str, model_name: str = "models/embedding-001"):
+    provider_name = "Gemini"
+    
+    # batchEmbedContents 요청당 최대 텍스트 수
+    MAX_BATCH_SIZE = 100
+    
+    def __init__(self, api_key: str, model_name: str = "models/embedding-001", max_concurrency: int = 16,
+                 normalize: bool = True, output_dtype: OutputDType = "float32", use_cache: bool = True,
+                 cache_dir: Optional[str] = None):
         """
         Gemini 임베딩 모델 초기화
         
         Args:
             api_key: Google API 키
             model_name: 사용할 모델 이름
+            max_concurrency: 배치 엔드포인트를 사용할 수 없을 때 동시에 보낼 최대 요청 수
+            normalize: 임베딩을 L2 정규화하여 반환할지 여부
+            output_dtype: 반환할 임베딩 자료형 ('float32', 'float16', 'int8')
+            use_cache: 임베딩 디스크 캐시 사용 여부
+            cache_dir: 캐시 디렉토리 경로 (기본값: EMBED_CACHE_DIR 환경 변수)
         """
-        self.api_key = api_key
-        self.model_name = model_name
+        self._init_common(api_key, model_name, normalize, output_dtype, use_cache, cache_dir)
+        self.max_concurrency = max_concurrency
         self.api_url = f"https://generativelanguage.googleapis.com/v1/{model_name}:embedText"
+        self.batch_api_url = f"https://generativelanguage.googleapis.com/v1/{model_name}:batchEmbedContents"
+        self._http = _HttpBackend({"x-goog-api-key": api_key}, pool_maxsize=max_concurrency)
         
         # 모델별 차원 매핑
         self.model_dimensions = {
-            "models/embedding-001": 768
+            "models/embedding-001": 768,
+            "models/text-embedding-004": 768
         }
         
+        # batchEmbedContents를 지원하는 모델
+        self.batch_supported = model_name in self.model_dimensions
+        
         if model_name not in self.model_dimensions:
             logger.warning(f"알 수 없는 모델 '{model_name}'. 기본 차원 768을 사용합니다.")
             self._dimension = 768
         else:
             self._dimension = self.model_dimensions[model_name]
         
+        # google-generativeai가 설치되어 있으면 gRPC(protobuf) 전송 사용
+        # 전역 genai.configure는 프로세스의 모든 클라이언트 설정을 바꾸므로 인스턴스별 클라이언트에 API 키 지정
+        try:
+            import google.generativeai as genai
+            from google.ai import generativelanguage as glm
+            self._genai = genai
+            self._genai_client = glm.GenerativeServiceClient(client_options={"api_key": api_key})
+        except ImportError:
+            self._genai = None
+            self._genai_client = None
+            logger.info("google-generativeai 패키지가 없어 REST API를 사용합니다.")
+        
         logger.info(f"Gemini 임베딩 모델 '{model_name}'이(가) 초기화되었습니다.")
     
-    def embed_text(self, text: str) -> np.ndarray:
+    def _compute_one(self, text: str) -> np.ndarray:
         """
-        텍스트를 임베딩 벡터로 변환합니다.
+        API를 호출하여 단일 텍스트의 원본 float32 임베딩을 가져옵니다.
         
         Args:
             text: 임베딩할 텍스트
@@ -399,52 +909,59 @@ class GeminiEmbeddingModel(BaseEmbeddingModel):
         Returns:
             임베딩 벡터
         """
-        try:
-            params = {
-                "key": self.api_key
-            }
-            
-            payload = {
-                "text": text
-            }
-            
-            response = requests.post(self.api_url, params=params, json=payload)
-            response.raise_for_status()
-            
-            result = response.json()
-            embedding = result["embedding"]["values"]
-            
-            return np.array(embedding, dtype=np.float32)
-        except Exception as e:
-            logger.error(f"Gemini 텍스트 임베딩 중 오류 발생: {str(e)}")
-            raise
+        if self._genai is not None:
+            result = self._genai.embed_content(model=self.model_name, content=text, client=self._genai_client)
+            return np.asarray(result["embedding"], dtype=np.float32)
+        
+        payload = {
+            "text": text
+        }
+        
+        result = self._http.post_json(self.api_url, payload)
+        embedding = result["embedding"]["values"]
+        
+        return np.array(embedding, dtype=np.float32)
     
-    def embed_batch(self, texts: List[str]) -> List[np.ndarray]:
+    def _compute_batch(self, texts: List[str], batch_size: Optional[int] = None) -> List[np.ndarray]:
         """
-        텍스트 배치를 임베딩 벡터로 변환합니다.
+        API를 호출하여 텍스트 배치의 원본 float32 임베딩을 가져옵니다.
         
         Args:
             texts: 임베딩할 텍스트 목록
+            batch_size: API 호출당 최대 텍스트 수 (기본값: MAX_BATCH_SIZE)
             
         Returns:
             임베딩 벡터 목록
         """
-        try:
-            # Gemini API는 현재 배치 처리를 지원하지 않으므로 개별 처리
-            return [self.embed_text(text) for text in texts]
-        except Exception as e:
-            logger.error(f"Gemini 텍스트 배치 임베딩 중 오류 발생: {str(e)}")
-            raise
-    
-    @property
-    def dimension(self) -> int:
-        """
-        임베딩 벡터의 차원을 반환합니다.
+        if self._genai is not None:
+            # gRPC 클라이언트가 요청 분할을 처리하므로 한 번에 전달
+            result = self._genai.embed_content(model=self.model_name, content=texts, client=self._genai_client)
+            return list(np.asarray(result["embedding"], dtype=np.float32))
         
-        Returns:
-            임베딩 차원
-        """
-        return self._dimension
+        if not self.batch_supported:
+            # 배치 엔드포인트가 없는 모델은 개별 요청을 동시에 보내고 입력 순서대로 모음
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                return list(executor.map(self._compute_one, texts))
+        
+        all_embeddings = []
+        max_inputs = min(batch_size or self.MAX_BATCH_SIZE, self.MAX_BATCH_SIZE)
+        
+        # 요청당 최대 max_inputs개씩 처리
+        for i in range(0, len(texts), max_inputs):
+            batch = texts[i:i+max_inputs]
+            
+            payload = {
+                "requests": [
+                    {"model": self.model_name, "content": {"parts": [{"text": text}]}}
+                    for text in batch
+                ]
+            }
+            
+            result = self._http.post_json(self.batch_api_url, payload)
+            batch_embeddings = [np.array(item["values"], dtype=np.float32) for item in result["embeddings"]]
+            all_embeddings.extend(batch_embeddings)
+        
+        return all_embeddings
 
 
 class EmbeddingFactory:
@@ -466,7 +983,15 @@ class EmbeddingFactory:
         """
         if model_type == "sentence_transformer":
             model_name = kwargs.get("model_name", "all-MiniLM-L6-v2")
-            return SentenceTransformerModel(model_name=model_name)
+            precision = kwargs.get("precision", "fp16")
+            num_threads = kwargs.get("num_threads")
+            normalize = kwargs.get("normalize", True)
+            output_dtype = kwargs.get("output_dtype", "float32")
+            backend = kwargs.get("backend", "torch")
+            warmup = kwargs.get("warmup", True)
+            return SentenceTransformerModel(model_name=model_name, precision=precision, num_threads=num_threads,
+                                            normalize=normalize, output_dtype=output_dtype, backend=backend,
+                                            warmup=warmup)
         
         elif model_type == "openai":
             api_key = kwargs.get("api_key")
@@ -474,7 +999,12 @@ class EmbeddingFactory:
                 raise ValueError("OpenAI 임베딩 모델에는 API 키가 필요합니다.")
             
             model_name = kwargs.get("model_name", "text-embedding-3-small")
-            return OpenAIEmbeddingModel(api_key=api_key, model_name=model_name)
+            normalize = kwargs.get("normalize", True)
+            output_dtype = kwargs.get("output_dtype", "float32")
+            use_cache = kwargs.get("use_cache", True)
+            cache_dir = kwargs.get("cache_dir")
+            return OpenAIEmbeddingModel(api_key=api_key, model_name=model_name, normalize=normalize,
+                                        output_dtype=output_dtype, use_cache=use_cache, cache_dir=cache_dir)
         
         elif model_type == "mistral":
             api_key = kwargs.get("api_key")
@@ -482,7 +1012,12 @@ class EmbeddingFactory:
                 raise ValueError("Mistral 임베딩 모델에는 API 키가 필요합니다.")
             
             model_name = kwargs.get("model_name", "mistral-embed")
-            return MistralEmbeddingModel(api_key=api_key, model_name=model_name)
+            normalize = kwargs.get("normalize", True)
+            output_dtype = kwargs.get("output_dtype", "float32")
+            use_cache = kwargs.get("use_cache", True)
+            cache_dir = kwargs.get("cache_dir")
+            return MistralEmbeddingModel(api_key=api_key, model_name=model_name, normalize=normalize,
+                                         output_dtype=output_dtype, use_cache=use_cache, cache_dir=cache_dir)
         
         elif model_type == "gemini":
             api_key = kwargs.get("api_key")
@@ -490,7 +1025,14 @@ class EmbeddingFactory:
                 raise ValueError("Gemini 임베딩 모델에는 API 키가 필요합니다.")
             
             model_name = kwargs.get("model_name", "models/embedding-001")
-            return GeminiEmbeddingModel(api_key=api_key, model_name=model_name)
+            max_concurrency = kwargs.get("max_concurrency", 16)
+            normalize = kwargs.get("normalize", True)
+            output_dtype = kwargs.get("output_dtype", "float32")
+            use_cache = kwargs.get("use_cache", True)
+            cache_dir = kwargs.get("cache_dir")
+            return GeminiEmbeddingModel(api_key=api_key, model_name=model_name, max_concurrency=max_concurrency,
+                                        normalize=normalize, output_dtype=output_dtype, use_cache=use_cache,
+                                        cache_dir=cache_dir)
         
         else:
             raise ValueError(f"지원되지 않는 모델 유형: {model_type}")
@@ -5,16 +5,24 @@
 로컬 파일 기반 저장소와 Neo4j 그래프 데이터베이스 기반 저장소를 지원합니다.
 """
 import os
+import atexit
+import base64
 import logging
+import threading
 import numpy as np
 import json
 import pickle
+import orjson
+import msgpack
 from typing import List, Dict, Any, Union, Optional, Tuple
 from datetime import datetime
 import uuid
 from abc import ABC, abstractmethod
 import faiss
 
+from .similarity import topk_cosine
+from .text_embedding import QuantizedEmbedding
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -22,6 +30,104 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 프로세스당 한 번만 FAISS OpenMP 스레드 수를 설정하기 위한 플래그
+_faiss_threads_configured = False
+
+def _configure_faiss_threads(num_threads: Optional[int] = None):
+    """
+    FAISS CPU 검색에 사용할 OpenMP 스레드 수를 설정합니다.
+    
+    FAISS는 여러 쿼리를 스레드에 나누어 처리하므로 batch_search로 쿼리를 묶을 때 모든 코어를 활용합니다.
+    
+    Args:
+        num_threads: OpenMP 스레드 수 (기본값: FAISS_NUM_THREADS 환경 변수 또는 CPU 코어 수)
+    """
+    global _faiss_threads_configured
+    if _faiss_threads_configured:
+        return
+    
+    if num_threads is None:
+        num_threads = int(os.environ.get("FAISS_NUM_THREADS", os.cpu_count() or 1))
+    
+    faiss.omp_set_num_threads(num_threads)
+    
+    _faiss_threads_configured = True
+    logger.info(f"FAISS OpenMP 스레드 수가 {num_threads}(으)로 설정되었습니다.")
+
+# (URI, 사용자 이름)별로 공유하는 Neo4j 드라이버 (연결 풀 재사용)
+_DRIVER_CACHE: Dict[Tuple[str, str], Any] = {}
+_DRIVER_LOCK = threading.Lock()
+
+def _get_shared_driver(uri: str, username: str, password: str):
+    """
+    (URI, 사용자 이름)에 대한 공유 Neo4j 드라이버를 반환합니다. 없으면 생성하고 연결을 확인합니다.
+    
+    Args:
+        uri: Neo4j 데이터베이스 URI
+        username: Neo4j 사용자 이름
+        password: Neo4j 비밀번호
+        
+    Returns:
+        Neo4j 드라이버
+    """
+    from neo4j import GraphDatabase
+    
+    key = (uri, username)
+    with _DRIVER_LOCK:
+        if key not in _DRIVER_CACHE:
+            driver = GraphDatabase.driver(
+                uri,
+                auth=(username, password),
+                max_connection_pool_size=50,
+                connection_acquisition_timeout=30,
+                max_connection_lifetime=3600
+            )
+            
+            # 연결 테스트
+            with driver.session() as session:
+                session.run("RETURN 1")
+            
+            _DRIVER_CACHE[key] = driver
+            logger.info(f"Neo4j 드라이버가 생성되었습니다. URI: {uri}")
+        
+        return _DRIVER_CACHE[key]
+
+@atexit.register
+def _close_shared_drivers():
+    """
+    프로세스 종료 시 공유 Neo4j 드라이버를 모두 닫습니다.
+    """
+    with _DRIVER_LOCK:
+        for driver in _DRIVER_CACHE.values():
+            driver.close()
+        _DRIVER_CACHE.clear()
+
+def uuid_to_int64(vector_id: str) -> int:
+    """
+    UUID 문자열을 FAISS ID로 사용할 음이 아닌 int64 키로 변환합니다.
+    
+    Args:
+        vector_id: UUID 문자열
+        
+    Returns:
+        int64 키 (하위 63비트)
+    """
+    return uuid.UUID(vector_id).int & 0x7FFFFFFFFFFFFFFF
+
+def uuid_to_bytes(vector_id: Union[str, bytes]) -> bytes:
+    """
+    UUID 문자열(하이픈 유무 무관)을 메타데이터 키로 사용할 16바이트 값으로 변환합니다.
+    
+    Args:
+        vector_id: UUID 문자열 또는 16바이트 UUID
+        
+    Returns:
+        16바이트 UUID
+    """
+    if isinstance(vector_id, bytes):
+        return vector_id
+    return uuid.UUID(vector_id).bytes
+
 class BaseVectorStore(ABC):
     """
     벡터 저장소의 기본 추상 클래스
@@ -87,56 +193,230 @@ class FaissVectorStore(BaseVectorStore):
     FAISS 기반 로컬 벡터 저장소
     """
     
-    def __init__(self, dimension: int, index_type: str = "Flat", store_dir: str = "/tmp/vector_store"):
+    def __init__(self, dimension: int, index_type: str = "HNSW", store_dir: str = "/tmp/vector_store",
+                 nlist: Optional[int] = None, m: Optional[int] = None, nbits: int = 8, nprobe: int = 8,
+                 expected_size: int = 100_000, train_size: Optional[int] = None, use_gpu: bool = False,
+                 snapshot_every: int = 10_000, hnsw_m: int = 32, ef_construction: int = 200, ef_search: int = 64,
+                 num_threads: Optional[int] = None, mmap_index: bool = False, refine: bool = False,
+                 k_factor: float = 4.0):
         """
         FAISS 벡터 저장소 초기화
         
         Args:
             dimension: 벡터 차원
-            index_type: FAISS 인덱스 유형 ('Flat', 'IVF', 'HNSW' 등)
+            index_type: FAISS 인덱스 유형 ('Flat', 'IVF', 'IVFPQ', 'HNSW', 'HNSW_SQ8' 등)
             store_dir: 저장소 디렉토리 경로
+            nlist: IVF/IVFPQ 클러스터 수 (기본값: IVF는 100, IVFPQ는 4 * sqrt(expected_size))
+            m: IVFPQ 서브 벡터 수 (기본값: dimension // 8, dimension의 약수여야 함)
+            nbits: IVFPQ 서브 벡터당 코드 비트 수
+            nprobe: IVF 계열 인덱스 검색 시 탐색할 클러스터 수
+            expected_size: 예상 벡터 수 (nlist 기본값 계산에 사용)
+            train_size: IVF/IVFPQ/HNSW_SQ8 학습 전에 모을 벡터 수
+                (기본값: IVF는 max(30 * nlist, 10000), IVFPQ는 max(30 * nlist, 50000), HNSW_SQ8은 10000)
+            use_gpu: GPU가 있으면 인덱스를 GPU로 옮길지 여부 (batch_search로 여러 쿼리를 묶어 검색할 때 유리)
+            snapshot_every: 변경 로그를 스냅샷으로 압축하는 변경 횟수 주기
+            hnsw_m: HNSW 그래프의 노드당 이웃 수
+            ef_construction: HNSW 그래프 구축 시 탐색 후보 수
+            ef_search: HNSW 검색 시 탐색 후보 수 (클수록 재현율 상승, 지연 증가)
+            num_threads: FAISS OpenMP 스레드 수 (기본값: FAISS_NUM_THREADS 환경 변수 또는 CPU 코어 수)
+            mmap_index: 저장된 인덱스를 메모리 매핑으로 로드할지 여부
+                (Flat/HNSW 계열만 적용, IVF 계열은 매핑된 역색인이 읽기 전용이라 전체 로드.
+                현재 FAISS 버전은 IndexIDMap2/IndexRefineFlat으로 감싼 인덱스를 매핑하지 않고
+                전체 로드하므로 기본값은 사용하지 않음)
+            refine: 압축 인덱스(IVFPQ, HNSW_SQ8) 검색 후보를 원본 벡터로 정확히 재정렬할지 여부
+                (벡터당 dimension * 4 바이트의 원본 벡터를 추가로 보관)
+            k_factor: 재정렬 시 top_k 대비 가져올 후보 배수
         """
         self.dimension = dimension
         self.index_type = index_type
         self.store_dir = store_dir
+        self.nprobe = nprobe
+        self.use_gpu = use_gpu
+        self.gpu_res = None
+        self.snapshot_every = snapshot_every
+        
+        # 학습이 필요한 인덱스에 추가되기 전까지 대기 중인 벡터와 키
+        self._pending_vectors: List[np.ndarray] = []
+        self._pending_keys: List[np.ndarray] = []
         
         # 저장소 디렉토리 생성
         os.makedirs(store_dir, exist_ok=True)
         
+        _configure_faiss_threads(num_threads)
+        
         # 메타데이터 및 ID 매핑 저장 경로
         self.metadata_path = os.path.join(store_dir, "metadata.json")
-        self.id_map_path = os.path.join(store_dir, "id_map.pickle")
+        self.metadata_parquet_path = os.path.join(store_dir, "metadata.parquet")
+        self.id_map_path = os.path.join(store_dir, "id_map.msgpack")
+        self.legacy_id_map_path = os.path.join(store_dir, "id_map.pickle")
+        self.log_path = os.path.join(store_dir, "metadata.log")
+        self.index_path = os.path.join(store_dir, "faiss.index")
+        self.pending_path = os.path.join(store_dir, "pending.npz")
+        
+        # 학습이 필요한 인덱스의 학습 데이터 크기
+        if index_type == "IVF":
+            nlist = nlist or 100
+            self.train_size = train_size or max(30 * nlist, 10_000)
+        elif index_type == "IVFPQ":
+            nlist = nlist or int(4 * np.sqrt(expected_size))
+            m = m or dimension // 8
+            self.train_size = train_size or max(30 * nlist, 50_000)
+        elif index_type == "HNSW_SQ8":
+            self.train_size = train_size or 10_000
         
-        # FAISS 인덱스 생성
-        if index_type == "Flat":
-            self.index = faiss.IndexFlatL2(dimension)
+        # 저장된 인덱스가 있으면 로드, 없으면 FAISS 인덱스 생성 (L2 정규화된 벡터의 내적 = 코사인 유사도)
+        if os.path.exists(self.index_path):
+            self.index = self._load_index(mmap_index and index_type not in ("IVF", "IVFPQ"))
+        elif index_type == "Flat":
+            self.index = faiss.IndexFlatIP(dimension)
         elif index_type == "IVF":
-            quantizer = faiss.IndexFlatL2(dimension)
-            self.index = faiss.IndexIVFFlat(quantizer, dimension, 100)
-            self.index.train(np.random.random((1000, dimension)).astype(np.float32))
+            # 실제 벡터가 train_size만큼 모이면 학습 (무작위 데이터로 학습하지 않음)
+            self.index = faiss.index_factory(dimension, f"IVF{nlist},Flat", faiss.METRIC_INNER_PRODUCT)
+        elif index_type == "IVFPQ":
+            # OPQ 회전 + IVF + PQ 압축 (벡터당 m * nbits / 8 바이트)
+            self.index = faiss.index_factory(dimension, f"OPQ{m},IVF{nlist},PQ{m}x{nbits}", faiss.METRIC_INNER_PRODUCT)
         elif index_type == "HNSW":
-            self.index = faiss.IndexHNSWFlat(dimension, 32)
+            self.index = faiss.IndexHNSWFlat(dimension, hnsw_m, faiss.METRIC_INNER_PRODUCT)
+        elif index_type == "HNSW_SQ8":
+            # 8비트 스칼라 양자화로 벡터 메모리를 1/4로 줄인 HNSW (양자화 범위 학습 필요)
+            self.index = faiss.index_factory(dimension, f"HNSW{hnsw_m},SQ8", faiss.METRIC_INNER_PRODUCT)
         else:
             logger.warning(f"지원되지 않는 인덱스 유형: {index_type}, Flat 인덱스를 사용합니다.")
-            self.index = faiss.IndexFlatL2(dimension)
+            self.index = faiss.IndexFlatIP(dimension)
+        
+        # 압축 인덱스의 근사 검색 결과를 원본 벡터로 재정렬
+        if refine and index_type in ("IVFPQ", "HNSW_SQ8") and not isinstance(self.index, faiss.IndexIDMap2):
+            self.index = faiss.IndexRefineFlat(self.index)
+        
+        # 벡터 ID(int64 키)를 FAISS가 직접 관리하도록 래핑
+        if not isinstance(self.index, faiss.IndexIDMap2):
+            self.index = faiss.IndexIDMap2(self.index)
         
-        # 메타데이터 및 ID 매핑 로드 또는 초기화
+        base_index = faiss.downcast_index(self.index.index)
+        if isinstance(base_index, faiss.IndexRefine):
+            base_index.k_factor = k_factor
+            base_index = faiss.downcast_index(base_index.base_index)
+        
+        # IVF 계열 인덱스의 검색 범위 설정
+        if index_type in ("IVF", "IVFPQ"):
+            faiss.extract_index_ivf(base_index).nprobe = nprobe
+        
+        # HNSW 계열 인덱스의 구축/검색 탐색 폭 설정
+        if index_type in ("HNSW", "HNSW_SQ8"):
+            base_index.hnsw.efConstruction = ef_construction
+            base_index.hnsw.efSearch = ef_search
+        
+        # 학습 전 저장된 대기 중인 벡터 복원
+        if not self.index.is_trained and os.path.exists(self.pending_path):
+            with np.load(self.pending_path) as pending:
+                self._pending_vectors = [pending["vectors"]]
+                self._pending_keys = [pending["keys"]]
+        
+        # pyarrow가 설치되어 있으면 메타데이터 스냅샷을 parquet으로 저장
+        try:
+            import pyarrow
+            import pyarrow.parquet
+            self._pa = pyarrow
+        except ImportError:
+            self._pa = None
+        
+        # 메타데이터 및 ID 매핑 로드 또는 초기화 (스냅샷 로드 후 변경 로그 재생)
         self.metadata = self._load_metadata()
-        self.id_to_index = self._load_id_map()
+        self.int64_to_uuid = self._load_id_map()
+        self._mutations_since_snapshot = self._replay_log()
+        self._log_file = open(self.log_path, "ab")
+        
+        # 학습된 인덱스는 바로 GPU로 이동 (학습이 필요한 인덱스는 학습 직후 이동)
+        if self.index.is_trained:
+            self._move_to_gpu()
+        
+        # 정상 종료 시 스냅샷을 저장하여 다음 시작 시 재생할 로그를 줄임
+        atexit.register(self.close)
         
         logger.info(f"FAISS 벡터 저장소가 초기화되었습니다. 차원: {dimension}, 인덱스 유형: {index_type}")
     
-    def _load_metadata(self) -> Dict[str, Dict[str, Any]]:
+    def _move_to_gpu(self):
+        """
+        use_gpu가 설정되어 있고 GPU가 있으면 인덱스를 GPU로 옮깁니다.
+        """
+        if not self.use_gpu or self.gpu_res is not None:
+            return
+        
+        try:
+            if faiss.get_num_gpus() == 0:
+                logger.warning("사용 가능한 GPU가 없어 CPU 인덱스를 사용합니다.")
+                return
+            
+            self.gpu_res = faiss.StandardGpuResources()
+            self.index = faiss.index_cpu_to_gpu(self.gpu_res, 0, self.index)
+            logger.info("FAISS 인덱스를 GPU로 옮겼습니다.")
+        except (AttributeError, RuntimeError) as e:
+            self.gpu_res = None
+            logger.warning(f"FAISS 인덱스를 GPU로 옮길 수 없어 CPU 인덱스를 사용합니다: {str(e)}")
+    
+    def _load_index(self, mmap: bool) -> faiss.Index:
+        """
+        저장된 FAISS 인덱스를 로드합니다.
+        
+        Args:
+            mmap: 인덱스 파일을 메모리 매핑으로 로드할지 여부
+            
+        Returns:
+            FAISS 인덱스
+        """
+        index = faiss.read_index(self.index_path, faiss.IO_FLAG_MMAP if mmap else 0)
+        logger.info(f"FAISS 인덱스를 로드했습니다: {self.index_path} ({index.ntotal} 개의 벡터)")
+        return index
+    
+    def _save_index(self):
+        """
+        FAISS 인덱스와 학습 대기 중인 벡터를 원자적으로 저장합니다.
+        """
+        try:
+            # 학습 전 인덱스는 저장하지 않고, 대기 중인 벡터만 저장하여 재시작 후 다시 학습
+            if self.index.is_trained:
+                # GPU 인덱스는 CPU로 복사한 뒤 저장
+                index = faiss.index_gpu_to_cpu(self.index) if self.gpu_res is not None else self.index
+                
+                tmp_path = self.index_path + ".tmp"
+                faiss.write_index(index, tmp_path)
+                os.replace(tmp_path, self.index_path)
+            
+            if self._pending_keys:
+                tmp_path = self.pending_path + ".tmp.npz"
+                np.savez(tmp_path, vectors=np.vstack(self._pending_vectors), keys=np.concatenate(self._pending_keys))
+                os.replace(tmp_path, self.pending_path)
+            elif os.path.exists(self.pending_path):
+                os.remove(self.pending_path)
+        except Exception as e:
+            logger.error(f"FAISS 인덱스 저장 중 오류 발생: {str(e)}")
+            raise
+    
+    def _load_metadata(self) -> Dict[bytes, Dict[str, Any]]:
         """
         메타데이터를 로드합니다.
         
         Returns:
-            메타데이터 딕셔너리
+            메타데이터 딕셔너리 (16바이트 UUID -> 메타데이터)
         """
+        if self._pa is not None and os.path.exists(self.metadata_parquet_path):
+            try:
+                table = self._pa.parquet.read_table(self.metadata_parquet_path, memory_map=True)
+                vector_ids = table.column("_vector_id").to_pylist()
+                rows = table.drop(["_vector_id"]).to_pylist()
+                
+                # 열 기반 저장에서 행마다 없던 필드는 null로 채워지므로 제거
+                return {
+                    uuid_to_bytes(vector_id): {key: value for key, value in row.items() if value is not None}
+                    for vector_id, row in zip(vector_ids, rows)
+                }
+            except Exception as e:
+                logger.warning(f"parquet 메타데이터 로드 중 오류 발생: {str(e)}, JSON 메타데이터를 확인합니다.")
+        
         if os.path.exists(self.metadata_path):
             try:
-                with open(self.metadata_path, 'r') as f:
-                    return json.load(f)
+                with open(self.metadata_path, 'rb') as f:
+                    return {uuid_to_bytes(vector_id): meta for vector_id, meta in orjson.loads(f.read()).items()}
             except Exception as e:
                 logger.warning(f"메타데이터 로드 중 오류 발생: {str(e)}, 새 메타데이터를 초기화합니다.")
         
@@ -145,16 +425,51 @@ class FaissVectorStore(BaseVectorStore):
     def _save_metadata(self):
         """
         메타데이터를 저장합니다.
+        
+        pyarrow가 있으면 zstd 압축 parquet으로, 없거나 열 타입을 추론할 수 없으면 JSON으로 저장합니다.
+        항상 한 가지 형식의 스냅샷만 남겨 오래된 스냅샷이 로드되지 않도록 합니다.
         """
+        if self._pa is not None:
+            try:
+                self._save_metadata_parquet()
+                if os.path.exists(self.metadata_path):
+                    os.remove(self.metadata_path)
+                return
+            except Exception as e:
+                logger.warning(f"parquet 메타데이터 저장 중 오류 발생: {str(e)}, JSON으로 저장합니다.")
+        
         try:
-            with open(self.metadata_path, 'w') as f:
-                json.dump(self.metadata, f)
+            tmp_path = self.metadata_path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                metadata = {raw_id.hex(): meta for raw_id, meta in self.metadata.items()}
+                f.write(orjson.dumps(metadata, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS))
+            os.replace(tmp_path, self.metadata_path)
+            
+            if os.path.exists(self.metadata_parquet_path):
+                os.remove(self.metadata_parquet_path)
         except Exception as e:
             logger.error(f"메타데이터 저장 중 오류 발생: {str(e)}")
+            raise
+    
+    def _save_metadata_parquet(self):
+        """
+        메타데이터를 벡터 ID 열과 메타데이터 필드별 열로 구성된 parquet 파일에 저장합니다.
+        """
+        pa = self._pa
+        rows = list(self.metadata.values())
+        
+        # 모든 행의 필드를 합친 스키마를 추론 (행마다 필드가 달라도 됨)
+        struct_type = pa.array(rows).type if rows else pa.struct([])
+        table = pa.Table.from_pylist(rows, schema=pa.schema(list(struct_type)))
+        table = table.append_column("_vector_id", pa.array(list(self.metadata.keys()), type=pa.binary(16)))
+        
+        tmp_path = self.metadata_parquet_path + ".tmp"
+        pa.parquet.write_table(table, tmp_path, compression="zstd")
+        os.replace(tmp_path, self.metadata_parquet_path)
     
-    def _load_id_map(self) -> Dict[str, int]:
+    def _load_id_map(self) -> Dict[int, bytes]:
         """
-        ID 매핑을 로드합니다.
+        ID 매핑(int64 키 -> 16바이트 UUID)을 로드합니다.
         
         Returns:
             ID 매핑 딕셔너리
@@ -162,10 +477,40 @@ class FaissVectorStore(BaseVectorStore):
         if os.path.exists(self.id_map_path):
             try:
                 with open(self.id_map_path, 'rb') as f:
-                    return pickle.load(f)
+                    return msgpack.unpackb(f.read(), raw=False, strict_map_key=False)
             except Exception as e:
                 logger.warning(f"ID 매핑 로드 중 오류 발생: {str(e)}, 새 ID 매핑을 초기화합니다.")
         
+        elif os.path.exists(self.legacy_id_map_path):
+            return self._migrate_legacy_id_map()
+        
+        return {}
+    
+    def _migrate_legacy_id_map(self) -> Dict[int, bytes]:
+        """
+        이전 버전의 pickle ID 매핑을 로드하여 msgpack 형식으로 다시 저장합니다.
+        
+        Returns:
+            ID 매핑 딕셔너리
+        """
+        try:
+            with open(self.legacy_id_map_path, 'rb') as f:
+                id_map = pickle.load(f)
+            
+            # 이전 형식(벡터 ID -> 인덱스 위치)은 키 체계가 달라 사용할 수 없음
+            if id_map and not isinstance(next(iter(id_map)), int):
+                logger.warning("이전 형식의 ID 매핑을 발견했습니다. 새 ID 매핑을 초기화합니다.")
+                return {}
+            
+            self.int64_to_uuid = {key: uuid_to_bytes(raw_id) for key, raw_id in id_map.items()}
+            self._save_id_map()
+            os.remove(self.legacy_id_map_path)
+            
+            logger.info("pickle ID 매핑을 msgpack 형식으로 변환했습니다.")
+            return self.int64_to_uuid
+        except Exception as e:
+            logger.warning(f"ID 매핑 로드 중 오류 발생: {str(e)}, 새 ID 매핑을 초기화합니다.")
+        
         return {}
     
     def _save_id_map(self):
@@ -173,17 +518,123 @@ class FaissVectorStore(BaseVectorStore):
         ID 매핑을 저장합니다.
         """
         try:
-            with open(self.id_map_path, 'wb') as f:
-                pickle.dump(self.id_to_index, f)
+            tmp_path = self.id_map_path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(msgpack.packb(self.int64_to_uuid, use_bin_type=True))
+            os.replace(tmp_path, self.id_map_path)
         except Exception as e:
             logger.error(f"ID 매핑 저장 중 오류 발생: {str(e)}")
+            raise
     
-    def add_vectors(self, vectors: List[np.ndarray], metadata: List[Dict[str, Any]]) -> List[str]:
+    def _replay_log(self) -> int:
+        """
+        마지막 스냅샷 이후의 변경 로그를 FAISS 인덱스, 메타데이터, ID 매핑에 다시 적용합니다.
+        
+        Returns:
+            재생한 변경 수
+        """
+        if not os.path.exists(self.log_path) or os.path.getsize(self.log_path) == 0:
+            return 0
+        
+        # 스냅샷 저장 후 로그를 비우기 전에 종료된 경우 이미 인덱스에 있는 벡터는 다시 추가하지 않음
+        existing_keys = set(faiss.vector_to_array(self.index.id_map).tolist())
+        for keys in self._pending_keys:
+            existing_keys.update(keys.tolist())
+        
+        pending_vectors: List[np.ndarray] = []
+        pending_keys: List[int] = []
+        
+        def flush():
+            if pending_keys:
+                self._index_vectors(np.vstack(pending_vectors), np.array(pending_keys, dtype=np.int64))
+                pending_vectors.clear()
+                pending_keys.clear()
+        
+        count = 0
+        with open(self.log_path, 'rb') as f:
+            for line in f:
+                try:
+                    entry = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # 비정상 종료로 마지막 줄이 잘린 경우 이후 항목은 무시
+                    logger.warning("변경 로그의 손상된 항목을 발견하여 재생을 중단합니다.")
+                    break
+                
+                vector_id = entry["id"]
+                raw_id = uuid_to_bytes(vector_id)
+                key = uuid_to_int64(vector_id)
+                if entry["op"] == "add":
+                    self.metadata[raw_id] = entry["meta"]
+                    self.int64_to_uuid[key] = raw_id
+                    if "vector" in entry and key not in existing_keys:
+                        pending_vectors.append(np.frombuffer(base64.b64decode(entry["vector"]), dtype=np.float32))
+                        pending_keys.append(key)
+                        existing_keys.add(key)
+                else:
+                    self.metadata.pop(raw_id, None)
+                    self.int64_to_uuid.pop(key, None)
+                    if key in existing_keys:
+                        flush()
+                        self._remove_from_index(key)
+                        existing_keys.discard(key)
+                count += 1
+        
+        flush()
+        
+        if count:
+            logger.info(f"변경 로그에서 {count} 개의 항목을 재생했습니다.")
+        return count
+    
+    def _append_log(self, entries: List[Dict[str, Any]]):
+        """
+        변경 내용을 로그에 추가하고, 주기가 되면 스냅샷을 저장합니다.
+        
+        Args:
+            entries: 변경 항목 목록 ({"op": "add"|"delete", "id": ..., "meta": ...})
+        """
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        self._log_file.write(b"".join(orjson.dumps(entry, option=option) for entry in entries))
+        self._log_file.flush()
+        os.fsync(self._log_file.fileno())
+        
+        self._mutations_since_snapshot += len(entries)
+        if self._mutations_since_snapshot >= self.snapshot_every:
+            self._snapshot()
+    
+    def _snapshot(self):
+        """
+        FAISS 인덱스, 메타데이터, ID 매핑 전체를 저장하고 변경 로그를 비웁니다.
+        
+        저장 중 하나라도 실패하면 로그를 비우지 않으므로 다음 시작 시 로그에서 다시 복원됩니다.
+        """
+        try:
+            self._save_index()
+            self._save_metadata()
+            self._save_id_map()
+        except Exception as e:
+            logger.error(f"벡터 저장소 스냅샷 저장 중 오류 발생: {str(e)}, 변경 로그를 유지합니다.")
+            return
+        
+        self._log_file.truncate(0)
+        self._mutations_since_snapshot = 0
+        logger.info("벡터 저장소 스냅샷을 저장했습니다.")
+    
+    def close(self):
+        """
+        스냅샷을 저장하고 변경 로그를 닫습니다.
+        """
+        if self._log_file.closed:
+            return
+        
+        self._snapshot()
+        self._log_file.close()
+    
+    def add_vectors(self, vectors: Union[List[np.ndarray], np.ndarray], metadata: List[Dict[str, Any]]) -> List[str]:
         """
         벡터와 메타데이터를 저장소에 추가합니다.
         
         Args:
-            vectors: 추가할 벡터 목록
+            vectors: 추가할 벡터 목록 또는 (N, dim) 벡터 행렬
             metadata: 각 벡터에 대한 메타데이터 목록
             
         Returns:
@@ -193,31 +644,42 @@ class FaissVectorStore(BaseVectorStore):
             if len(vectors) != len(metadata):
                 raise ValueError("벡터와 메타데이터의 수가 일치하지 않습니다.")
             
-            # 벡터 ID 생성
-            vector_ids = [str(uuid.uuid4()) for _ in range(len(vectors))]
-            
-            # 벡터 배열 생성
-            vectors_array = np.vstack([v.astype(np.float32) for v in vectors])
+            # 벡터 ID 생성 (내부 키는 16바이트 UUID, int64 키는 UUID 정수값에서 바로 계산)
+            uuids = [uuid.uuid4() for _ in range(len(vectors))]
+            raw_ids = [u.bytes for u in uuids]
+            vector_ids = [raw_id.hex() for raw_id in raw_ids]
+            keys = np.fromiter((u.int & 0x7FFFFFFFFFFFFFFF for u in uuids), dtype=np.int64, count=len(uuids))
             
-            # 현재 인덱스 크기 확인
-            start_idx = self.index.ntotal
+            # 벡터 배열 생성 (정규화가 제자리 연산이므로 호출자의 배열은 한 번만 복사)
+            if isinstance(vectors, np.ndarray):
+                vectors_array = np.array(vectors, dtype=np.float32, order="C").reshape(-1, self.dimension)
+            else:
+                vectors_array = np.empty((len(vectors), self.dimension), dtype=np.float32)
+                for i, vector in enumerate(vectors):
+                    np.copyto(vectors_array[i], vector, casting="unsafe")
+            faiss.normalize_L2(vectors_array)
             
-            # FAISS 인덱스에 벡터 추가
-            self.index.add(vectors_array)
+            self._index_vectors(vectors_array, keys)
             
-            # ID 매핑 및 메타데이터 업데이트
+            # ID 매핑 및 메타데이터 업데이트 (같은 배치는 같은 타임스탬프 사용)
+            timestamp = datetime.now().isoformat()
+            log_entries = []
             for i, vector_id in enumerate(vector_ids):
-                idx = start_idx + i
-                self.id_to_index[vector_id] = idx
+                raw_id = raw_ids[i]
+                self.int64_to_uuid[int(keys[i])] = raw_id
                 
                 # 메타데이터에 타임스탬프 추가
-                meta = metadata[i].copy()
-                meta["timestamp"] = datetime.now().isoformat()
-                self.metadata[vector_id] = meta
+                meta = {**metadata[i], "timestamp": timestamp}
+                self.metadata[raw_id] = meta
+                log_entries.append({
+                    "op": "add",
+                    "id": vector_id,
+                    "meta": meta,
+                    "vector": base64.b64encode(vectors_array[i].tobytes()).decode("ascii")
+                })
             
-            # 메타데이터 및 ID 매핑 저장
-            self._save_metadata()
-            self._save_id_map()
+            # 변경 내용만 로그에 기록 (재시작 시 스냅샷 이후의 벡터도 로그에서 복원)
+            self._append_log(log_entries)
             
             logger.info(f"{len(vectors)} 개의 벡터가 저장소에 추가되었습니다.")
             return vector_ids
@@ -226,6 +688,138 @@ class FaissVectorStore(BaseVectorStore):
             logger.error(f"벡터 추가 중 오류 발생: {str(e)}")
             raise
     
+    def _index_vectors(self, vectors_array: np.ndarray, keys: np.ndarray):
+        """
+        정규화된 벡터를 FAISS 인덱스에 추가합니다. 학습 전이면 학습용 버퍼에 보관합니다.
+        
+        Args:
+            vectors_array: 추가할 벡터 행렬
+            keys: 각 벡터의 int64 키
+        """
+        if self.index.is_trained:
+            self.index.add_with_ids(vectors_array, keys)
+        else:
+            self._add_pending(vectors_array, keys)
+    
+    def _remove_from_index(self, key: int):
+        """
+        FAISS 인덱스에서 벡터를 삭제합니다.
+        
+        HNSW는 삭제를 지원하지 않으므로 ID 매핑에서만 제거하여 검색 결과에서 제외합니다.
+        IndexIDMap2는 삭제 후 내부 인덱스가 뒤의 벡터를 앞으로 당긴다고 가정하는데,
+        IVF 계열은 역색인 번호를 유지하므로 키와 벡터의 대응이 어긋나 ID 매핑에서만 제거합니다.
+        
+        Args:
+            key: 삭제할 벡터의 int64 키
+        """
+        if self.index_type in ("IVF", "IVFPQ"):
+            return
+        
+        try:
+            self.index.remove_ids(np.array([key], dtype=np.int64))
+        except RuntimeError as e:
+            logger.warning(f"FAISS 인덱스에서 벡터를 삭제할 수 없어 ID 매핑에서만 제거합니다: {str(e)}")
+    
+    def _add_pending(self, vectors_array: np.ndarray, keys: np.ndarray):
+        """
+        학습 전 벡터를 버퍼에 모으고, 충분히 모이면 실제 데이터로 인덱스를 학습한 뒤 한 번에 추가합니다.
+        
+        Args:
+            vectors_array: 추가할 벡터 행렬
+            keys: 각 벡터의 int64 키
+        """
+        self._pending_vectors.append(vectors_array)
+        self._pending_keys.append(keys)
+        
+        pending_count = sum(len(k) for k in self._pending_keys)
+        if pending_count < self.train_size:
+            logger.info(f"인덱스 학습 대기 중: {pending_count}/{self.train_size} 개의 벡터")
+            return
+        
+        train_vectors = np.vstack(self._pending_vectors)
+        train_keys = np.concatenate(self._pending_keys)
+        
+        self.index.train(train_vectors)
+        self.index.add_with_ids(train_vectors, train_keys)
+        
+        self._pending_vectors = []
+        self._pending_keys = []
+        logger.info(f"{len(train_keys)} 개의 벡터로 {self.index_type} 인덱스를 학습했습니다.")
+        
+        self._move_to_gpu()
+    
+    def _search_pending(self, queries: np.ndarray, top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        인덱스 학습 전 버퍼에 있는 벡터를 정확(brute-force) 검색합니다.
+        
+        Args:
+            queries: (B, dim) 쿼리 행렬
+            top_k: 반환할 결과 수
+            
+        Returns:
+            FAISS search와 같은 형태의 (내적, 키) 배열
+        """
+        n_queries = queries.shape[0]
+        distances = np.full((n_queries, top_k), -np.inf, dtype=np.float32)
+        keys = np.full((n_queries, top_k), -1, dtype=np.int64)
+        
+        if not self._pending_keys:
+            return distances, keys
+        
+        pending_vectors = np.vstack(self._pending_vectors)
+        pending_keys = np.concatenate(self._pending_keys)
+        
+        scores = queries @ pending_vectors.T
+        for row in range(n_queries):
+            order = np.argsort(-scores[row])[:top_k]
+            distances[row, :len(order)] = scores[row, order]
+            keys[row, :len(order)] = pending_keys[order]
+        
+        return distances, keys
+    
+    def _search_keys(self, queries: np.ndarray, top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        쿼리 행렬로 FAISS 검색을 한 번에 수행합니다.
+        
+        Args:
+            queries: (B, dim) 쿼리 행렬
+            top_k: 반환할 결과 수
+            
+        Returns:
+            (코사인 유사도, int64 키) 배열
+        """
+        # 호출자의 배열을 바꾸지 않도록 복사한 뒤 정규화
+        queries = np.array(queries, dtype=np.float32, order="C")
+        faiss.normalize_L2(queries)
+        
+        # 학습 전이면 대기 중인 벡터를 직접 검색
+        if self.index.is_trained:
+            return self.index.search(queries, top_k)
+        return self._search_pending(queries, top_k)
+    
+    def _to_results(self, scores: np.ndarray, keys: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        쿼리 하나에 대한 FAISS 검색 결과를 결과 딕셔너리 목록으로 변환합니다.
+        
+        Args:
+            scores: (top_k,) 코사인 유사도 배열
+            keys: (top_k,) int64 키 배열
+            
+        Returns:
+            검색 결과 목록 (벡터 ID, 유사도 점수, 메타데이터 포함)
+        """
+        # 조회 메서드를 지역 이름으로 꺼내고 numpy 배열은 한 번에 파이썬 값으로 변환
+        get_raw_id = self.int64_to_uuid.get
+        get_metadata = self.metadata.get
+        
+        hits = [(get_raw_id(key), score) for key, score in zip(keys.tolist(), scores.tolist()) if key >= 0]
+        
+        return [
+            {"id": raw_id.hex(), "score": score, "metadata": get_metadata(raw_id) or {}}
+            for raw_id, score in hits
+            if raw_id is not None
+        ]
+    
     def search(self, query_vector: np.ndarray, top_k: int = 5) -> List[Dict[str, Any]]:
         """
         쿼리 벡터와 가장 유사한 벡터를 검색합니다.
@@ -238,34 +832,11 @@ class FaissVectorStore(BaseVectorStore):
             검색 결과 목록 (벡터 ID, 유사도 점수, 메타데이터 포함)
         """
         try:
-            # 쿼리 벡터 형태 조정
-            query_vector = query_vector.astype(np.float32).reshape(1, -1)
+            # 쿼리 벡터 형태 조정 후 FAISS 검색 수행
+            distances, keys = self._search_keys(query_vector.reshape(1, -1), top_k)
             
-            # FAISS 검색 수행
-            distances, indices = self.index.search(query_vector, top_k)
-            
-            # 결과 변환
-            results = []
-            index_to_id = {idx: id for id, idx in self.id_to_index.items()}
-            
-            for i, idx in enumerate(indices[0]):
-                if idx < 0 or idx >= self.index.ntotal:
-                    continue
-                
-                vector_id = index_to_id.get(idx)
-                if not vector_id:
-                    continue
-                
-                distance = distances[0][i]
-                similarity = 1.0 / (1.0 + distance)  # L2 거리를 유사도 점수로 변환
-                
-                result = {
-                    "id": vector_id,
-                    "score": similarity,
-                    "metadata": self.metadata.get(vector_id, {})
-                }
-                
-                results.append(result)
+            # 결과 변환 (FAISS가 int64 키를 직접 반환)
+            results = self._to_results(distances[0], keys[0])
             
             logger.info(f"검색 완료: {len(results)} 개의 결과를 찾았습니다.")
             return results
@@ -274,6 +845,37 @@ class FaissVectorStore(BaseVectorStore):
             logger.error(f"벡터 검색 중 오류 발생: {str(e)}")
             raise
     
+    def batch_search(self, query_vectors: Union[np.ndarray, List[np.ndarray]], top_k: int = 5) -> List[List[Dict[str, Any]]]:
+        """
+        여러 쿼리 벡터를 한 번의 FAISS 호출로 검색합니다.
+        
+        쿼리를 묶어 검색하면 CPU에서는 FAISS가 쿼리를 OpenMP 스레드에 나누어 처리하고,
+        GPU 인덱스에서는 전송 비용이 한 번만 발생합니다.
+        
+        Args:
+            query_vectors: (B, dim) 쿼리 행렬 또는 쿼리 벡터 목록
+            top_k: 쿼리당 반환할 결과 수
+            
+        Returns:
+            쿼리별 검색 결과 목록
+        """
+        try:
+            if isinstance(query_vectors, list):
+                if not query_vectors:
+                    return []
+                query_vectors = np.vstack(query_vectors)
+            
+            distances, keys = self._search_keys(query_vectors.reshape(-1, self.dimension), top_k)
+            
+            results = [self._to_results(distances[row], keys[row]) for row in range(len(keys))]
+            
+            logger.info(f"배치 검색 완료: {len(results)} 개의 쿼리를 처리했습니다.")
+            return results
+        
+        except Exception as e:
+            logger.error(f"배치 벡터 검색 중 오류 발생: {str(e)}")
+            raise
+    
     def delete_vector(self, vector_id: str) -> bool:
         """
         벡터를 저장소에서 삭제합니다.
@@ -285,25 +887,23 @@ class FaissVectorStore(BaseVectorStore):
             삭제 성공 여부
         """
         try:
-            if vector_id not in self.id_to_index:
+            key = uuid_to_int64(vector_id)
+            
+            if key not in self.int64_to_uuid:
                 logger.warning(f"벡터 ID {vector_id}를 찾을 수 없습니다.")
                 return False
             
-            # FAISS는 직접적인 삭제를 지원하지 않으므로, 인덱스를 재구성해야 함
-            # 현재 구현에서는 메타데이터에서만 삭제하고 실제 인덱스는 유지
-            # 실제 프로덕션 환경에서는 주기적으로 인덱스를 재구성하는 로직 필요
+            # FAISS 인덱스에서 실제로 삭제 (Flat만 지원)
+            self._remove_from_index(key)
             
             # 메타데이터에서 삭제
-            if vector_id in self.metadata:
-                del self.metadata[vector_id]
+            self.metadata.pop(uuid_to_bytes(vector_id), None)
             
             # ID 매핑에서 삭제
-            if vector_id in self.id_to_index:
-                del self.id_to_index[vector_id]
+            del self.int64_to_uuid[key]
             
-            # 메타데이터 및 ID 매핑 저장
-            self._save_metadata()
-            self._save_id_map()
+            # 변경 내용만 로그에 기록
+            self._append_log([{"op": "delete", "id": vector_id}])
             
             logger.info(f"벡터 ID {vector_id}가 삭제되었습니다.")
             return True
@@ -323,22 +923,25 @@ class FaissVectorStore(BaseVectorStore):
             벡터 정보 (벡터, 메타데이터 포함) 또는 None
         """
         try:
-            if vector_id not in self.id_to_index:
+            key = uuid_to_int64(vector_id)
+            
+            if key not in self.int64_to_uuid:
                 logger.warning(f"벡터 ID {vector_id}를 찾을 수 없습니다.")
                 return None
             
-            idx = self.id_to_index[vector_id]
-            
-            # FAISS에서는 인덱스로 직접 벡터를 조회할 수 없으므로,
-            # 실제 프로덕션 환경에서는 벡터를 별도로 저장하는 로직 필요
-            # 현재 구현에서는 메타데이터만 반환
-            
-            metadata = self.metadata.get(vector_id, {})
-            
-            return {
+            metadata = self.metadata.get(uuid_to_bytes(vector_id), {})
+            result = {
                 "id": vector_id,
                 "metadata": metadata
             }
+            
+            # IndexIDMap2는 키로 벡터를 복원할 수 있음 (L2 정규화된 값, 압축 인덱스는 근사값)
+            try:
+                result["vector"] = self.index.reconstruct(key)
+            except RuntimeError:
+                pass
+            
+            return result
         
         except Exception as e:
             logger.error(f"벡터 조회 중 오류 발생: {str(e)}")
@@ -350,7 +953,8 @@ class Neo4jVectorStore(BaseVectorStore):
     Neo4j 그래프 데이터베이스 기반 벡터 저장소
     """
     
-    def __init__(self, uri: str, username: str, password: str, dimension: int, index_name: str = "vector_index"):
+    def __init__(self, uri: str, username: str, password: str, dimension: int, index_name: str = "vector_index",
+                 use_vector_index: bool = True):
         """
         Neo4j 벡터 저장소 초기화
         
@@ -360,25 +964,23 @@ class Neo4jVectorStore(BaseVectorStore):
             password: Neo4j 비밀번호
             dimension: 벡터 차원
             index_name: 벡터 인덱스 이름
+            use_vector_index: Neo4j 네이티브 벡터 인덱스 사용 여부.
+                False이면 임베딩을 float32 바이트로 저장하고 검색은 클라이언트에서 수행합니다.
         """
         try:
-            from neo4j import GraphDatabase
-            
             self.uri = uri
             self.username = username
             self.password = password
             self.dimension = dimension
             self.index_name = index_name
+            self.use_vector_index = use_vector_index
             
-            # Neo4j 드라이버 초기화
-            self.driver = GraphDatabase.driver(uri, auth=(username, password))
-            
-            # 연결 테스트
-            with self.driver.session() as session:
-                session.run("RETURN 1")
+            # 공유 Neo4j 드라이버 사용 (처음 사용할 때만 생성 및 연결 테스트)
+            self.driver = _get_shared_driver(uri, username, password)
             
             # 벡터 인덱스 생성 (없는 경우)
-            self._create_vector_index()
+            if use_vector_index:
+                self._create_vector_index()
             
             logger.info(f"Neo4j 벡터 저장소가 초기화되었습니다. URI: {uri}, 차원: {dimension}")
         
@@ -391,36 +993,55 @@ class Neo4jVectorStore(BaseVectorStore):
     
     def _create_vector_index(self):
         """
-        Neo4j에 벡터 인덱스를 생성합니다.
+        Neo4j에 벡터 인덱스를 생성합니다. 이미 있으면 생성하지 않습니다.
         """
         try:
             with self.driver.session() as session:
-                # 노드 제약 조건 생성
-                session.run("""
-                    CREATE CONSTRAINT vector_id_unique IF NOT EXISTS
-                    FOR (v:Vector) REQUIRE v.id IS UNIQUE
-                """)
+                record = session.run("""
+                    SHOW VECTOR INDEXES YIELD name
+                    WHERE name = $index_name
+                    RETURN count(*) AS n
+                """, index_name=self.index_name).single()
                 
-                # 벡터 인덱스 생성 (Neo4j 5.0 이상)
-                session.run(f"""
-                    CALL db.index.vector.createNodeIndex(
-                        $index_name,
-                        'Vector',
-                        'embedding',
-                        $dimension,
-                        'cosine'
-                    )
-                """, index_name=self.index_name, dimension=self.dimension)
+                if record["n"] > 0:
+                    logger.info(f"Neo4j 벡터 인덱스 '{self.index_name}'이(가) 이미 존재합니다.")
+                    return
+                
+                # 제약 조건과 벡터 인덱스를 하나의 트랜잭션으로 생성
+                session.execute_write(self._create_vector_index_tx, self.index_name, self.dimension)
                 
                 logger.info(f"Neo4j 벡터 인덱스 '{self.index_name}'이(가) 생성되었습니다.")
         
         except Exception as e:
-            # 이미 인덱스가 존재하는 경우 무시
-            if "already exists" in str(e):
-                logger.info(f"Neo4j 벡터 인덱스 '{self.index_name}'이(가) 이미 존재합니다.")
-            else:
-                logger.error(f"Neo4j 벡터 인덱스 생성 중 오류 발생: {str(e)}")
-                raise
+            logger.error(f"Neo4j 벡터 인덱스 생성 중 오류 발생: {str(e)}")
+            raise
+    
+    @staticmethod
+    def _create_vector_index_tx(tx, index_name: str, dimension: int):
+        """
+        벡터 ID 제약 조건과 벡터 인덱스를 생성합니다.
+        
+        Args:
+            tx: Neo4j 트랜잭션
+            index_name: 벡터 인덱스 이름
+            dimension: 벡터 차원
+        """
+        # 노드 제약 조건 생성
+        tx.run("""
+            CREATE CONSTRAINT vector_id_unique IF NOT EXISTS
+            FOR (v:Vector) REQUIRE v.id IS UNIQUE
+        """)
+        
+        # 벡터 인덱스 생성 (Neo4j 5.0 이상)
+        tx.run("""
+            CALL db.index.vector.createNodeIndex(
+                $index_name,
+                'Vector',
+                'embedding',
+                $dimension,
+                'cosine'
+            )
+        """, index_name=index_name, dimension=dimension)
     
     def add_vectors(self, vectors: List[np.ndarray], metadata: List[Dict[str, Any]]) -> List[str]:
         """
@@ -440,40 +1061,29 @@ class Neo4jVectorStore(BaseVectorStore):
             # 벡터 ID 생성
             vector_ids = [str(uuid.uuid4()) for _ in range(len(vectors))]
             
+            # 같은 배치는 같은 타임스탬프 사용
+            timestamp = datetime.now().isoformat()
+            
+            rows = []
+            for vector_id, vector, meta in zip(vector_ids, vectors, metadata):
+                # 메타데이터에 타임스탬프 추가
+                meta = {**meta, "timestamp": timestamp}
+                
+                rows.append({
+                    "id": vector_id,
+                    "embedding": self._encode_embedding(vector),
+                    "metadata": json.dumps(meta),
+                    "symbol": meta.get("symbol"),
+                    "market": meta.get("market")
+                })
+            
+            # 배치에 등장하는 주식 심볼/시장 유형은 중복 없이 한 번씩만 MERGE
+            symbols = list(dict.fromkeys(row["symbol"] for row in rows if row["symbol"] is not None))
+            markets = list(dict.fromkeys(row["market"] for row in rows if row["market"] is not None))
+            
+            # 모든 벡터 노드와 관계를 하나의 쓰기 트랜잭션으로 생성
             with self.driver.session() as session:
-                for i, (vector_id, vector, meta) in enumerate(zip(vector_ids, vectors, metadata)):
-                    # 메타데이터에 타임스탬프 추가
-                    meta = meta.copy()
-                    meta["timestamp"] = datetime.now().isoformat()
-                    
-                    # 벡터 노드 생성
-                    session.run("""
-                        CREATE (v:Vector {
-                            id: $id,
-                            embedding: $embedding,
-                            metadata: $metadata
-                        })
-                    """, id=vector_id, embedding=vector.tolist(), metadata=json.dumps(meta))
-                    
-                    # 메타데이터 기반 관계 생성 (예: 주식 심볼)
-                    if "symbol" in meta:
-                        symbol = meta["symbol"]
-                        session.run("""
-                            MERGE (s:Stock {symbol: $symbol})
-                            WITH s
-                            MATCH (v:Vector {id: $id})
-                            CREATE (v)-[:ABOUT]->(s)
-                        """, symbol=symbol, id=vector_id)
-                    
-                    # 메타데이터 기반 관계 생성 (예: 시장 유형)
-                    if "market" in meta:
-                        market = meta["market"]
-                        session.run("""
-                            MERGE (m:Market {name: $market})
-                            WITH m
-                            MATCH (v:Vector {id: $id})
-                            CREATE (v)-[:BELONGS_TO]->(m)
-                        """, market=market, id=vector_id)
+                session.execute_write(self._create_vectors_tx, rows, symbols, markets)
             
             logger.info(f"{len(vectors)} 개의 벡터가 Neo4j 저장소에 추가되었습니다.")
             return vector_ids
@@ -482,6 +1092,77 @@ class Neo4jVectorStore(BaseVectorStore):
             logger.error(f"Neo4j 벡터 추가 중 오류 발생: {str(e)}")
             raise
     
+    def _encode_embedding(self, vector: np.ndarray) -> Union[List[float], bytes]:
+        """
+        임베딩을 Neo4j 속성 값으로 변환합니다.
+        
+        네이티브 벡터 인덱스는 실수 리스트 속성만 색인하므로, 인덱스를 쓰지 않을 때만
+        float32 바이트(차원당 4바이트)로 저장합니다.
+        int8로 양자화된 임베딩은 scale을 적용해 float32 값으로 복원한 뒤 저장합니다.
+        
+        Args:
+            vector: 임베딩 벡터
+            
+        Returns:
+            실수 리스트 또는 float32 바이트
+        """
+        if isinstance(vector, QuantizedEmbedding):
+            vector = vector.dequantize()
+        vector = np.ascontiguousarray(vector, dtype=np.float32)
+        if self.use_vector_index:
+            return vector.tolist()
+        return vector.tobytes()
+    
+    @staticmethod
+    def _decode_embedding(embedding: Union[List[float], bytes]) -> np.ndarray:
+        """
+        Neo4j 속성 값을 float32 임베딩으로 변환합니다.
+        
+        Args:
+            embedding: 실수 리스트 또는 float32 바이트
+            
+        Returns:
+            임베딩 벡터
+        """
+        if isinstance(embedding, (bytes, bytearray)):
+            return np.frombuffer(embedding, dtype=np.float32)
+        return np.asarray(embedding, dtype=np.float32)
+    
+    @staticmethod
+    def _create_vectors_tx(tx, rows: List[Dict[str, Any]], symbols: List[str], markets: List[str]):
+        """
+        벡터 노드와 메타데이터 기반 관계(주식 심볼, 시장 유형)를 UNWIND로 일괄 생성합니다.
+        
+        Args:
+            tx: Neo4j 트랜잭션
+            rows: 벡터 노드 속성 목록
+            symbols: 배치에 등장하는 고유 주식 심볼 목록
+            markets: 배치에 등장하는 고유 시장 유형 목록
+        """
+        # 주식/시장 노드를 먼저 고유 값마다 한 번씩 생성
+        tx.run("""
+            UNWIND $symbols AS symbol
+            MERGE (:Stock {symbol: symbol})
+        """, symbols=symbols)
+        tx.run("""
+            UNWIND $markets AS market
+            MERGE (:Market {name: market})
+        """, markets=markets)
+        
+        # 벡터 노드를 생성하고 이미 존재하는 주식/시장 노드에 연결
+        tx.run("""
+            UNWIND $rows AS row
+            CREATE (v:Vector {id: row.id, embedding: row.embedding, metadata: row.metadata})
+            WITH v, row
+            OPTIONAL MATCH (s:Stock {symbol: row.symbol})
+            FOREACH (_ IN CASE WHEN s IS NULL THEN [] ELSE [1] END |
+                CREATE (v)-[:ABOUT]->(s))
+            WITH v, row
+            OPTIONAL MATCH (m:Market {name: row.market})
+            FOREACH (_ IN CASE WHEN m IS NULL THEN [] ELSE [1] END |
+                CREATE (v)-[:BELONGS_TO]->(m))
+        """, rows=rows)
+    
     def search(self, query_vector: np.ndarray, top_k: int = 5) -> List[Dict[str, Any]]:
         """
         쿼리 벡터와 가장 유사한 벡터를 검색합니다.
@@ -494,6 +1175,9 @@ class Neo4jVectorStore(BaseVectorStore):
             검색 결과 목록 (벡터 ID, 유사도 점수, 메타데이터 포함)
         """
         try:
+            if not self.use_vector_index:
+                return self._search_bytes(query_vector, top_k)
+            
             results = []
             
             with self.driver.session() as session:
@@ -526,6 +1210,45 @@ class Neo4jVectorStore(BaseVectorStore):
             logger.error(f"Neo4j 벡터 검색 중 오류 발생: {str(e)}")
             raise
     
+    def _search_bytes(self, query_vector: np.ndarray, top_k: int) -> List[Dict[str, Any]]:
+        """
+        벡터 인덱스 없이 저장된 float32 바이트 임베딩을 가져와 코사인 유사도로 검색합니다.
+        
+        Args:
+            query_vector: 쿼리 벡터
+            top_k: 반환할 결과 수
+            
+        Returns:
+            검색 결과 목록 (벡터 ID, 유사도 점수, 메타데이터 포함)
+        """
+        with self.driver.session() as session:
+            records = list(session.run("""
+                MATCH (v:Vector)
+                RETURN v.id AS id, v.embedding AS embedding, v.metadata AS metadata
+            """))
+        
+        if not records:
+            return []
+        
+        embeddings = np.vstack([self._decode_embedding(record["embedding"]) for record in records])
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-12
+        query = np.asarray(query_vector, dtype=np.float32).reshape(-1)
+        query = query / (np.linalg.norm(query) + 1e-12)
+        
+        indices, scores = topk_cosine(embeddings, query, top_k)
+        
+        results = []
+        for i, score in zip(indices, scores):
+            record = records[i]
+            results.append({
+                "id": record["id"],
+                "score": float(score),
+                "metadata": json.loads(record["metadata"]) if record["metadata"] else {}
+            })
+        
+        logger.info(f"Neo4j 검색 완료: {len(results)} 개의 결과를 찾았습니다.")
+        return results
+    
     def delete_vector(self, vector_id: str) -> bool:
         """
         벡터를 저장소에서 삭제합니다.
@@ -538,13 +1261,7 @@ class Neo4jVectorStore(BaseVectorStore):
         """
         try:
             with self.driver.session() as session:
-                result = session.run("""
-                    MATCH (v:Vector {id: $id})
-                    DETACH DELETE v
-                    RETURN count(v) AS deleted
-                """, id=vector_id)
-                
-                deleted = result.single()["deleted"]
+                deleted = session.execute_write(self._delete_vector_tx, vector_id)
                 
                 if deleted > 0:
                     logger.info(f"벡터 ID {vector_id}가 Neo4j에서 삭제되었습니다.")
@@ -557,6 +1274,26 @@ class Neo4jVectorStore(BaseVectorStore):
             logger.error(f"Neo4j 벡터 삭제 중 오류 발생: {str(e)}")
             return False
     
+    @staticmethod
+    def _delete_vector_tx(tx, vector_id: str) -> int:
+        """
+        벡터 노드와 연결된 관계를 삭제합니다.
+        
+        Args:
+            tx: Neo4j 트랜잭션
+            vector_id: 삭제할 벡터의 ID
+            
+        Returns:
+            삭제된 노드 수
+        """
+        result = tx.run("""
+            MATCH (v:Vector {id: $id})
+            DETACH DELETE v
+            RETURN count(v) AS deleted
+        """, id=vector_id)
+        
+        return result.single()["deleted"]
+    
     def get_vector(self, vector_id: str) -> Optional[Dict[str, Any]]:
         """
         ID로 벡터를 조회합니다.
@@ -584,7 +1321,7 @@ class Neo4jVectorStore(BaseVectorStore):
                 
                 return {
                     "id": record["id"],
-                    "vector": np.array(record["embedding"]),
+                    "vector": self._decode_embedding(record["embedding"]),
                     "metadata": metadata
                 }
         
@@ -594,11 +1331,11 @@ class Neo4jVectorStore(BaseVectorStore):
     
     def close(self):
         """
-        Neo4j 연결을 닫습니다.
+        Neo4j 드라이버 참조를 해제합니다.
+        
+        드라이버는 같은 URI/사용자의 다른 저장소와 공유되므로 프로세스 종료 시 일괄적으로 닫힙니다.
         """
-        if self.driver:
-            self.driver.close()
-            logger.info("Neo4j 연결이 닫혔습니다.")
+        self.driver = None
 
 
 class VectorStoreFactory:
@@ -620,10 +1357,35 @@ class VectorStoreFactory:
         """
         if store_type == "faiss":
             dimension = kwargs.get("dimension", 768)
-            index_type = kwargs.get("index_type", "Flat")
+            index_type = kwargs.get("index_type", "HNSW")
             store_dir = kwargs.get("store_dir", "/tmp/vector_store")
             
-            return FaissVectorStore(dimension=dimension, index_type=index_type, store_dir=store_dir)
+            # index_type="IVF"/"IVFPQ"일 때 사용되는 매개변수:
+            #   nlist (클러스터 수), nprobe (검색 클러스터 수), train_size (학습 전 모을 벡터 수),
+            #   m (서브 벡터 수, IVFPQ), nbits (서브 벡터당 비트 수, IVFPQ), expected_size (IVFPQ)
+            # index_type="HNSW"/"HNSW_SQ8"일 때 사용되는 매개변수:
+            #   hnsw_m (노드당 이웃 수), ef_construction, ef_search
+            # index_type="IVFPQ"/"HNSW_SQ8"일 때 원본 벡터 재정렬: refine, k_factor
+            return FaissVectorStore(
+                dimension=dimension,
+                index_type=index_type,
+                store_dir=store_dir,
+                nlist=kwargs.get("nlist"),
+                m=kwargs.get("m"),
+                nbits=kwargs.get("nbits", 8),
+                nprobe=kwargs.get("nprobe", 8),
+                expected_size=kwargs.get("expected_size", 100_000),
+                train_size=kwargs.get("train_size"),
+                use_gpu=kwargs.get("use_gpu", False),
+                snapshot_every=kwargs.get("snapshot_every", 10_000),
+                hnsw_m=kwargs.get("hnsw_m", 32),
+                ef_construction=kwargs.get("ef_construction", 200),
+                ef_search=kwargs.get("ef_search", 64),
+                num_threads=kwargs.get("num_threads"),
+                mmap_index=kwargs.get("mmap_index", False),
+                refine=kwargs.get("refine", False),
+                k_factor=kwargs.get("k_factor", 4.0)
+            )
         
         elif store_type == "neo4j":
             uri = kwargs.get("uri")
@@ -631,6 +1393,7 @@ class VectorStoreFactory:
             password = kwargs.get("password")
             dimension = kwargs.get("dimension", 768)
             index_name = kwargs.get("index_name", "vector_index")
+            use_vector_index = kwargs.get("use_vector_index", True)
             
             if not uri or not username or not password:
                 raise ValueError("Neo4j 벡터 저장소에는 URI, 사용자 이름, 비밀번호가 필요합니다.")
@@ -640,7 +1403,8 @@ class VectorStoreFactory:
                 username=username,
                 password=password,
                 dimension=dimension,
-                index_name=index_name
+                index_name=index_name,
+                use_vector_index=use_vector_index
             )
         
         else:
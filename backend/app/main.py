@@ -5,13 +5,18 @@
 API 라우트, 미들웨어, 의존성 주입 등을 설정합니다.
 """
 import os
+import asyncio
+import orjson
 import logging
-from typing import Dict, Any, List, Optional
+import threading
+from functools import wraps
+from typing import Dict, Any, List, Optional, Literal
 from datetime import datetime
 
-from fastapi import FastAPI, Depends, HTTPException, status, BackgroundTasks
+from fastapi import FastAPI, Depends, HTTPException, Request, status, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 
@@ -20,14 +25,14 @@ from app.database.repository import Neo4jRepository
 from app.database.schema import Neo4jSchema
 from app.embedding.text_embedding import EmbeddingFactory
 from app.embedding.vector_store import VectorStoreFactory
-from app.embedding.rag_pipeline import RAGPipeline
-from app.embedding.search_engine import SearchEngine
+from app.embedding.rag_pipeline import StockMarketRAG
+from app.embedding.search_engine import StockMarketSearchEngine, AIModelFactory
 from app.ai_integration.ai_provider import AIProviderFactory
 from app.ai_integration.mock_investment_adapter import MockInvestmentManager, PerformanceTracker
 from app.data_fetchers.KoreanMarketDataFetcher import KoreanMarketDataFetcher
 from app.data_fetchers.USMarketDataFetcher import USMarketDataFetcher
 from app.data_fetchers.data_cache import DataCache
-from app.data_fetchers.data_processor import DataProcessor
+from app.data_fetchers.data_processor import StockDataProcessor
 from app.routers import reports
 
 # 환경 변수 로드
@@ -44,18 +49,42 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="주식 시장 AI 분석 시스템 API",
     description="한국과 미국 주식 시장 데이터를 수집하고 임베딩하여 RAG 기반 분석 및 투자 추천을 제공하는 API",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse
 )
 
-# CORS 미들웨어 설정
+# 처리되지 않은 예외 처리 미들웨어
+# exception_handler(Exception)는 CORS 미들웨어 바깥에서 실행되어 500 응답에 CORS 헤더가 빠지므로,
+# CORS 미들웨어보다 먼저 등록하여 CORS 미들웨어 안쪽에서 500 응답을 만듦
+@app.middleware("http")
+async def catch_unhandled_exceptions(request: Request, call_next):
+    """
+    라우트에서 처리되지 않은 예외를 500 응답으로 변환하는 미들웨어
+    """
+    try:
+        return await call_next(request)
+    except Exception as e:
+        logger.error(f"{request.method} {request.url.path} 처리 중 오류 발생: {str(e)}")
+        return ORJSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content={"detail": f"요청 처리 중 오류 발생: {str(e)}"}
+        )
+
+# CORS 미들웨어 설정 (허용 오리진은 쉼표로 구분된 CORS_ORIGINS 환경 변수로 지정)
+CORS_ORIGINS = [origin.strip() for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost").split(",") if origin.strip()]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # 프로덕션에서는 특정 오리진으로 제한해야 함
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,  # 브라우저가 preflight 응답을 하루 동안 캐시
 )
 
+# 응답 압축 미들웨어 설정 (1KB 이상의 응답만 압축)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # 라우터 등록
 app.include_router(reports.router)
 
@@ -70,45 +99,169 @@ MISTRAL_API_KEY = os.getenv("MISTRAL_API_KEY", "")
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
 LOCAL_AI_ENDPOINT = os.getenv("LOCAL_AI_ENDPOINT", "http://localhost:11434")
 
-# 글로벌 객체
+# 사용 가능한 AI 제공자 목록 (환경 변수는 실행 중 바뀌지 않으므로 한 번만 계산)
+AI_PROVIDERS_AVAILABLE = [
+    provider for provider, key in [
+        ("openai", OPENAI_API_KEY),
+        ("mistral", MISTRAL_API_KEY),
+        ("gemini", GEMINI_API_KEY),
+        ("local", LOCAL_AI_ENDPOINT)
+    ] if key
+]
+
+# 상태 확인 시 데이터베이스 응답을 기다리는 최대 시간 (초)
+HEALTH_DB_TIMEOUT = 1.0
+
+# 글로벌 객체 (연결 설정만 저장하므로 즉시 생성)
 neo4j_repo = Neo4jRepository(NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD)
 neo4j_schema = Neo4jSchema(NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD)
-data_cache = DataCache()
-data_processor = DataProcessor()
-korean_market = KoreanMarketDataFetcher(data_cache)
-us_market = USMarketDataFetcher(data_cache)
-mock_investment = MockInvestmentManager(neo4j_repo)
-performance_tracker = PerformanceTracker(neo4j_repo)
-
-# 임베딩 및 RAG 설정
-embedding_model = EmbeddingFactory.create_embedding_model(
-    provider_type="openai" if OPENAI_API_KEY else "local",
-    api_key=OPENAI_API_KEY,
-    api_url=LOCAL_AI_ENDPOINT if not OPENAI_API_KEY else None
-)
 
-vector_store = VectorStoreFactory.create_vector_store(
-    store_type="neo4j",
-    uri=NEO4J_URI,
-    username=NEO4J_USER,
-    password=NEO4J_PASSWORD,
-    dimension=1536  # OpenAI 임베딩 차원
-)
+# 초기화 비용이 있는 서비스 객체는 처음 사용할 때 생성하여 재사용
+# (서비스 생성 중 다른 서비스를 가져오므로 재진입 가능한 잠금 사용)
+_service_lock = threading.RLock()
+
+def _lazy_service(factory):
+    """
+    서비스 생성 함수를 인자별로 한 번만 생성하여 재사용하는 getter로 감쌉니다.
+
+    동시에 들어온 첫 요청들이 같은 서비스를 여러 번 생성하지 않도록 생성은 잠금 안에서 수행합니다.
+    생성 비용이 크므로 getter는 이벤트 루프가 아닌 작업 스레드에서 호출해야 합니다.
+
+    Args:
+        factory: 서비스 생성 함수
+
+    Returns:
+        서비스 getter
+    """
+    instances: Dict[Any, Any] = {}
+
+    @wraps(factory)
+    def getter(*args):
+        instance = instances.get(args)
+        if instance is not None:
+            return instance
+
+        with _service_lock:
+            if args not in instances:
+                instances[args] = factory(*args)
+            return instances[args]
+
+    return getter
+
+@_lazy_service
+def get_data_cache():
+    return DataCache()
+
+@_lazy_service
+def get_data_processor():
+    return StockDataProcessor()
+
+@_lazy_service
+def get_korean_market():
+    return KoreanMarketDataFetcher(get_data_cache())
+
+@_lazy_service
+def get_us_market():
+    return USMarketDataFetcher(get_data_cache())
+
+@_lazy_service
+def get_mock_investment():
+    return MockInvestmentManager(neo4j_repo)
+
+@_lazy_service
+def get_performance_tracker():
+    return PerformanceTracker(neo4j_repo)
+
+# 임베딩 및 RAG 설정 (OpenAI 키가 없으면 로컬 sentence-transformers 모델 사용)
+DEFAULT_EMBEDDING_PROVIDER = "openai" if OPENAI_API_KEY else "sentence_transformer"
 
-rag_pipeline = RAGPipeline(embedding_model, vector_store)
-search_engine = SearchEngine(rag_pipeline)
+def get_embedding_model(provider_type: Optional[str] = None):
+    """
+    임베딩 모델을 가져옵니다. 제공자 유형별로 한 번만 생성하여 재사용합니다.
+
+    Args:
+        provider_type: 임베딩 모델 유형 ('openai', 'mistral', 'gemini', 'sentence_transformer', 기본값: DEFAULT_EMBEDDING_PROVIDER)
+
+    Returns:
+        임베딩 모델 인스턴스
+    """
+    return _create_embedding_model(provider_type or DEFAULT_EMBEDDING_PROVIDER)
+
+@_lazy_service
+def _create_embedding_model(provider_type: str):
+    """
+    임베딩 모델을 생성합니다. API 키는 캐시 키가 아닌 환경 설정에서 가져옵니다.
+
+    Args:
+        provider_type: 임베딩 모델 유형
+
+    Returns:
+        임베딩 모델 인스턴스
+    """
+    api_keys = {
+        "openai": OPENAI_API_KEY,
+        "mistral": MISTRAL_API_KEY,
+        "gemini": GEMINI_API_KEY
+    }
+    kwargs = {"api_key": api_keys[provider_type]} if provider_type in api_keys else {}
+
+    return EmbeddingFactory.create_embedding_model(model_type=provider_type, **kwargs)
+
+@_lazy_service
+def get_vector_store():
+    return VectorStoreFactory.create_vector_store(
+        store_type="neo4j",
+        uri=NEO4J_URI,
+        username=NEO4J_USER,
+        password=NEO4J_PASSWORD,
+        dimension=get_embedding_model().dimension
+    )
+
+@_lazy_service
+def get_rag_pipeline():
+    return StockMarketRAG(get_embedding_model(), get_vector_store())
+
+@_lazy_service
+def get_search_engine():
+    # 검색 결과 요약용 AI 모델 (OpenAI 키가 없으면 로컬 AI 사용)
+    if OPENAI_API_KEY:
+        ai_model = AIModelFactory.create_ai_model("openai", api_key=OPENAI_API_KEY)
+    else:
+        ai_model = AIModelFactory.create_ai_model("local", api_url=LOCAL_AI_ENDPOINT)
+
+    return StockMarketSearchEngine(get_rag_pipeline(), ai_model)
+
+# 제공자 유형별 AI 제공자 인스턴스 캐시 (HTTP 세션/연결 풀 재사용)
+_ai_provider_cache: Dict[str, Any] = {}
+_ai_provider_lock = threading.Lock()
 
 # 의존성 주입 함수
 def get_neo4j_repo():
-    try:
-        neo4j_repo.connect()
-        yield neo4j_repo
-    finally:
-        neo4j_repo.close()
+    # 드라이버는 startup_event에서 한 번 연결하고 shutdown_event에서 닫음
+    yield neo4j_repo
 
 def get_ai_provider(provider_type: str = "openai"):
     """
-    AI 제공자를 가져옵니다.
+    AI 제공자를 가져옵니다. 제공자 유형별로 한 번만 생성하여 재사용합니다.
+
+    Args:
+        provider_type: AI 제공자 유형 ('openai', 'mistral', 'gemini', 'local')
+
+    Returns:
+        AI 제공자 인스턴스
+    """
+    provider = _ai_provider_cache.get(provider_type)
+    if provider is not None:
+        return provider
+
+    with _ai_provider_lock:
+        if provider_type not in _ai_provider_cache:
+            _ai_provider_cache[provider_type] = _create_ai_provider(provider_type)
+        return _ai_provider_cache[provider_type]
+
+def _create_ai_provider(provider_type: str):
+    """
+    AI 제공자를 생성합니다.
 
     Args:
         provider_type: AI 제공자 유형 ('openai', 'mistral', 'gemini', 'local')
@@ -151,25 +304,28 @@ def get_ai_provider(provider_type: str = "openai"):
         )
 
 # 모델 정의
+AIProviderType = Literal["openai", "mistral", "gemini", "local"]
+
 class MarketDataRequest(BaseModel):
     market: str = Field(..., description="시장 유형 ('korean' 또는 'us')")
     symbol: Optional[str] = Field(None, description="주식 심볼 (선택 사항)")
+    symbols: Optional[List[str]] = Field(None, description="여러 주식 심볼 (선택 사항, 동시에 조회)")
     start_date: Optional[str] = Field(None, description="시작 날짜 (YYYY-MM-DD)")
     end_date: Optional[str] = Field(None, description="종료 날짜 (YYYY-MM-DD)")
 
 class AIAnalysisRequest(BaseModel):
     market_data: Dict[str, Any] = Field(..., description="분석할 시장 데이터")
-    provider_type: str = Field("openai", description="AI 제공자 유형 ('openai', 'mistral', 'gemini', 'local')")
+    provider_type: AIProviderType = Field("openai", description="AI 제공자 유형 ('openai', 'mistral', 'gemini', 'local')")
 
 class StockRecommendationRequest(BaseModel):
     market_data: Dict[str, Any] = Field(..., description="분석할 시장 데이터")
     count: int = Field(5, description="추천할 주식 수")
-    provider_type: str = Field("openai", description="AI 제공자 유형 ('openai', 'mistral', 'gemini', 'local')")
+    provider_type: AIProviderType = Field("openai", description="AI 제공자 유형 ('openai', 'mistral', 'gemini', 'local')")
 
 class InvestmentDecisionRequest(BaseModel):
     market_data: Dict[str, Any] = Field(..., description="분석할 시장 데이터")
     available_funds: float = Field(..., description="사용 가능한 자금")
-    provider_type: str = Field("openai", description="AI 제공자 유형 ('openai', 'mistral', 'gemini', 'local')")
+    provider_type: AIProviderType = Field("openai", description="AI 제공자 유형 ('openai', 'mistral', 'gemini', 'local')")
 
 class SearchRequest(BaseModel):
     query: str = Field(..., description="검색 쿼리")
@@ -193,25 +349,17 @@ async def health_check():
     """
     API 상태 확인 엔드포인트
     """
-    # 데이터베이스 연결 확인
-    db_connected = neo4j_repo.connect()
-    neo4j_repo.close()
-
-    # AI API 키 확인
-    ai_providers = []
-    if OPENAI_API_KEY:
-        ai_providers.append("openai")
-    if MISTRAL_API_KEY:
-        ai_providers.append("mistral")
-    if GEMINI_API_KEY:
-        ai_providers.append("gemini")
-    if LOCAL_AI_ENDPOINT:
-        ai_providers.append("local")
+    # 데이터베이스 연결 확인 (응답이 늦으면 제한 시간 후 연결 실패로 처리)
+    try:
+        db_connected = await asyncio.wait_for(asyncio.to_thread(neo4j_repo.ping), HEALTH_DB_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning("상태 확인 중 데이터베이스 응답 시간 초과")
+        db_connected = False
 
     return {
         "status": "healthy",
         "database_connected": db_connected,
-        "ai_providers_available": ai_providers,
+        "ai_providers_available": AI_PROVIDERS_AVAILABLE,
         "timestamp": datetime.now().isoformat()
     }
 
@@ -220,89 +368,114 @@ async def get_market_data(request: MarketDataRequest):
     """
     시장 데이터를 가져옵니다.
     """
-    try:
-        if request.market.lower() == "korean":
-            if request.symbol:
-                data = korean_market.get_stock_data(request.symbol, request.start_date, request.end_date)
-            else:
-                data = korean_market.get_market_overview()
-        elif request.market.lower() == "us":
-            if request.symbol:
-                data = us_market.get_stock_data(request.symbol, request.start_date, request.end_date)
-            else:
-                data = us_market.get_market_overview()
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"지원되지 않는 시장 유형: {request.market}"
-            )
+    if request.market.lower() == "korean":
+        get_fetcher = get_korean_market
+    elif request.market.lower() == "us":
+        get_fetcher = get_us_market
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"지원되지 않는 시장 유형: {request.market}"
+        )
 
-        # 데이터 처리
-        processed_data = data_processor.process_market_data(data)
+    # 데이터 수집기와 처리기는 생성과 호출 모두 블로킹이므로 이벤트 루프 밖의 스레드에서 실행
+    if request.symbols:
+        # 여러 심볼을 스레드에서 동시에 조회
+        processed = await asyncio.gather(*(
+            asyncio.to_thread(_fetch_market_data, get_fetcher, symbol, request.start_date, request.end_date)
+            for symbol in request.symbols
+        ))
 
-        return processed_data
+        return dict(zip(request.symbols, processed))
 
-    except Exception as e:
-        logger.error(f"시장 데이터 가져오기 중 오류 발생: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"시장 데이터 가져오기 중 오류 발생: {str(e)}"
-        )
+    return await asyncio.to_thread(_fetch_market_data, get_fetcher, request.symbol, request.start_date, request.end_date)
+
+def _fetch_market_data(get_fetcher, symbol: Optional[str], start_date: Optional[str], end_date: Optional[str]) -> Dict[str, Any]:
+    """
+    시장 데이터를 가져와 처리합니다. 작업 스레드에서 실행됩니다.
+
+    Args:
+        get_fetcher: 데이터 수집기 getter
+        symbol: 주식 심볼 (없으면 시장 개요)
+        start_date: 시작 날짜 (YYYY-MM-DD)
+        end_date: 종료 날짜 (YYYY-MM-DD)
+
+    Returns:
+        처리된 시장 데이터
+    """
+    fetcher = get_fetcher()
+    if symbol:
+        data = fetcher.get_stock_data(symbol, start_date, end_date)
+    else:
+        data = fetcher.get_market_overview()
+
+    return get_data_processor().process_market_data(data)
 
 @app.post("/api/ai/analyze")
 async def analyze_market(request: AIAnalysisRequest):
     """
     시장 데이터를 분석합니다.
     """
+    ai_provider = get_ai_provider(request.provider_type)
+    analysis = await asyncio.to_thread(ai_provider.analyze_market, request.market_data)
+    return analysis
+
+def _sse_events(chunks):
+    """
+    텍스트 조각을 서버 전송 이벤트(SSE) 형식으로 변환합니다.
+
+    Args:
+        chunks: 텍스트 조각 이터레이터
+
+    Returns:
+        SSE 이벤트 바이트 이터레이터
+    """
     try:
-        ai_provider = get_ai_provider(request.provider_type)
-        analysis = ai_provider.analyze_market(request.market_data)
-        return analysis
+        for chunk in chunks:
+            yield b"data: " + orjson.dumps({"delta": chunk}) + b"\n\n"
+        yield b"data: [DONE]\n\n"
 
     except Exception as e:
-        logger.error(f"시장 분석 중 오류 발생: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"시장 분석 중 오류 발생: {str(e)}"
-        )
+        # 응답이 이미 시작되었으므로 오류도 이벤트로 전달
+        logger.error(f"시장 분석 스트리밍 중 오류 발생: {str(e)}")
+        yield b"event: error\ndata: " + orjson.dumps({"detail": f"시장 분석 중 오류 발생: {str(e)}"}) + b"\n\n"
+
+@app.post("/api/ai/analyze/stream")
+async def analyze_market_stream(request: AIAnalysisRequest):
+    """
+    시장 데이터를 분석하고 분석 텍스트를 생성되는 대로 스트리밍합니다.
+    """
+    ai_provider = get_ai_provider(request.provider_type)
+
+    # 동기 이터레이터는 StreamingResponse가 스레드 풀에서 순회하므로 이벤트 루프를 막지 않음
+    # Content-Encoding을 지정하여 GZipMiddleware가 이벤트를 버퍼링하지 않도록 함
+    return StreamingResponse(
+        _sse_events(ai_provider.analyze_market_stream(request.market_data)),
+        media_type="text/event-stream",
+        headers={"Content-Encoding": "identity", "Cache-Control": "no-cache"}
+    )
 
 @app.post("/api/ai/recommend")
 async def recommend_stocks(request: StockRecommendationRequest):
     """
     투자할 주식을 추천합니다.
     """
-    try:
-        ai_provider = get_ai_provider(request.provider_type)
-        recommendations = ai_provider.recommend_stocks(request.market_data, request.count)
-        return recommendations
-
-    except Exception as e:
-        logger.error(f"주식 추천 중 오류 발생: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"주식 추천 중 오류 발생: {str(e)}"
-        )
+    ai_provider = get_ai_provider(request.provider_type)
+    recommendations = await asyncio.to_thread(ai_provider.recommend_stocks, request.market_data, request.count)
+    return recommendations
 
 @app.post("/api/ai/invest")
-async def make_investment_decision(request: InvestmentDecisionRequest):
+async def make_investment_decision(request: InvestmentDecisionRequest, background_tasks: BackgroundTasks):
     """
     투자 결정을 내립니다.
     """
-    try:
-        ai_provider = get_ai_provider(request.provider_type)
-        decision = ai_provider.make_investment_decision(request.market_data, request.available_funds)
+    ai_provider = get_ai_provider(request.provider_type)
+    decision = await asyncio.to_thread(ai_provider.make_investment_decision, request.market_data, request.available_funds)
 
-        # 모의 투자 기록
-        mock_investment.record_investment_decision(decision)
+    # 모의 투자 기록 (응답을 보낸 뒤 백그라운드에서 저장)
+    background_tasks.add_task(lambda: get_mock_investment().record_investment_decision(decision))
 
-        return decision
-
-    except Exception as e:
-        logger.error(f"투자 결정 중 오류 발생: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"투자 결정 중 오류 발생: {str(e)}"
-        )
+    return decision
 
 @app.get("/api/investment/performance")
 async def get_investment_performance(
@@ -313,37 +486,22 @@ async def get_investment_performance(
     """
     투자 성과를 가져옵니다.
     """
-    try:
-        performance = performance_tracker.get_performance(period, start_date, end_date)
-        return performance
-
-    except Exception as e:
-        logger.error(f"투자 성과 가져오기 중 오류 발생: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"투자 성과 가져오기 중 오류 발생: {str(e)}"
-        )
+    performance = await asyncio.to_thread(lambda: get_performance_tracker().get_performance(period, start_date, end_date))
+    return performance
 
 @app.post("/api/search")
 async def search_data(request: SearchRequest):
     """
     데이터를 검색합니다.
     """
-    try:
-        results = search_engine.search(request.query, request.limit)
-        return {
-            "query": request.query,
-            "results": results,
-            "count": len(results),
-            "timestamp": datetime.now().isoformat()
-        }
-
-    except Exception as e:
-        logger.error(f"데이터 검색 중 오류 발생: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"데이터 검색 중 오류 발생: {str(e)}"
-        )
+    search_result = await asyncio.to_thread(lambda: get_search_engine().search(request.query, request.limit))
+    results = search_result["results"]
+    return {
+        "query": request.query,
+        "results": results,
+        "count": len(results),
+        "timestamp": datetime.now().isoformat()
+    }
 
 @app.on_event("startup")
 async def startup_event():
@@ -357,7 +515,7 @@ async def startup_event():
             logger.warning("Neo4j 데이터베이스 연결 실패")
 
         # 스키마 초기화
-        neo4j_schema.initialize_schema()
+        neo4j_schema.create_schema()
 
         logger.info("애플리케이션이 시작되었습니다.")
 
@@ -377,8 +535,3 @@ async def shutdown_event():
 
     except Exception as e:
         logger.error(f"애플리케이션 종료 중 오류 발생: {str(e)}")
-
-# 애플리케이션 실행 (직접 실행 시)
-if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
@@ -1,10 +1,14 @@
 """
 보고서 관련 API 라우터
 """
+import time
 import logging
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from types import MappingProxyType
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
+from datetime import date as date_type, timedelta
+from fastapi import APIRouter, Depends, HTTPException, status, Response
 from pydantic import BaseModel
 
 # 로깅 설정
@@ -17,6 +21,168 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# 보고서 정적 샘플 데이터 (요청마다 새로 만들지 않도록 모듈 로드 시 한 번만 생성)
+_MARKET_SUMMARY = MappingProxyType({
+    "korean": "한국 시장은 최근 반도체와 2차전지 관련주를 중심으로 상승세를 보이고 있습니다.",
+    "us": "미국 시장은 기술주를 중심으로 상승세를 유지하고 있습니다."
+})
+
+_SECTOR_LABELS = ("기술", "금융", "헬스케어", "소비재", "에너지")
+
+_DAILY_STATIC = MappingProxyType({
+    "portfolioValue": 128.72,
+    "previousValue": 127.20,
+    "change": 1.52,
+    "changePercent": 1.2,
+    "marketSummary": _MARKET_SUMMARY,
+    "topPerformers": (
+        MappingProxyType({"symbol": "AAPL", "name": "Apple Inc.", "change": 2.1}),
+        MappingProxyType({"symbol": "NVDA", "name": "NVIDIA Corp.", "change": 3.2}),
+        MappingProxyType({"symbol": "005930", "name": "삼성전자", "change": 1.5})
+    ),
+    "worstPerformers": (
+        MappingProxyType({"symbol": "TSLA", "name": "Tesla Inc.", "change": -1.5}),
+        MappingProxyType({"symbol": "AMZN", "name": "Amazon.com Inc.", "change": -0.8}),
+        MappingProxyType({"symbol": "035720", "name": "카카오", "change": -1.2})
+    ),
+    "transactions": (
+        MappingProxyType({"type": "buy", "symbol": "AAPL", "quantity": 0.1, "price": 182.30}),
+    ),
+    "aiAnalysis": "시장은 전반적으로 긍정적인 흐름을 보이고 있으며, 특히 기술 섹터가 강세를 보이고 있습니다. 단기적으로는 중앙은행의 금리 정책과 인플레이션 지표를 주시할 필요가 있습니다."
+})
+
+_WEEKLY_STATIC = MappingProxyType({
+    "portfolioValue": 128.72,
+    "previousValue": 125.50,
+    "change": 3.22,
+    "changePercent": 2.57,
+    "marketSummary": _MARKET_SUMMARY,
+    "sectorPerformance": MappingProxyType({
+        "labels": _SECTOR_LABELS,
+        "values": (3.2, 1.5, 2.1, -0.8, -1.2)
+    }),
+    "topPerformers": (
+        MappingProxyType({"symbol": "AAPL", "name": "Apple Inc.", "change": 4.5}),
+        MappingProxyType({"symbol": "NVDA", "name": "NVIDIA Corp.", "change": 6.8}),
+        MappingProxyType({"symbol": "005930", "name": "삼성전자", "change": 3.2})
+    ),
+    "worstPerformers": (
+        MappingProxyType({"symbol": "TSLA", "name": "Tesla Inc.", "change": -3.2}),
+        MappingProxyType({"symbol": "AMZN", "name": "Amazon.com Inc.", "change": -1.5}),
+        MappingProxyType({"symbol": "035720", "name": "카카오", "change": -2.5})
+    ),
+    "aiAnalysis": "이번 주 시장은 전반적으로 긍정적인 흐름을 보였으며, 특히 기술 섹터가 강세를 보였습니다. 다음 주에는 주요 기업들의 실적 발표가 예정되어 있어 변동성이 커질 수 있습니다."
+})
+
+_MONTHLY_STATIC = MappingProxyType({
+    "portfolioValue": 128.72,
+    "previousValue": 120.30,
+    "change": 8.42,
+    "changePercent": 7.0,
+    "monthlyComparison": MappingProxyType({
+        "labels": ("1주차", "2주차", "3주차", "4주차"),
+        "values": (122.50, 124.80, 126.30, 128.72)
+    }),
+    "marketSummary": _MARKET_SUMMARY,
+    "sectorPerformance": MappingProxyType({
+        "labels": _SECTOR_LABELS,
+        "values": (8.5, 3.2, 5.1, -1.5, -2.8)
+    }),
+    "topPerformers": (
+        MappingProxyType({"symbol": "AAPL", "name": "Apple Inc.", "change": 10.2}),
+        MappingProxyType({"symbol": "NVDA", "name": "NVIDIA Corp.", "change": 15.5}),
+        MappingProxyType({"symbol": "005930", "name": "삼성전자", "change": 7.8})
+    ),
+    "worstPerformers": (
+        MappingProxyType({"symbol": "TSLA", "name": "Tesla Inc.", "change": -5.5}),
+        MappingProxyType({"symbol": "AMZN", "name": "Amazon.com Inc.", "change": -3.2}),
+        MappingProxyType({"symbol": "035720", "name": "카카오", "change": -4.5})
+    ),
+    "transactionSummary": MappingProxyType({
+        "totalCount": 5,
+        "buyCount": 3,
+        "sellCount": 2,
+        "totalAmount": 150.25
+    }),
+    "aiAnalysis": "이번 달 시장은 전반적으로 긍정적인 흐름을 보였으며, 특히 기술 섹터가 강세를 보였습니다. 다음 달에는 중앙은행의 금리 결정과 주요 경제 지표 발표가 예정되어 있어 이에 대한 주의가 필요합니다."
+})
+
+# 보고서 캐시 설정 (같은 날짜의 보고서는 직렬화된 JSON 바이트로 TTL 동안 재사용)
+_REPORT_CACHE_MAXSIZE = 256
+_REPORT_CACHE_TTL = 300
+_report_cache: OrderedDict[Tuple[str, str], Tuple[float, bytes]] = OrderedDict()
+
+def _get_cached_report(report_type: str, key: str) -> Optional[bytes]:
+    """
+    캐시된 보고서 JSON을 가져옵니다.
+    
+    Args:
+        report_type: 보고서 유형 ('daily', 'weekly', 'monthly')
+        key: 보고서 날짜 키
+    
+    Returns:
+        캐시된 보고서 JSON 바이트 또는 None (없거나 만료된 경우)
+    """
+    cache_key = (report_type, key)
+    entry = _report_cache.get(cache_key)
+    if entry is None:
+        return None
+    
+    expires_at, report_json = entry
+    if expires_at < time.monotonic():
+        del _report_cache[cache_key]
+        return None
+    
+    _report_cache.move_to_end(cache_key)
+    return report_json
+
+def _set_cached_report(report_type: str, key: str, report_data: Dict[str, Any]) -> bytes:
+    """
+    보고서를 JSON 바이트로 직렬화하여 캐시에 저장합니다.
+    
+    Args:
+        report_type: 보고서 유형 ('daily', 'weekly', 'monthly')
+        key: 보고서 날짜 키
+        report_data: 보고서 데이터
+    
+    Returns:
+        직렬화된 보고서 JSON 바이트
+    """
+    # 정적 샘플 데이터의 MappingProxyType은 dict로 변환하여 직렬화
+    report_json = orjson.dumps(report_data, default=dict)
+    cache_key = (report_type, key)
+    _report_cache[cache_key] = (time.monotonic() + _REPORT_CACHE_TTL, report_json)
+    _report_cache.move_to_end(cache_key)
+    
+    # 가장 오래 사용되지 않은 항목부터 제거
+    while len(_report_cache) > _REPORT_CACHE_MAXSIZE:
+        _report_cache.popitem(last=False)
+    
+    return report_json
+
+def _parse_date(value: str, name: str, suffix: str = "") -> date_type:
+    """
+    날짜 쿼리 매개변수를 파싱합니다.
+    
+    Args:
+        value: 날짜 문자열
+        name: 쿼리 매개변수 이름 (오류 메시지에 사용)
+        suffix: 파싱 전에 붙일 문자열 (YYYY-MM 형식은 '-01')
+    
+    Returns:
+        파싱된 날짜
+    
+    Raises:
+        HTTPException: 날짜 형식이 잘못된 경우 (400)
+    """
+    try:
+        return date_type.fromisoformat(value + suffix)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"잘못된 날짜 형식입니다 ({name}): {value}"
+        )
+
 # 일일 보고서 엔드포인트
 @router.get("/daily")
 async def get_daily_report(date: Optional[str] = None):
@@ -29,39 +195,20 @@ async def get_daily_report(date: Optional[str] = None):
     Returns:
         일일 보고서 데이터
     """
+    # 날짜 설정 (형식 오류는 400으로 응답하도록 try 밖에서 검증, 캐시 키는 정규화된 날짜)
+    date = _parse_date(date, "date").isoformat() if date else date_type.today().isoformat()
+    
     try:
-        # 날짜 설정
-        if not date:
-            date = datetime.now().strftime("%Y-%m-%d")
+        # 캐시 확인
+        cached = _get_cached_report("daily", date)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
         
         # 샘플 데이터 생성 (실제 구현에서는 데이터베이스에서 가져와야 함)
-        report_data = {
-            "date": date,
-            "portfolioValue": 128.72,
-            "previousValue": 127.20,
-            "change": 1.52,
-            "changePercent": 1.2,
-            "marketSummary": {
-                "korean": "한국 시장은 최근 반도체와 2차전지 관련주를 중심으로 상승세를 보이고 있습니다.",
-                "us": "미국 시장은 기술주를 중심으로 상승세를 유지하고 있습니다."
-            },
-            "topPerformers": [
-                {"symbol": "AAPL", "name": "Apple Inc.", "change": 2.1},
-                {"symbol": "NVDA", "name": "NVIDIA Corp.", "change": 3.2},
-                {"symbol": "005930", "name": "삼성전자", "change": 1.5}
-            ],
-            "worstPerformers": [
-                {"symbol": "TSLA", "name": "Tesla Inc.", "change": -1.5},
-                {"symbol": "AMZN", "name": "Amazon.com Inc.", "change": -0.8},
-                {"symbol": "035720", "name": "카카오", "change": -1.2}
-            ],
-            "transactions": [
-                {"type": "buy", "symbol": "AAPL", "quantity": 0.1, "price": 182.30}
-            ],
-            "aiAnalysis": "시장은 전반적으로 긍정적인 흐름을 보이고 있으며, 특히 기술 섹터가 강세를 보이고 있습니다. 단기적으로는 중앙은행의 금리 정책과 인플레이션 지표를 주시할 필요가 있습니다."
-        }
+        report_data = {"date": date, **_DAILY_STATIC}
         
-        return report_data
+        report_json = _set_cached_report("daily", date, report_data)
+        return Response(content=report_json, media_type="application/json")
     
     except Exception as e:
         logger.error(f"일일 보고서 가져오기 중 오류 발생: {str(e)}")
@@ -82,50 +229,32 @@ async def get_weekly_report(end_date: Optional[str] = None):
     Returns:
         주간 보고서 데이터
     """
+    # 날짜 설정 (형식 오류는 400으로 응답하도록 try 밖에서 검증, 캐시 키는 정규화된 날짜)
+    end = _parse_date(end_date, "end_date") if end_date else date_type.today()
+    end_date = end.isoformat()
+    
     try:
-        # 날짜 설정
-        if not end_date:
-            end_date = datetime.now().strftime("%Y-%m-%d")
+        # 캐시 확인
+        cached = _get_cached_report("weekly", end_date)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
         
         # 시작 날짜 계산 (종료 날짜로부터 7일 전)
-        end_date_obj = datetime.strptime(end_date, "%Y-%m-%d")
-        start_date_obj = end_date_obj - timedelta(days=7)
-        start_date = start_date_obj.strftime("%Y-%m-%d")
+        start_date = (end - timedelta(days=7)).isoformat()
         
         # 샘플 데이터 생성 (실제 구현에서는 데이터베이스에서 가져와야 함)
         report_data = {
             "startDate": start_date,
             "endDate": end_date,
-            "portfolioValue": 128.72,
-            "previousValue": 125.50,
-            "change": 3.22,
-            "changePercent": 2.57,
-            "marketSummary": {
-                "korean": "한국 시장은 최근 반도체와 2차전지 관련주를 중심으로 상승세를 보이고 있습니다.",
-                "us": "미국 시장은 기술주를 중심으로 상승세를 유지하고 있습니다."
-            },
-            "sectorPerformance": {
-                "labels": ["기술", "금융", "헬스케어", "소비재", "에너지"],
-                "values": [3.2, 1.5, 2.1, -0.8, -1.2]
-            },
-            "topPerformers": [
-                {"symbol": "AAPL", "name": "Apple Inc.", "change": 4.5},
-                {"symbol": "NVDA", "name": "NVIDIA Corp.", "change": 6.8},
-                {"symbol": "005930", "name": "삼성전자", "change": 3.2}
-            ],
-            "worstPerformers": [
-                {"symbol": "TSLA", "name": "Tesla Inc.", "change": -3.2},
-                {"symbol": "AMZN", "name": "Amazon.com Inc.", "change": -1.5},
-                {"symbol": "035720", "name": "카카오", "change": -2.5}
-            ],
+            **_WEEKLY_STATIC,
             "transactions": [
                 {"date": start_date, "type": "buy", "symbol": "AAPL", "quantity": 0.1, "price": 175.30},
                 {"date": end_date, "type": "buy", "symbol": "NVDA", "quantity": 0.05, "price": 850.20}
-            ],
-            "aiAnalysis": "이번 주 시장은 전반적으로 긍정적인 흐름을 보였으며, 특히 기술 섹터가 강세를 보였습니다. 다음 주에는 주요 기업들의 실적 발표가 예정되어 있어 변동성이 커질 수 있습니다."
+            ]
         }
         
-        return report_data
+        report_json = _set_cached_report("weekly", end_date, report_data)
+        return Response(content=report_json, media_type="application/json")
     
     except Exception as e:
         logger.error(f"주간 보고서 가져오기 중 오류 발생: {str(e)}")
@@ -146,50 +275,20 @@ async def get_monthly_report(month: Optional[str] = None):
     Returns:
         월간 보고서 데이터
     """
+    # 날짜 설정 (형식 오류는 400으로 응답하도록 try 밖에서 검증)
+    month = (_parse_date(month, "month", "-01") if month else date_type.today()).isoformat()[:7]
+    
     try:
-        # 날짜 설정
-        if not month:
-            month = datetime.now().strftime("%Y-%m")
+        # 캐시 확인
+        cached = _get_cached_report("monthly", month)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
         
         # 샘플 데이터 생성 (실제 구현에서는 데이터베이스에서 가져와야 함)
-        report_data = {
-            "month": month,
-            "portfolioValue": 128.72,
-            "previousValue": 120.30,
-            "change": 8.42,
-            "changePercent": 7.0,
-            "monthlyComparison": {
-                "labels": ["1주차", "2주차", "3주차", "4주차"],
-                "values": [122.50, 124.80, 126.30, 128.72]
-            },
-            "marketSummary": {
-                "korean": "한국 시장은 최근 반도체와 2차전지 관련주를 중심으로 상승세를 보이고 있습니다.",
-                "us": "미국 시장은 기술주를 중심으로 상승세를 유지하고 있습니다."
-            },
-            "sectorPerformance": {
-                "labels": ["기술", "금융", "헬스케어", "소비재", "에너지"],
-                "values": [8.5, 3.2, 5.1, -1.5, -2.8]
-            },
-            "topPerformers": [
-                {"symbol": "AAPL", "name": "Apple Inc.", "change": 10.2},
-                {"symbol": "NVDA", "name": "NVIDIA Corp.", "change": 15.5},
-                {"symbol": "005930", "name": "삼성전자", "change": 7.8}
-            ],
-            "worstPerformers": [
-                {"symbol": "TSLA", "name": "Tesla Inc.", "change": -5.5},
-                {"symbol": "AMZN", "name": "Amazon.com Inc.", "change": -3.2},
-                {"symbol": "035720", "name": "카카오", "change": -4.5}
-            ],
-            "transactionSummary": {
-                "totalCount": 5,
-                "buyCount": 3,
-                "sellCount": 2,
-                "totalAmount": 150.25
-            },
-            "aiAnalysis": "이번 달 시장은 전반적으로 긍정적인 흐름을 보였으며, 특히 기술 섹터가 강세를 보였습니다. 다음 달에는 중앙은행의 금리 결정과 주요 경제 지표 발표가 예정되어 있어 이에 대한 주의가 필요합니다."
-        }
+        report_data = {"month": month, **_MONTHLY_STATIC}
         
-        return report_data
+        report_json = _set_cached_report("monthly", month, report_data)
+        return Response(content=report_json, media_type="application/json")
     
     except Exception as e:
         logger.error(f"월간 보고서 가져오기 중 오류 발생: {str(e)}")
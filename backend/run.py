@@ -1,7 +1,23 @@
 """
 주식 시장 AI 분석 시스템 백엔드 실행 스크립트
 """
+import os
 import uvicorn
 
+# 실행 환경 ('development' 또는 'production')
+APP_ENV = os.getenv("APP_ENV", "development")
+
 if __name__ == "__main__":
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
+    if APP_ENV == "production":
+        # 프로덕션: 코드 변경 감시 없이 uvloop/httptools 기반 다중 워커로 실행
+        uvicorn.run(
+            "app.main:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+            loop="uvloop",
+            http="httptools",
+            proxy_headers=True
+        )
+    else:
+        uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
@@ -1,7 +1,16 @@
 """
 주식 시장 AI 분석 시스템 백엔드 실행 스크립트 (프로덕션 모드)
 """
+import os
 import uvicorn
 
 if __name__ == "__main__":
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=False)
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        loop="uvloop",
+        http="httptools",
+        proxy_headers=True
+    )
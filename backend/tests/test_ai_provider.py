@@ -0,0 +1,76 @@
+"""
+채팅 API 제공자 분석 메시지 및 스트리밍 응답 파싱 테스트
+"""
+import json
+
+import pytest
+
+from app.ai_integration import ai_provider
+from app.ai_integration.ai_provider import MistralProvider, OpenAIProvider
+
+
+class _FakeStreamResponse:
+    def __init__(self, lines):
+        self.lines = lines
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_lines(self, decode_unicode=False):
+        return iter(self.lines)
+
+
+def _chunk(content):
+    return "data: " + json.dumps({"choices": [{"delta": {"content": content}}]})
+
+
+@pytest.fixture
+def posts(monkeypatch):
+    calls = []
+
+    def fake_post(url, headers=None, json=None, stream=False):
+        calls.append(json)
+        if stream:
+            return _FakeStreamResponse([
+                "",
+                ": keep-alive",
+                "data: " + '{"choices": [{"delta": {"role": "assistant"}}]}',
+                _chunk("시장은 "),
+                _chunk("상승세입니다."),
+                "data: [DONE]",
+                _chunk("무시되는 조각")
+            ])
+        raise AssertionError("스트리밍 호출만 예상됨")
+
+    monkeypatch.setattr(ai_provider.requests, "post", fake_post)
+    return calls
+
+
+@pytest.mark.parametrize("provider_class", [OpenAIProvider, MistralProvider])
+def test_analyze_market_stream_yields_sse_deltas(posts, provider_class):
+    provider = provider_class("test-key")
+
+    chunks = list(provider.analyze_market_stream({"summary_text": "KOSPI 2,700"}))
+
+    assert chunks == ["시장은 ", "상승세입니다."]
+    assert posts[0]["stream"] is True
+    assert posts[0]["messages"] == ai_provider._analysis_messages({"summary_text": "KOSPI 2,700"})
+
+
+@pytest.mark.parametrize("provider_class", [OpenAIProvider, MistralProvider])
+def test_analyze_market_uses_same_messages_as_stream(monkeypatch, provider_class):
+    provider = provider_class("test-key")
+    sent = []
+    monkeypatch.setattr(provider, "_call_api", lambda messages: sent.append(messages) or "분석")
+
+    result = provider.analyze_market({"summary_text": "KOSPI 2,700"})
+
+    assert result["analysis"] == "분석"
+    assert sent == [ai_provider._analysis_messages({"summary_text": "KOSPI 2,700"})]
+    assert "KOSPI 2,700" in sent[0][1]["content"]
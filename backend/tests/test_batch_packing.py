@@ -0,0 +1,108 @@
+"""
+임베딩 API 배치 묶기 테스트
+"""
+import numpy as np
+
+from app.embedding.text_embedding import _pack_batches, OpenAIEmbeddingModel, GeminiEmbeddingModel
+
+
+def _sizes(batches):
+    return [batch.stop - batch.start for batch in batches]
+
+
+def test_batches_respect_token_budget():
+    batches = _pack_batches([40, 40, 40, 40, 40], max_tokens=100, max_inputs=2048)
+
+    assert batches == [slice(0, 2), slice(2, 4), slice(4, 5)]
+
+
+def test_single_text_over_budget_gets_its_own_batch():
+    batches = _pack_batches([10, 500, 10, 10], max_tokens=100, max_inputs=2048)
+
+    assert batches == [slice(0, 1), slice(1, 2), slice(2, 4)]
+
+
+def test_over_budget_text_first_is_not_dropped():
+    assert _pack_batches([500], max_tokens=100, max_inputs=2048) == [slice(0, 1)]
+    assert _pack_batches([], max_tokens=100, max_inputs=2048) == []
+
+
+def test_batches_are_capped_at_max_inputs():
+    batches = _pack_batches([1] * 5000, max_tokens=300_000, max_inputs=2048)
+
+    assert _sizes(batches) == [2048, 2048, 904]
+
+
+def test_batches_cover_inputs_in_order():
+    counts = list(np.random.default_rng(0).integers(1, 60, size=300))
+
+    batches = _pack_batches(counts, max_tokens=200, max_inputs=16)
+
+    assert batches[0].start == 0 and batches[-1].stop == len(counts)
+    assert all(prev.stop == cur.start for prev, cur in zip(batches, batches[1:]))
+    assert all(sum(counts[batch]) <= 200 for batch in batches if batch.stop - batch.start > 1)
+    assert max(_sizes(batches)) <= 16
+
+
+class _FakeHttp:
+    def __init__(self):
+        self.requests = []
+
+    def post_embedding_rows(self, url, payload, n_rows, dimension):
+        self.requests.append(list(payload["input"]))
+        return [np.array([float(text.split()[0][1:]), 1.0], dtype=np.float32) for text in payload["input"]]
+
+
+def test_openai_compute_batch_restores_input_order():
+    model = OpenAIEmbeddingModel(api_key="test", use_cache=False, normalize=False)
+    model._http = _FakeHttp()
+    model._encoder = False
+    model.MAX_BATCH_TOKENS = 10
+
+    texts = [f"t{i} " + "x" * (i % 7) * 8 for i in range(50)]
+    embeddings = model.embed_batch(texts)
+
+    assert len(model._http.requests) > 1
+    assert [int(embedding[0]) for embedding in embeddings] == list(range(50))
+
+
+def test_openai_compute_batch_caps_inputs_per_request():
+    model = OpenAIEmbeddingModel(api_key="test", use_cache=False, normalize=False)
+    model._http = _FakeHttp()
+    model._encoder = False
+
+    embeddings = model.embed_batch([f"t{i}" for i in range(5000)])
+
+    assert [len(request) for request in model._http.requests] == [2048, 2048, 904]
+    assert [int(embedding[0]) for embedding in embeddings] == list(range(5000))
+
+
+class _FakeGeminiHttp:
+    def __init__(self):
+        self.requests = []
+
+    def post_json(self, url, payload):
+        texts = [request["content"]["parts"][0]["text"] for request in payload["requests"]]
+        self.requests.append(texts)
+        return {"embeddings": [{"values": [float(text[1:]), 1.0]} for text in texts]}
+
+
+def test_gemini_embed_batch_accepts_batch_size():
+    model = GeminiEmbeddingModel(api_key="test", use_cache=False, normalize=False)
+    model._http = _FakeGeminiHttp()
+    model._genai = None
+
+    embeddings = model.embed_batch([f"t{i}" for i in range(25)], batch_size=10)
+
+    assert [len(request) for request in model._http.requests] == [10, 10, 5]
+    assert [int(embedding[0]) for embedding in embeddings] == list(range(25))
+
+
+def test_gemini_batch_size_is_capped_at_max_batch_size():
+    model = GeminiEmbeddingModel(api_key="test", use_cache=False, normalize=False)
+    model._http = _FakeGeminiHttp()
+    model._genai = None
+
+    model.embed_batch([f"t{i}" for i in range(250)], batch_size=500)
+
+    assert [len(request) for request in model._http.requests] == [100, 100, 50]
@@ -0,0 +1,92 @@
+"""
+임베딩 디스크 캐시 테스트
+"""
+import numpy as np
+import pytest
+
+from app.embedding.embedding_cache import DiskEmbeddingCache
+
+
+def _vector(seed):
+    return np.random.default_rng(seed).standard_normal(8).astype(np.float32)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = DiskEmbeddingCache("model-a", cache_dir=str(tmp_path))
+    yield cache
+    cache.close()
+
+
+def test_get_or_compute_round_trip(cache):
+    calls = []
+
+    def compute(text):
+        calls.append(text)
+        return _vector(0)
+
+    first = cache.get_or_compute("삼성전자 실적", compute)
+    second = cache.get_or_compute("삼성전자 실적", compute)
+
+    assert calls == ["삼성전자 실적"]
+    assert second.dtype == np.float32
+    np.testing.assert_array_equal(first, second)
+
+
+def test_get_many_returns_none_for_misses(cache):
+    cache.put_many(["a"], [_vector(1)])
+
+    hit, miss = cache.get_many(["a", "b"])
+
+    np.testing.assert_array_equal(hit, _vector(1))
+    assert miss is None
+
+
+def test_get_or_compute_batch_keeps_input_order_on_partial_hit(cache):
+    cache.put_many(["b", "d"], [_vector(2), _vector(4)])
+    requested = []
+
+    def compute_batch(texts):
+        requested.append(list(texts))
+        return [_vector(ord(text) - ord("a") + 1) for text in texts]
+
+    results = cache.get_or_compute_batch(["a", "b", "c", "d", "e"], compute_batch)
+
+    assert requested == [["a", "c", "e"]]
+    for seed, result in zip([1, 2, 3, 4, 5], results):
+        np.testing.assert_array_equal(result, _vector(seed))
+
+
+def test_get_many_spans_multiple_queries(cache):
+    texts = [f"text-{i}" for i in range(1200)]
+    vectors = [np.full(4, i, dtype=np.float32) for i in range(len(texts))]
+    cache.put_many(texts, vectors)
+
+    results = cache.get_many(texts)
+
+    assert [int(result[0]) for result in results] == list(range(len(texts)))
+
+
+def test_keys_are_separated_by_model_name(tmp_path, cache):
+    cache.put_many(["같은 텍스트"], [_vector(1)])
+    other = DiskEmbeddingCache("model-b", cache_dir=str(tmp_path))
+
+    assert other.get_many(["같은 텍스트"]) == [None]
+
+    other.put_many(["같은 텍스트"], [_vector(2)])
+    np.testing.assert_array_equal(cache.get_many(["같은 텍스트"])[0], _vector(1))
+    np.testing.assert_array_equal(other.get_many(["같은 텍스트"])[0], _vector(2))
+    other.close()
+
+
+def test_reopening_database_keeps_entries(tmp_path):
+    cache = DiskEmbeddingCache("model-a", cache_dir=str(tmp_path))
+    cache.put_many(["a", "b"], [_vector(1), _vector(2)])
+    cache.close()
+
+    reopened = DiskEmbeddingCache("model-a", cache_dir=str(tmp_path))
+    results = reopened.get_or_compute_batch(["a", "b"], lambda texts: pytest.fail("캐시 미스가 없어야 함"))
+    reopened.close()
+
+    np.testing.assert_array_equal(results[0], _vector(1))
+    np.testing.assert_array_equal(results[1], _vector(2))
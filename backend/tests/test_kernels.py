@@ -0,0 +1,93 @@
+"""
+기술적 지표 계산 커널과 pandas rolling/ewm 결과 비교 테스트
+"""
+import sys
+import importlib.util
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.data_fetchers import _kernels
+
+
+def _load_pandas_kernels():
+    # numba를 가려 pandas 대체 경로로 모듈을 별도 로드
+    saved = sys.modules.get("numba")
+    sys.modules["numba"] = None
+    try:
+        spec = importlib.util.spec_from_file_location("kernels_pandas", _kernels.__file__)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        if saved is None:
+            sys.modules.pop("numba", None)
+        else:
+            sys.modules["numba"] = saved
+    return module
+
+
+@pytest.fixture(params=["compiled", "pandas"])
+def kernels(request):
+    if request.param == "compiled":
+        pytest.importorskip("numba")
+        return _kernels
+    return _load_pandas_kernels()
+
+
+@pytest.fixture
+def close():
+    # 시작 구간 NaN, 중간 결측, 가격 변동이 없는 구간을 포함한 종가
+    values = 100 + np.cumsum(np.random.default_rng(0).normal(size=400))
+    values[[0, 1, 50, 51, 300]] = np.nan
+    values[100:120] = values[99]
+    return values
+
+
+def _assert_matches(actual, expected, atol=1e-9):
+    np.testing.assert_allclose(actual, np.asarray(expected, dtype=float), rtol=1e-9, atol=atol, equal_nan=True)
+
+
+@pytest.mark.parametrize("window", [1, 5, 20, 60])
+def test_sma_matches_pandas_rolling_mean(kernels, close, window):
+    _assert_matches(kernels._sma(close, window), pd.Series(close).rolling(window=window).mean())
+
+
+@pytest.mark.parametrize("window", [5, 20])
+def test_rolling_std_matches_pandas_rolling_std(kernels, close, window):
+    # pandas는 창을 이동하며 분산을 갱신하므로 가격 변동이 없는 구간에서 1e-7 수준의 오차가 남음
+    _assert_matches(kernels._rolling_std(close, window), pd.Series(close).rolling(window=window).std(), atol=1e-6)
+
+
+@pytest.mark.parametrize("span", [9, 12, 26])
+def test_ema_matches_pandas_ewm(kernels, close, span):
+    alpha = 2 / (span + 1)
+    _assert_matches(kernels._ema(close, alpha), pd.Series(close).ewm(alpha=alpha, adjust=False).mean())
+
+
+def test_rsi_matches_pandas(kernels, close):
+    delta = pd.Series(close).diff()
+    avg_gain = delta.where(delta > 0, 0).rolling(window=14).mean()
+    avg_loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        actual = kernels._rsi(close, 14)
+
+    _assert_matches(actual, 100 - (100 / (1 + avg_gain / avg_loss)))
+
+
+def test_warm_up_is_nan(kernels):
+    values = np.arange(1, 31, dtype=float)
+
+    sma = kernels._sma(values, 20)
+    std = kernels._rolling_std(values, 20)
+
+    assert np.isnan(sma[:19]).all() and not np.isnan(sma[19:]).any()
+    assert np.isnan(std[:19]).all() and not np.isnan(std[19:]).any()
+
+
+def test_empty_input(kernels):
+    empty = np.empty(0)
+
+    assert kernels._sma(empty, 5).shape == (0,)
+    assert kernels._ema(empty, 0.5).shape == (0,)
@@ -0,0 +1,103 @@
+"""
+API 애플리케이션 기동 및 라우트 스모크 테스트
+"""
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from neo4j.time import DateTime
+
+from app import main
+
+
+@pytest.fixture
+def client():
+    # startup 이벤트(Neo4j 연결)를 실행하지 않도록 컨텍스트 매니저 없이 사용
+    return TestClient(main.app)
+
+
+def test_health(client):
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "healthy"
+    assert isinstance(body["database_connected"], bool)
+    assert body["ai_providers_available"] == main.AI_PROVIDERS_AVAILABLE
+
+
+def test_lazy_services_are_created_once():
+    processor = main.get_data_processor()
+
+    assert isinstance(processor, main.StockDataProcessor)
+    assert main.get_data_processor() is processor
+    assert main.get_korean_market().cache is main.get_us_market().cache is main.get_data_cache()
+
+
+def test_search_returns_engine_results(client, monkeypatch):
+    class FakeSearchEngine:
+        def search(self, query, top_k):
+            return {
+                "query": query,
+                "results": [{"id": str(i), "score": 1.0 - i / 10} for i in range(top_k)],
+                "context": "..."
+            }
+
+    monkeypatch.setattr(main, "get_search_engine", lambda: FakeSearchEngine())
+
+    response = client.post("/api/search", json={"query": "반도체", "limit": 3})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["count"] == 3
+    assert [result["id"] for result in body["results"]] == ["0", "1", "2"]
+
+
+def test_unhandled_error_returns_500_with_cors_headers(client, monkeypatch):
+    def broken_tracker():
+        raise RuntimeError("성과 추적기 생성 실패")
+
+    monkeypatch.setattr(main, "get_performance_tracker", broken_tracker)
+    origin = main.CORS_ORIGINS[0]
+
+    response = client.get("/api/investment/performance", headers={"Origin": origin})
+
+    assert response.status_code == 500
+    assert response.headers["access-control-allow-origin"] == origin
+    assert response.json() == {"detail": "요청 처리 중 오류 발생: 성과 추적기 생성 실패"}
+
+
+def test_http_errors_keep_cors_headers(client):
+    origin = main.CORS_ORIGINS[0]
+
+    response = client.post("/api/market/data", json={"market": "jp"}, headers={"Origin": origin})
+
+    assert response.status_code == 400
+    assert response.headers["access-control-allow-origin"] == origin
+
+
+def test_performance_serializes_neo4j_datetime(client, monkeypatch):
+    session = MagicMock()
+    session.run.return_value = [{
+        "id": "decision-1",
+        "timestamp": DateTime(2024, 3, 15, 9, 0, 0),
+        "provider": "openai",
+        "model": "gpt-4",
+        "available_funds": 1000.0,
+        "strategy": "분산 투자",
+        "investments": [
+            {"symbol": "AAPL", "name": "Apple Inc.", "amount": 500.0, "reason": "실적 개선"},
+            {"symbol": "005930", "name": "삼성전자", "amount": None, "reason": "금액 미기록"}
+        ]
+    }]
+    driver = MagicMock()
+    driver.session.return_value.__enter__.return_value = session
+    monkeypatch.setattr(main.neo4j_repo, "driver", driver)
+
+    response = client.get("/api/investment/performance", params={"start_date": "2024-03-01", "end_date": "2024-03-31"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert "error" not in body
+    assert body["decisions"][0]["timestamp"] == "2024-03-15T09:00:00.000000000"
+    assert body["summary"]["total_investments"] == 500.0
@@ -0,0 +1,112 @@
+"""
+검색 쿼리 결과 캐시 테스트
+"""
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.embedding import query_cache
+from app.embedding.query_cache import QueryResultCache
+from app.embedding.text_embedding import _convert_output_dtype
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # 캐시 모듈의 time.monotonic만 테스트 시계로 교체
+    now = [1000.0]
+    monkeypatch.setattr(query_cache, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def _results(*ids):
+    return [{"id": vector_id, "score": 0.9, "metadata": {"text": vector_id}} for vector_id in ids]
+
+
+def _unit(seed, dim=32):
+    vector = np.random.default_rng(seed).standard_normal(dim).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def test_exact_hit_and_top_k_limit():
+    cache = QueryResultCache()
+    cache.put("  삼성전자 실적 ", _unit(0), 3, _results("a", "b", "c"))
+
+    assert [r["id"] for r in cache.get_exact("삼성전자 실적", 2)] == ["a", "b"]
+    assert cache.get_exact("삼성전자 실적", 5) is None
+
+
+def test_similar_hit_for_near_duplicate_query():
+    cache = QueryResultCache(threshold=0.97)
+    base = _unit(0)
+    cache.put("반도체 전망", base, 3, _results("a"))
+
+    near = base + 0.01 * _unit(1)
+
+    assert cache.get_similar(near, 1)[0]["id"] == "a"
+    assert cache.get_similar(_unit(2), 1) is None
+
+
+def test_unnormalized_embeddings_do_not_give_false_hits():
+    cache = QueryResultCache(threshold=0.97)
+    stored = 50.0 * _unit(0)
+    cache.put("반도체 전망", stored, 3, _results("a"))
+
+    # 내적만 보면 임계값을 크게 넘지만 코사인 유사도는 낮은 쿼리는 적중하면 안 됨
+    unrelated = 50.0 * (_unit(0) + _unit(3))
+    assert float(np.dot(stored, unrelated)) > 0.97
+    assert cache.get_similar(unrelated, 1) is None
+    assert cache.get_similar(3.0 * _unit(0), 1)[0]["id"] == "a"
+
+
+def test_quantized_embeddings_are_dequantized():
+    cache = QueryResultCache(threshold=0.97)
+    stored, same, unrelated = _convert_output_dtype([_unit(0), _unit(0), _unit(4)], "int8")
+    cache.put("반도체 전망", stored, 3, _results("a"))
+
+    assert cache.get_similar(same, 1)[0]["id"] == "a"
+    assert cache.get_similar(unrelated, 1) is None
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = QueryResultCache(ttl=60)
+    cache.put("반도체 전망", _unit(0), 3, _results("a"))
+
+    clock[0] += 59
+    assert cache.get_exact("반도체 전망", 1) is not None
+    assert cache.get_similar(_unit(0), 1) is not None
+
+    clock[0] += 2
+    assert cache.get_similar(_unit(0), 1) is None
+    assert cache.get_exact("반도체 전망", 1) is None
+
+
+def test_returned_results_are_copies():
+    cache = QueryResultCache()
+    results = _results("a", "b")
+    cache.put("반도체 전망", _unit(0), 2, results)
+
+    # 저장 후 원본을 수정해도 캐시에 영향 없음
+    results[0]["metadata"]["text"] = "변경"
+
+    hit = cache.get_exact("반도체 전망", 2)
+    assert hit[0]["metadata"]["text"] == "a"
+
+    hit[0]["metadata"]["text"] = "변경"
+    hit.append({"id": "c"})
+    similar = cache.get_similar(_unit(0), 2)
+
+    assert [r["id"] for r in similar] == ["a", "b"]
+    assert similar[0]["metadata"]["text"] == "a"
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = QueryResultCache(maxsize=2)
+    cache.put("a", _unit(0), 1, _results("a"))
+    cache.put("b", _unit(1), 1, _results("b"))
+    cache.get_exact("a", 1)
+    cache.put("c", _unit(2), 1, _results("c"))
+
+    assert cache.get_exact("b", 1) is None
+    assert cache.get_exact("a", 1) is not None
+    assert cache.get_similar(_unit(1), 1) is None
@@ -0,0 +1,82 @@
+"""
+보고서 라우터 캐시 및 날짜 검증 테스트
+"""
+import asyncio
+from types import SimpleNamespace
+
+import orjson
+import pytest
+from fastapi import HTTPException
+
+from app.routers import reports
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch):
+    # 보고서 모듈의 time.monotonic만 테스트 시계로 교체
+    now = [1000.0]
+    monkeypatch.setattr(reports, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    reports._report_cache.clear()
+    yield now
+    reports._report_cache.clear()
+
+
+def _daily(date=None):
+    return asyncio.run(reports.get_daily_report(date))
+
+
+def test_cached_bytes_match_uncached_response():
+    uncached = _daily("2024-03-15").body
+    cached = _daily("2024-03-15").body
+
+    assert cached == uncached
+    report = orjson.loads(cached)
+    assert report["date"] == "2024-03-15"
+    assert report["marketSummary"]["korean"] == reports._MARKET_SUMMARY["korean"]
+    assert report["topPerformers"][0]["symbol"] == "AAPL"
+
+
+def test_weekly_and_monthly_cached_bytes_match_uncached_response():
+    weekly = asyncio.run(reports.get_weekly_report("2024-03-15")).body
+    monthly = asyncio.run(reports.get_monthly_report("2024-03")).body
+
+    assert asyncio.run(reports.get_weekly_report("2024-03-15")).body == weekly
+    assert asyncio.run(reports.get_monthly_report("2024-03")).body == monthly
+    assert orjson.loads(weekly)["startDate"] == "2024-03-08"
+    assert orjson.loads(monthly)["month"] == "2024-03"
+
+
+def test_entry_expires_after_ttl(clock):
+    _daily("2024-03-15")
+    assert reports._get_cached_report("daily", "2024-03-15") is not None
+
+    clock[0] += reports._REPORT_CACHE_TTL + 1
+
+    assert reports._get_cached_report("daily", "2024-03-15") is None
+    assert ("daily", "2024-03-15") not in reports._report_cache
+
+
+def test_least_recently_used_entry_is_evicted(monkeypatch):
+    monkeypatch.setattr(reports, "_REPORT_CACHE_MAXSIZE", 2)
+
+    _daily("2024-03-01")
+    _daily("2024-03-02")
+    _daily("2024-03-01")
+    _daily("2024-03-03")
+
+    assert list(reports._report_cache) == [("daily", "2024-03-01"), ("daily", "2024-03-03")]
+
+
+@pytest.mark.parametrize("handler, param", [
+    (reports.get_daily_report, "not-a-date"),
+    (reports.get_daily_report, "2024-02-30"),
+    (reports.get_weekly_report, "2024/03/15"),
+    (reports.get_monthly_report, "2024-13"),
+    (reports.get_monthly_report, "March"),
+])
+def test_invalid_date_returns_400(handler, param):
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(handler(param))
+
+    assert exc_info.value.status_code == 400
+    assert not reports._report_cache
@@ -0,0 +1,142 @@
+"""
+Neo4j 저장소 투자 결정 저장/조회 쿼리 매개변수 테스트
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.database.repository import Neo4jRepository
+
+
+@pytest.fixture
+def session():
+    return MagicMock()
+
+
+@pytest.fixture
+def repo(session):
+    repo = Neo4jRepository("bolt://localhost:7687", "neo4j", "password")
+    repo.driver = MagicMock()
+    repo.driver.session.return_value.__enter__.return_value = session
+    return repo
+
+
+def _decision(**overrides):
+    decision = {
+        "id": "decision-1",
+        "timestamp": "2024-03-15T09:00:00",
+        "provider": "openai",
+        "model": "gpt-4",
+        "available_funds": 1000.0,
+        "strategy": "분산 투자",
+        "analysis_id": "analysis-1",
+        "investments": [{"symbol": "AAPL", "amount": 500.0, "reason": "실적 개선"}],
+        "unused": "저장하지 않는 필드"
+    }
+    decision.update(overrides)
+    return decision
+
+
+def test_save_investment_decisions_sends_one_unwind_query(repo, session):
+    session.run.return_value.single.return_value = {"count": 2}
+    second = _decision(id="decision-2", investments=[])
+    del second["analysis_id"]
+
+    count = repo.save_investment_decisions([_decision(), second])
+
+    assert count == 2
+    session.run.assert_called_once()
+    query, = session.run.call_args.args
+    assert "UNWIND $rows AS row" in query
+    rows = session.run.call_args.kwargs["rows"]
+    assert rows == [
+        {
+            "id": "decision-1",
+            "timestamp": "2024-03-15T09:00:00",
+            "provider": "openai",
+            "model": "gpt-4",
+            "available_funds": 1000.0,
+            "strategy": "분산 투자",
+            "analysis_id": "analysis-1",
+            "investments": [{"symbol": "AAPL", "amount": 500.0, "reason": "실적 개선"}]
+        },
+        {
+            "id": "decision-2",
+            "timestamp": "2024-03-15T09:00:00",
+            "provider": "openai",
+            "model": "gpt-4",
+            "available_funds": 1000.0,
+            "strategy": "분산 투자",
+            "analysis_id": None,
+            "investments": []
+        }
+    ]
+
+
+def test_save_investment_decisions_generates_missing_ids(repo, session):
+    session.run.return_value.single.return_value = {"count": 2}
+    first = _decision()
+    second = _decision()
+    del first["id"], second["id"]
+
+    repo.save_investment_decisions([first, second])
+
+    ids = [row["id"] for row in session.run.call_args.kwargs["rows"]]
+    assert all(ids) and ids[0] != ids[1]
+
+
+def test_save_investment_decisions_skips_empty_batch(repo, session):
+    assert repo.save_investment_decisions([]) == 0
+    session.run.assert_not_called()
+
+
+def test_save_investment_decision_delegates_to_batch(repo, session):
+    session.run.return_value.single.return_value = {"count": 1}
+
+    assert repo.save_investment_decision(_decision()) is True
+    assert len(session.run.call_args.kwargs["rows"]) == 1
+
+
+def test_get_investment_decisions_passes_limit_and_dates(repo, session):
+    session.run.return_value = []
+
+    repo.get_investment_decisions(limit=5, start_date="2024-03-01", end_date="2024-03-31")
+
+    query, = session.run.call_args.args
+    assert query.rstrip().endswith("LIMIT $limit")
+    assert session.run.call_args.kwargs == {"limit": 5, "start_date": "2024-03-01", "end_date": "2024-03-31"}
+
+
+def test_get_investment_decisions_without_limit_omits_limit_clause(repo, session):
+    session.run.return_value = []
+
+    repo.get_investment_decisions(limit=None, start_date="2024-03-01")
+
+    query, = session.run.call_args.args
+    assert "LIMIT" not in query
+    assert session.run.call_args.kwargs == {"limit": None, "start_date": "2024-03-01", "end_date": None}
+
+
+def test_get_investment_decisions_shapes_records(repo, session):
+    investments = [
+        {"symbol": "AAPL", "name": "Apple Inc.", "amount": 500.0, "reason": "실적 개선"},
+        {"symbol": "005930", "name": "삼성전자", "amount": 300.0, "reason": "반도체 회복"}
+    ]
+    session.run.return_value = [{
+        "id": "decision-1",
+        "timestamp": "2024-03-15T09:00:00",
+        "provider": "openai",
+        "model": "gpt-4",
+        "available_funds": 1000.0,
+        "strategy": "분산 투자",
+        "investments": investments
+    }]
+
+    decisions = repo.get_investment_decisions()
+
+    assert session.run.call_args.kwargs["limit"] == 10
+    assert decisions[0]["stocks"] == [
+        {"symbol": "AAPL", "name": "Apple Inc."},
+        {"symbol": "005930", "name": "삼성전자"}
+    ]
+    assert decisions[0]["investments"] == investments
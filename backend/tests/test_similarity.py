@@ -0,0 +1,84 @@
+"""
+코사인 유사도 상위 k개 검색 테스트
+"""
+import sys
+import importlib.util
+
+import numpy as np
+import pytest
+
+from app.embedding import similarity
+from app.embedding.similarity import topk_cosine
+
+
+def _normalized(n, dim=16, seed=0):
+    X = np.random.default_rng(seed).standard_normal((n, dim)).astype(np.float32)
+    return X / np.linalg.norm(X, axis=1, keepdims=True)
+
+
+def _load_numpy_similarity(monkeypatch):
+    # numba를 가려 numpy 대체 경로로 모듈을 별도 로드
+    monkeypatch.setitem(sys.modules, "numba", None)
+    spec = importlib.util.spec_from_file_location("similarity_numpy", similarity.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_returns_top_k_sorted_by_score():
+    X = _normalized(100)
+    q = X[7]
+
+    indices, scores = topk_cosine(X, q, 5)
+
+    expected = np.argsort(-(X @ q))[:5]
+    assert indices.dtype == np.int64
+    assert indices[0] == 7
+    np.testing.assert_array_equal(indices, expected)
+    assert np.all(np.diff(scores) <= 0)
+
+
+@pytest.mark.parametrize("k", [10, 11, 50])
+def test_k_at_least_n_returns_all_sorted(k):
+    X = _normalized(10)
+    q = X[3]
+
+    indices, scores = topk_cosine(X, q, k)
+
+    assert sorted(indices.tolist()) == list(range(10))
+    np.testing.assert_allclose(scores, np.sort(X @ q)[::-1], rtol=1e-5)
+
+
+@pytest.mark.parametrize("k", [0, -1])
+def test_non_positive_k_returns_empty(k):
+    indices, scores = topk_cosine(_normalized(10), _normalized(1)[0], k)
+
+    assert indices.shape == (0,) and indices.dtype == np.int64
+    assert scores.shape == (0,)
+
+
+def test_empty_list_returns_empty():
+    indices, scores = topk_cosine([], np.ones(4, dtype=np.float32), 3)
+
+    assert len(indices) == 0 and len(scores) == 0
+
+
+def test_accepts_list_of_vectors():
+    X = _normalized(20)
+
+    indices, _ = topk_cosine(list(X), X[12], 1)
+
+    assert indices.tolist() == [12]
+
+
+def test_numba_and_numpy_paths_agree(monkeypatch):
+    pytest.importorskip("numba")
+    numpy_similarity = _load_numpy_similarity(monkeypatch)
+    X = _normalized(2000, dim=64, seed=1)
+    q = _normalized(1, dim=64, seed=2)[0]
+
+    numba_indices, numba_scores = topk_cosine(X, q, 20)
+    numpy_indices, numpy_scores = numpy_similarity.topk_cosine(X, q, 20)
+
+    np.testing.assert_array_equal(numba_indices, numpy_indices)
+    np.testing.assert_allclose(numba_scores, numpy_scores, rtol=1e-5, atol=1e-6)
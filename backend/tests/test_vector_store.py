@@ -0,0 +1,86 @@
+"""
+FAISS 벡터 저장소 재시작 복원 테스트
+"""
+import numpy as np
+import pytest
+
+from app.embedding.vector_store import FaissVectorStore
+
+DIMENSION = 8
+
+
+def _open_store(store_dir, index_type):
+    kwargs = {"train_size": 50, "nlist": 4} if index_type == "IVF" else {}
+    return FaissVectorStore(DIMENSION, index_type=index_type, store_dir=str(store_dir), **kwargs)
+
+
+def _crash(store):
+    # 스냅샷 없이 로그 파일만 닫아 비정상 종료를 흉내냄
+    store._log_file.close()
+
+
+@pytest.fixture
+def vectors():
+    return np.random.default_rng(0).standard_normal((80, DIMENSION)).astype(np.float32)
+
+
+@pytest.mark.parametrize("index_type", ["Flat", "HNSW", "IVF"])
+def test_vectors_survive_restart_without_close(tmp_path, vectors, index_type):
+    store = _open_store(tmp_path, index_type)
+    ids = []
+    for start in range(0, len(vectors), 4):
+        ids += store.add_vectors(vectors[start:start + 4], [{"i": i} for i in range(start, start + 4)])
+    _crash(store)
+
+    restored = _open_store(tmp_path, index_type)
+
+    assert len(restored.metadata) == len(vectors)
+    results = restored.search(vectors[10], top_k=1)
+    assert results[0]["id"] == ids[10]
+    assert results[0]["metadata"]["i"] == 10
+    restored.close()
+
+
+@pytest.mark.parametrize("index_type", ["Flat", "HNSW", "IVF"])
+def test_delete_survives_restart(tmp_path, vectors, index_type):
+    store = _open_store(tmp_path, index_type)
+    ids = store.add_vectors(vectors, [{"i": i} for i in range(len(vectors))])
+    assert store.delete_vector(ids[3])
+    _crash(store)
+
+    restored = _open_store(tmp_path, index_type)
+
+    assert restored.get_vector(ids[3]) is None
+    assert all(result["id"] != ids[3] for result in restored.search(vectors[3], top_k=5))
+    assert restored.search(vectors[10], top_k=1)[0]["id"] == ids[10]
+    restored.close()
+
+
+def test_close_then_reopen_does_not_lose_replayed_vectors(tmp_path, vectors):
+    store = _open_store(tmp_path, "Flat")
+    ids = store.add_vectors(vectors[:20], [{"i": i} for i in range(20)])
+    _crash(store)
+
+    # 로그에서 복원한 뒤 스냅샷을 저장해도 벡터가 남아 있어야 함
+    _open_store(tmp_path, "Flat").close()
+    reopened = _open_store(tmp_path, "Flat")
+
+    assert reopened.index.ntotal == 20
+    assert reopened.search(vectors[5], top_k=1)[0]["id"] == ids[5]
+    reopened.close()
+
+
+def test_snapshot_save_before_log_truncate_does_not_duplicate(tmp_path, vectors):
+    store = _open_store(tmp_path, "Flat")
+    store.add_vectors(vectors[:10], [{"i": i} for i in range(10)])
+
+    # 스냅샷 파일은 저장되었지만 로그를 비우기 전에 종료된 경우
+    store._save_index()
+    store._save_metadata()
+    store._save_id_map()
+    _crash(store)
+
+    restored = _open_store(tmp_path, "Flat")
+
+    assert restored.index.ntotal == 10
+    restored.close()